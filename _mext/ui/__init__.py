@@ -4,8 +4,21 @@ Contains the main widget, page views, dialogs, and reusable components.
 All Qt imports use qtpy for cross-binding compatibility.
 """
 
-from _mext.ui.widget import MaterialMarketWidget
-
 __all__ = [
     "MaterialMarketWidget",
 ]
+
+
+def __getattr__(name: str):  # noqa: N807
+    """Lazy imports so importing a UI submodule does not build the whole widget tree."""
+    _import_map = {
+        "MaterialMarketWidget": "_mext.ui.widget",
+    }
+    if name in _import_map:
+        import importlib
+
+        module = importlib.import_module(_import_map[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,19 +5,33 @@ import os
 import sys
 import subprocess
 import argparse
+import concurrent.futures
 import shutil
+import hashlib
+import time
 import urllib.request
 
 sys.setrecursionlimit(10000)
 
 PROJECT_NAME = "ArknightsPassMaker"
 VERSION = "2.3.0"
+PUBLISHER = "Rafael-ban"
 MAIN_SCRIPT = "main.py"
 ICON_FILE = "resources/icons/favicon.ico"
 BUILD_DIR = PROJECT_NAME
 DIST_DIR = "dist"
 ISS_FILE = "installer.iss"
 INNO_SETUP_DIR = "tools/innosetup"
+RUNTIME_RESOURCE_DIRS = ["class_icons", "data", "icons"]
+FREEZE_CACHE_DIR = "build"
+FREEZE_STAMP = os.path.join(FREEZE_CACHE_DIR, "freeze.stamp")
+
+# 影响冻结结果的输入，任一变化都会触发重新冻结
+SOURCE_DIRS = ["config", "core", "gui", "utils", "_mext", "resources",
+               os.path.join("epass_flasher", "bin"), os.path.join("ffmpeg-sdk", "bin")]
+SOURCE_FILES = [MAIN_SCRIPT, "build.py", "pyproject.toml", "uv.lock", ICON_FILE,
+                "ffmpeg.exe", "ffprobe.exe",
+                os.path.join("simulator", "target", "release", "arknights_pass_simulator.exe")]
 
 
 def parse_args():
@@ -25,6 +39,11 @@ def parse_args():
     parser.add_argument('--no-installer', action='store_true', help='Skip installer packaging')
     parser.add_argument('--clean', action='store_true', help='Clean build directories')
     parser.add_argument('--skip-flasher', action='store_true', help='Skip epass_flasher/bin check (not recommended)')
+    parser.add_argument('--dev', action='store_true', help='Incremental dev build: keep __pycache__ bytecode caches, skip installer')
+    parser.add_argument('--release', action='store_true', help='Release build: clean first and always re-run cx_Freeze')
+    parser.add_argument('--mode', choices=['freeze', 'check', 'analyze'], default='freeze',
+                        help='check: byte-compile and import-check sources with the current Python, no freeze; '
+                             'analyze: report startup imports and suggest excludes')
     return parser.parse_args()
 
 
@@ -32,6 +51,63 @@ def get_site_packages():
     return os.path.join(sys.prefix, "Lib", "site-packages")
 
 
+def get_available_memory_gb():
+    """获取可用物理内存 (GB)，无法获取时返回 None"""
+    try:
+        import psutil
+        return psutil.virtual_memory().available / 1024 ** 3
+    except ImportError:
+        pass
+
+    if sys.platform == "win32":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys / 1024 ** 3
+        return None
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024 ** 3
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def get_build_jobs():
+    """计算并行压缩线程数
+
+    Inno Setup 的 lzma2/ultra64 每个块线程约占用 1GB 内存，
+    因此按 min(CPU 核数, 可用内存GB // 2) 取值，内存不足时回退到单线程。
+    可通过环境变量 NEO_BUILD_JOBS 覆盖。
+    """
+    env_jobs = os.environ.get("NEO_BUILD_JOBS")
+    if env_jobs:
+        try:
+            return max(1, int(env_jobs))
+        except ValueError:
+            print(f"  Warning: invalid NEO_BUILD_JOBS={env_jobs!r}, ignored")
+
+    cpu_count = os.cpu_count() or 1
+    available_gb = get_available_memory_gb()
+    if available_gb is None:
+        return cpu_count
+    return max(1, min(cpu_count, int(available_gb // 2)))
+
+
 def download_inno_setup():
     """下载 Inno Setup 便携版"""
     iscc_path = os.path.join(INNO_SETUP_DIR, "ISCC.exe")
@@ -80,67 +156,110 @@ def find_inno_setup():
 
 
 
+def scan_root_files():
+    """单次 scandir 获取项目根目录下的文件名集合，代替逐个 os.path.exists"""
+    with os.scandir('.') as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
 def check_requirements():
     """检查构建环境"""
     print("Checking build environment...")
 
-    try:
-        import cx_Freeze
-        print(f"  cx_Freeze: {cx_Freeze.__version__}")
-    except ImportError:
-        print("Error: cx_Freeze not installed")
-        return False
+    # 导入 cx_Freeze 较慢，文件系统检查与内存探测放到线程池中与之重叠执行
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        root_files_future = executor.submit(scan_root_files)
+        iscc_future = executor.submit(find_inno_setup)
+        jobs_future = executor.submit(get_build_jobs)
+
+        try:
+            import cx_Freeze
+            print(f"  cx_Freeze: {cx_Freeze.__version__}")
+        except ImportError:
+            print("Error: cx_Freeze not installed")
+            return False
+
+        root_files = root_files_future.result()
+        iscc = iscc_future.result()
+        jobs = jobs_future.result()
 
-    if not os.path.exists(MAIN_SCRIPT):
+    if MAIN_SCRIPT not in root_files:
         print(f"Error: {MAIN_SCRIPT} not found")
         return False
 
-    print(f"  ffmpeg.exe: {'found' if os.path.exists('ffmpeg.exe') else 'not found'}")
-    print(f"  ffprobe.exe: {'found' if os.path.exists('ffprobe.exe') else 'not found'}")
+    print(f"  ffmpeg.exe: {'found' if 'ffmpeg.exe' in root_files else 'not found'}")
+    print(f"  ffprobe.exe: {'found' if 'ffprobe.exe' in root_files else 'not found'}")
 
-    iscc = find_inno_setup()
     if iscc:
         print(f"  Inno Setup: found")
     else:
         print("  Inno Setup: not found (will download)")
 
+    print(f"  Build jobs: {jobs}")
+
     return True
 
 
+def compute_source_fingerprint(skip_flasher=False):
+    """计算冻结输入的指纹（路径 + 大小 + mtime），用于跨次构建复用冻结结果"""
+    paths = list(SOURCE_FILES)
+    for source_dir in SOURCE_DIRS:
+        for root, dirs, files in os.walk(source_dir):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            paths.extend(os.path.join(root, f) for f in sorted(files))
+
+    digest = hashlib.sha256(f"{sys.version}|{skip_flasher}\n".encode())
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def is_freeze_cached(fingerprint):
+    """上次冻结的输入未变化且产物仍在时，可直接复用"""
+    if not os.path.isfile(os.path.join(BUILD_DIR, f"{PROJECT_NAME}.exe")):
+        return False
+    try:
+        with open(FREEZE_STAMP, 'r', encoding='utf-8') as f:
+            return f.read().strip() == fingerprint
+    except OSError:
+        return False
+
+
+def save_freeze_stamp(fingerprint):
+    os.makedirs(FREEZE_CACHE_DIR, exist_ok=True)
+    with open(FREEZE_STAMP, 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+
+
 def clean_build():
     """清理构建目录"""
     print("Cleaning...")
-    for d in [BUILD_DIR, DIST_DIR]:
+    for d in [BUILD_DIR, DIST_DIR, FREEZE_CACHE_DIR]:
         if os.path.exists(d):
             shutil.rmtree(d)
             print(f"  Removed: {d}")
 
     # 清理所有 __pycache__ 目录，确保使用最新源代码
-    print("Cleaning __pycache__ directories...")
-    for root, dirs, files in os.walk('.'):
-        if '__pycache__' in dirs:
-            cache_path = os.path.join(root, '__pycache__')
-            shutil.rmtree(cache_path)
-            print(f"  Removed cache: {cache_path}")
+    clear_pycache()
 
 
-def run_cxfreeze(skip_flasher=False):
-    """执行 cx_Freeze 打包"""
-
-    # 强制清理 __pycache__，确保使用最新源代码编译
-    print("Clearing __pycache__ before build...")
+def clear_pycache():
+    """清理所有 __pycache__ 目录"""
+    print("Cleaning __pycache__ directories...")
     for root, dirs, files in os.walk('.'):
         if '__pycache__' in dirs:
             cache_path = os.path.join(root, '__pycache__')
             shutil.rmtree(cache_path)
-            print(f"  Cleared: {cache_path}")
-
-    os.environ["QT_API"] = "pyqt6"
-
-    from cx_Freeze import setup, Executable
+            dirs.remove('__pycache__')
+            print(f"  Removed cache: {cache_path}")
 
-    site_packages = get_site_packages()
 
+def get_freeze_modules():
+    """返回 cx_Freeze 的 (packages, includes, excludes) 列表，每次调用生成新列表"""
     packages = [
         "PyQt6", "PyQt6.QtCore", "PyQt6.QtGui", "PyQt6.QtWidgets",
         "qfluentwidgets",
@@ -189,19 +308,43 @@ def run_cxfreeze(skip_flasher=False):
         "_mext.ui.components.usb_device_card",
     ]
 
+    # 项目代码不使用 torch/scipy/easyocr 等重型包，整包排除而不是逐个排除子模块，
+    # 避免 cx_Freeze 沿依赖图追踪并复制它们（排除包名会同时排除其全部子模块）
     excludes = [
         "tkinter", "unittest", "test", "tests", "pytest", "IPython",
-        "notebook", "jupyter", "torch.testing", "torch.utils.tensorboard",
-        "torch.utils.benchmark", "torch.distributed", "torchvision",
-        "torchaudio", "scipy.spatial.cKDTree", "sympy",
+        "notebook", "jupyter", "torch", "torchvision", "torchaudio",
+        "scipy", "easyocr", "sympy", "matplotlib", "pandas",
+        "numpy.f2py", "numpy.distutils",
         "PySide6", "PySide6.QtCore", "PySide6.QtGui", "PySide6.QtWidgets",
     ]
 
-    include_files = [("resources", "resources")]
-    if os.path.exists("ffmpeg.exe"):
-        include_files.append(("ffmpeg.exe", "ffmpeg.exe"))
-    if os.path.exists("ffprobe.exe"):
-        include_files.append(("ffprobe.exe", "ffprobe.exe"))
+    return packages, includes, excludes
+
+
+def run_cxfreeze(skip_flasher=False, clear_cache=True):
+    """执行 cx_Freeze 打包"""
+
+    # 强制清理 __pycache__，确保使用最新源代码编译
+    if clear_cache:
+        clear_pycache()
+
+    os.environ["QT_API"] = "pyqt6"
+
+    from cx_Freeze import setup, Executable
+
+    site_packages = get_site_packages()
+
+    packages, includes, excludes = get_freeze_modules()
+
+    # 只打包运行时用到的资源子目录；resources/installer 仅供 ISCC 编译安装包时读取，无需进入程序目录
+    include_files = [
+        (os.path.join("resources", d), os.path.join("resources", d))
+        for d in RUNTIME_RESOURCE_DIRS
+    ]
+    root_files = scan_root_files()
+    for exe in ("ffmpeg.exe", "ffprobe.exe"):
+        if exe in root_files:
+            include_files.append((exe, exe))
 
     # 添加 Rust 模拟器
     simulator_exe = os.path.join("simulator", "target", "release", "arknights_pass_simulator.exe")
@@ -256,20 +399,24 @@ def run_cxfreeze(skip_flasher=False):
 
     # Windows 上使用 "gui" base 避免出现控制台窗口（cx_Freeze 7.0+ 用 "gui" 替代了旧的 "Win32GUI"）
     base = "gui" if sys.platform == "win32" else None
-    original_argv = sys.argv
-    sys.argv = [sys.argv[0], "build"]
 
     try:
+        # 通过 script_args 指定命令，不再临时替换全局 sys.argv
         setup(
+            script_args=["build"],
             name=PROJECT_NAME,
             version=VERSION,
             description="Arknights Pass Material Maker",
+            author=PUBLISHER,
             options={"build_exe": build_options},
             executables=[Executable(
                 script=MAIN_SCRIPT,
                 base=base,
                 target_name=f"{PROJECT_NAME}.exe",
                 icon=ICON_FILE if os.path.exists(ICON_FILE) else None,
+                # 版本资源字段一次性给定，生成的 exe 元数据在各次构建间保持稳定
+                copyright=f"Copyright (C) {PUBLISHER}",
+                uac_admin=False,
             )],
         )
         license_file = os.path.join(BUILD_DIR, "frozen_application_license.txt")
@@ -279,8 +426,6 @@ def run_cxfreeze(skip_flasher=False):
     except Exception as e:
         print(f"Build failed: {e}")
         return False
-    finally:
-        sys.argv = original_argv
 
 
 def copy_class_icons():
@@ -295,6 +440,29 @@ def copy_class_icons():
         print(f"  {src} -> {dst}")
 
 
+def get_compression():
+    """根据可用内存选择安装包压缩级别
+
+    ultra64 使用 64MB 字典，压缩率最高但内存占用大；可用内存不足 4GB 时降级为 max（32MB 字典）。
+    """
+    available_gb = get_available_memory_gb()
+    if available_gb is not None and available_gb < 4:
+        return "lzma2/max"
+    return "lzma2/ultra64"
+
+
+def run_iscc(iscc, jobs):
+    """调用 ISCC 编译安装包，实时输出编译日志，返回退出码"""
+    proc = subprocess.Popen(
+        [iscc, f"/DLZMAThreads={jobs}", f"/DCompressionMode={get_compression()}", ISS_FILE],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        bufsize=1, text=True, errors='replace'
+    )
+    for line in proc.stdout:
+        print(f"[{time.strftime('%H:%M:%S')}] {line}", end="")
+    return proc.wait()
+
+
 def create_installer():
     """创建安装包"""
     print("\n" + "=" * 50)
@@ -315,12 +483,17 @@ def create_installer():
     os.makedirs(DIST_DIR, exist_ok=True)
 
     try:
-        result = subprocess.run([iscc, ISS_FILE], capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Inno Setup failed: {result.stderr}")
+        jobs = get_build_jobs()
+        print(f"  Compression: {get_compression()}, threads: {jobs}")
+        returncode = run_iscc(iscc, jobs)
+        if returncode != 0 and jobs > 1:
+            # 多线程 lzma2 的内存占用随线程数线性增长，压缩进程内存耗尽时以单线程重试
+            print(f"Inno Setup failed with {jobs} threads, retrying single-threaded...")
+            returncode = run_iscc(iscc, 1)
+        if returncode != 0:
+            print(f"Inno Setup failed (code {returncode})")
             return False
 
-        print(result.stdout)
         for f in os.listdir(DIST_DIR):
             if f.endswith(".exe"):
                 path = os.path.join(DIST_DIR, f)
@@ -332,6 +505,94 @@ def create_installer():
         return False
 
 
+def run_source_check():
+    """快速冒烟检查：用当前解释器编译并导入主要模块，不执行冻结和打包"""
+    import compileall
+
+    print("\n" + "=" * 50)
+    print("Checking sources...")
+    print("=" * 50)
+
+    ok = compileall.compile_file(MAIN_SCRIPT, quiet=1)
+    for package_dir in ["config", "core", "gui", "utils", "_mext"]:
+        ok = compileall.compile_dir(package_dir, quiet=1) and ok
+    if not ok:
+        print("Error: byte-compilation failed")
+        return False
+
+    env = dict(os.environ, QT_API="pyqt6", QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", "import gui.main_window"],
+        env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"Error: import check failed\n{result.stderr}")
+        return False
+
+    print("Source check passed")
+    return True
+
+
+def run_import_analysis():
+    """用 -X importtime 导入主窗口，统计实际加载的模块并给出 excludes 建议
+
+    packages 中的包会被 cx_Freeze 整包复制；启动时从未导入的包是 excludes 或从 packages 移除的候选。
+    运行期才延迟导入的模块（如导出、烧录）不会出现在报告中，采纳建议前需人工确认。
+    """
+    print("\n" + "=" * 50)
+    print("Analyzing startup imports...")
+    print("=" * 50)
+
+    env = dict(os.environ, QT_API="pyqt6", QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import gui.main_window"],
+        env=env, capture_output=True, text=True, errors='replace'
+    )
+    if result.returncode != 0:
+        print(f"Error: import failed\n{result.stderr[-2000:]}")
+        return False
+
+    # 格式: "import time: self [us] | cumulative | imported package"
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        imported[fields[2].strip()] = int(fields[1])
+
+    top_level = {}
+    for name, cumulative in imported.items():
+        root = name.split(".")[0]
+        top_level[root] = max(top_level.get(root, 0), cumulative)
+
+    print(f"  {len(imported)} modules imported at startup")
+    print("\n  Slowest top-level imports (cumulative):")
+    for root, cumulative in sorted(top_level.items(), key=lambda kv: kv[1], reverse=True)[:15]:
+        print(f"    {cumulative / 1000:8.1f} ms  {root}")
+
+    packages, _, excludes = get_freeze_modules()
+    unused = [
+        pkg for pkg in packages
+        if not any(name == pkg or name.startswith(pkg + ".") for name in imported)
+    ]
+    print("\n  Forced packages never imported at startup (candidates for excludes):")
+    for pkg in unused or ["(none)"]:
+        print(f"    {pkg}")
+
+    excluded_but_imported = [
+        pkg for pkg in excludes
+        if any(name == pkg or name.startswith(pkg + ".") for name in imported)
+    ]
+    if excluded_but_imported:
+        print("\n  Warning: excluded but imported at startup:")
+        for pkg in excluded_but_imported:
+            print(f"    {pkg}")
+
+    return True
+
+
 def main():
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     args = parse_args()
@@ -340,23 +601,43 @@ def main():
     print(f"  {PROJECT_NAME} Build Tool v{VERSION}")
     print("=" * 50)
 
+    if args.mode == 'check':
+        sys.exit(0 if run_source_check() else 1)
+    if args.mode == 'analyze':
+        sys.exit(0 if run_import_analysis() else 1)
+
     if not check_requirements():
         sys.exit(1)
 
-    if args.clean:
+    if args.clean or args.release:
         clean_build()
 
-    print("\n" + "=" * 50)
-    print("Running cx_Freeze...")
-    print("=" * 50)
-
-    if not run_cxfreeze(skip_flasher=args.skip_flasher):
-        sys.exit(1)
-
-    print(f"\ncx_Freeze done: {BUILD_DIR}/")
+    fingerprint = compute_source_fingerprint(skip_flasher=args.skip_flasher)
+    if not args.release and is_freeze_cached(fingerprint):
+        print(f"\nSources unchanged, reusing previous cx_Freeze output: {BUILD_DIR}/")
+    else:
+        print("\n" + "=" * 50)
+        print("Running cx_Freeze...")
+        print("=" * 50)
+
+        if os.path.exists(FREEZE_STAMP):
+            os.remove(FREEZE_STAMP)
+        # dev 模式保留缓存：.pyc 按源文件 mtime 校验，未修改的模块（包括 .venv 中的依赖）无需重新编译；
+        # --clean/--release 时 clean_build 已清理过一次，无需重复遍历
+        clear_cache = not (args.dev or args.clean or args.release)
+        if args.dev:
+            print("Keeping __pycache__ (dev build)")
+        if not run_cxfreeze(skip_flasher=args.skip_flasher, clear_cache=clear_cache):
+            sys.exit(1)
+        save_freeze_stamp(fingerprint)
+
+        print(f"\ncx_Freeze done: {BUILD_DIR}/")
     copy_class_icons()
 
-    if not args.no_installer:
+    if args.dev:
+        # 开发构建直接使用目录版，跳过 Inno Setup 的 lzma2 固实压缩
+        print(f"\nDev build ready: {os.path.join(BUILD_DIR, PROJECT_NAME + '.exe')}")
+    elif not args.no_installer:
         if create_installer():
             print("\n" + "=" * 50)
             print("Build completed!")
@@ -36,6 +36,7 @@ class AutoSaveService(QObject):
         self._base_dir: str = ""  # 基础目录
         self._last_save_time: float = 0  # 上次保存时间
         self._is_saving: bool = False  # 是否正在保存
+        self._ensured_dirs: set = set()  # 已确认存在的备份目录，定时保存时不再重复 makedirs
 
     def start(self, config_obj: object, project_path: str, base_dir: str):
         """启动自动保存"""
@@ -105,6 +106,8 @@ class AutoSaveService(QObject):
         except Exception as e:
             logger.error(f"自动保存失败: {e}")
             self.error_occurred.emit(str(e))
+            # 备份目录可能已被外部删除，下次保存时重新创建
+            self._ensured_dirs.clear()
         finally:
             self._is_saving = False
 
@@ -119,7 +122,9 @@ class AutoSaveService(QObject):
         # 创建备份目录
         project_dir = os.path.dirname(self._project_path)
         backup_dir = os.path.join(project_dir, ".autosave")
-        os.makedirs(backup_dir, exist_ok=True)
+        if backup_dir not in self._ensured_dirs:
+            os.makedirs(backup_dir, exist_ok=True)
+            self._ensured_dirs.add(backup_dir)
 
         # 生成备份文件名
         timestamp = time.strftime("%Y%m%d_%H%M%S")
@@ -150,7 +155,7 @@ class AutoSaveService(QObject):
                 for filepath, _ in backup_files[self.config.max_backups:]:
                     try:
                         os.remove(filepath)
-                        logger.debug(f"删除旧备份: {filepath}")
+                        logger.debug("删除旧备份: %s", filepath)
                     except Exception as e:
                         logger.warning(f"删除备份失败: {e}")
 
@@ -208,7 +213,7 @@ class AutoSaveService(QObject):
                     else:
                         import shutil
                         shutil.rmtree(filepath)
-                    logger.debug(f"删除备份: {filepath}")
+                    logger.debug("删除备份: %s", filepath)
                 except Exception as e:
                     logger.warning(f"删除备份失败: {e}")
 
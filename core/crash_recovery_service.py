@@ -132,7 +132,7 @@ class CrashRecoveryService(QObject):
                     else:
                         import shutil
                         shutil.rmtree(filepath)
-                    logger.debug(f"删除恢复文件: {filepath}")
+                    logger.debug("删除恢复文件: %s", filepath)
                 except Exception as e:
                     logger.warning(f"删除恢复文件失败: {e}")
 
@@ -203,7 +203,7 @@ class CrashRecoveryService(QObject):
                     if file_age > max_age_seconds:
                         os.remove(filepath)
                         cleaned_count += 1
-                        logger.debug(f"删除旧恢复文件: {filename}")
+                        logger.debug("删除旧恢复文件: %s", filename)
 
                 except Exception as e:
                     logger.warning(f"删除恢复文件失败 {filename}: {e}")
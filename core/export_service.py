@@ -1,18 +1,21 @@
 """
 导出服务 - 素材导出和打包
 """
+import functools
 import json
 import os
-import sys
-import struct
 import shutil
+import sys
 import subprocess
 import logging
 import tempfile
 import glob
-from typing import Optional, Dict, Any, Tuple, List
+import threading
+import collections
+from typing import Optional, Dict, Any, Tuple, List, Iterator, Callable
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 
@@ -22,7 +25,13 @@ try:
 except ImportError:
     HAS_CV2 = False
 
-from PyQt6.QtCore import QThread, pyqtSignal, QObject
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+from PyQt6.QtCore import Qt, QRunnable, QThreadPool, pyqtSignal, QObject
 
 from config.constants import get_resolution_spec
 from config.epconfig import EPConfig
@@ -30,6 +39,128 @@ from utils.file_utils import get_app_dir
 
 logger = logging.getLogger(__name__)
 
+# .argb 文件按行优先存储像素，每像素 4 字节，字节顺序为 B, G, R, A，
+# 与 OpenCV BGRA 图像的内存布局完全相同，因此导出时无需重排通道
+
+# ARGB 导出时每次写入的行数
+ARGB_WRITE_ROWS = 64
+# ARGB 导出文件的写缓冲大小
+ARGB_WRITE_BUFFER = 1 << 20
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True, parallel=True)
+    def _numba_pack_bgra_flipped(src, out):
+        """
+        把 BGR/BGRA 图像旋转180度并打包为 BGRA，单次遍历完成
+
+        按行并行；三通道输入的 alpha 固定为 255。
+        """
+        h, w, channels = src.shape
+        for y in numba.prange(h):
+            sy = h - 1 - y
+            for x in range(w):
+                sx = w - 1 - x
+                out[y, x, 0] = src[sy, sx, 0]
+                out[y, x, 1] = src[sy, sx, 1]
+                out[y, x, 2] = src[sy, sx, 2]
+                out[y, x, 3] = src[sy, sx, 3] if channels == 4 else 255
+
+
+# 已找到的 ffmpeg 路径；未找到时不缓存，用户补装 ffmpeg 后再次导出即可生效
+_ffmpeg_path_cache: str = ""
+
+
+def _locate_ffmpeg() -> str:
+    """查找ffmpeg（支持打包环境），找到后在进程内缓存"""
+    global _ffmpeg_path_cache
+    if not _ffmpeg_path_cache:
+        _ffmpeg_path_cache = _search_ffmpeg()
+    return _ffmpeg_path_cache
+
+
+def _search_ffmpeg() -> str:
+    """按优先级查找ffmpeg，未找到返回空字符串"""
+    # 1. 先在应用程序目录查找（支持 Nuitka/PyInstaller 打包）
+    app_ffmpeg = os.path.join(get_app_dir(), "ffmpeg.exe")
+    if os.path.isfile(app_ffmpeg):
+        return app_ffmpeg
+
+    # 2. 在 ffmpeg 目录中查找
+    ffmpeg_dir_ffmpeg = os.path.join(get_app_dir(), "ffmpeg", "ffmpeg.exe")
+    if os.path.isfile(ffmpeg_dir_ffmpeg):
+        return ffmpeg_dir_ffmpeg
+
+    # 3. 在当前工作目录查找
+    local_ffmpeg = os.path.join(os.getcwd(), "ffmpeg.exe")
+    if os.path.isfile(local_ffmpeg):
+        return local_ffmpeg
+
+    # 4. 在系统 PATH 中查找（进程内遍历 PATH/PATHEXT，无需启动 where/which）
+    return shutil.which("ffmpeg") or ""
+
+
+# 硬件 H.264 编码器及其码率控制参数，按优先级排列
+HW_VIDEO_ENCODERS: Dict[str, List[str]] = {
+    "h264_nvenc": ["-preset", "p4", "-rc", "vbr", "-profile:v", "high", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-preset", "medium", "-profile:v", "high", "-pix_fmt", "nv12"],
+    "h264_amf": ["-quality", "balanced", "-rc", "vbr_peak", "-profile:v", "high", "-pix_fmt", "yuv420p"],
+}
+# 无可用硬件编码器时使用的软件编码器
+SOFTWARE_VIDEO_ENCODER = "libx264"
+# 让 FFmpeg 把 key=value 形式的进度写到 stdout，并关闭 stderr 上的统计行
+FFMPEG_PROGRESS_ARGS = ["-progress", "pipe:1", "-nostats"]
+# libx264 2pass 编码参数（码率单独指定）
+X264_ENCODE_ARGS = [
+    "-c:v", SOFTWARE_VIDEO_ENCODER,
+    "-profile:v", "high",
+    "-level", "4.0",
+    "-pix_fmt", "yuv420p",
+]
+
+
+def _run_ffmpeg_probe(cmd: List[str], timeout: float = 15) -> Optional[subprocess.CompletedProcess]:
+    """运行一次短时 FFmpeg 探测命令，失败或超时返回 None"""
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, errors='replace',
+                              timeout=timeout, **kwargs)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _detect_video_encoder(ffmpeg_path: str) -> str:
+    """
+    探测可用的 H.264 编码器，结果按 ffmpeg 路径缓存
+
+    编码器出现在 -encoders 列表中只说明 FFmpeg 编译时启用了它，
+    还需实际编码几帧确认驱动和硬件可用；全部不可用时回退到 libx264。
+    """
+    result = _run_ffmpeg_probe([ffmpeg_path, "-hide_banner", "-encoders"])
+    if result is None or result.returncode != 0:
+        return SOFTWARE_VIDEO_ENCODER
+
+    listed = set(result.stdout.split())
+    for encoder, flags in HW_VIDEO_ENCODERS.items():
+        if encoder not in listed:
+            continue
+        test = _run_ffmpeg_probe([
+            ffmpeg_path, "-hide_banner", "-nostats",
+            "-f", "lavfi", "-i", "color=black:s=256x256:r=30:d=0.2",
+            "-c:v", encoder, *flags, "-b:v", "1000k",
+            "-f", "null", "-",
+        ])
+        if test is not None and test.returncode == 0:
+            logger.info(f"使用硬件视频编码器: {encoder}")
+            return encoder
+        logger.debug("硬件编码器 %s 不可用", encoder)
+
+    logger.info(f"未检测到可用的硬件视频编码器，使用 {SOFTWARE_VIDEO_ENCODER}")
+    return SOFTWARE_VIDEO_ENCODER
+
 
 class ExportType(Enum):
     """导出类型枚举"""
@@ -40,6 +171,10 @@ class ExportType(Enum):
     ICON = "icon"
 
 
+# 可与其他图片任务并行执行的导出类型
+IMAGE_EXPORT_TYPES = (ExportType.LOGO, ExportType.OVERLAY, ExportType.ICON)
+
+
 @dataclass
 class VideoExportParams:
     """视频导出参数"""
@@ -61,24 +196,33 @@ class ExportTask:
     data: Any
 
 
-class ExportWorker(QThread):
-    """导出工作线程"""
+class ExportWorkerSignals(QObject):
+    """ExportWorker 的信号（QRunnable 不是 QObject，无法直接定义信号）"""
 
     progress_updated = pyqtSignal(int, str)
     export_completed = pyqtSignal(str)
     export_failed = pyqtSignal(str)
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
+
+class ExportWorker(QRunnable):
+    """导出任务，提交到 QThreadPool 执行，复用池中线程而不是每次导出新建 QThread"""
+
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(True)
+        self.signals = ExportWorkerSignals()
         self._tasks: List[ExportTask] = []
         self._output_dir: str = ""
         self._ffmpeg_path: str = ""
-        self._cancelled: bool = False
+        # 取消标志，由主线程设置、线程池线程读取
+        self._cancel_event = threading.Event()
         self._epconfig: Optional[EPConfig] = None
         self._resolution: str = "360x640"
         # 当前FFmpeg进程引用，用于支持取消操作
         # 参考: Python subprocess文档 - Popen.terminate() 可终止子进程
         self._ffmpeg_process: Optional[subprocess.Popen] = None
+        # 视频编码器，首次导出视频时在工作线程中探测
+        self._video_encoder: Optional[str] = None
 
     def setup(
         self,
@@ -94,7 +238,11 @@ class ExportWorker(QThread):
         self._ffmpeg_path = ffmpeg_path or self._find_ffmpeg()
         self._epconfig = epconfig
         self._resolution = resolution
-        self._cancelled = False
+        self._cancel_event.clear()
+
+    @property
+    def _cancelled(self) -> bool:
+        return self._cancel_event.is_set()
 
     def cancel(self):
         """
@@ -104,7 +252,7 @@ class ExportWorker(QThread):
         - Popen.terminate(): "Stop the child. On POSIX OSs the method sends SIGTERM
           to the child. On Windows the Win32 API function TerminateProcess() is called."
         """
-        self._cancelled = True
+        self._cancel_event.set()
         logger.info("导出任务已请求取消")
         
         # 如果有正在运行的FFmpeg进程，立即终止它
@@ -117,95 +265,107 @@ class ExportWorker(QThread):
 
     def _find_ffmpeg(self) -> str:
         """查找ffmpeg（支持打包环境）"""
-        # 1. 先在应用程序目录查找（支持 Nuitka/PyInstaller 打包）
-        app_ffmpeg = os.path.join(get_app_dir(), "ffmpeg.exe")
-        if os.path.isfile(app_ffmpeg):
-            return app_ffmpeg
-
-        # 2. 在 ffmpeg 目录中查找
-        ffmpeg_dir_ffmpeg = os.path.join(get_app_dir(), "ffmpeg", "ffmpeg.exe")
-        if os.path.isfile(ffmpeg_dir_ffmpeg):
-            return ffmpeg_dir_ffmpeg
-
-        # 3. 在当前工作目录查找
-        local_ffmpeg = os.path.join(os.getcwd(), "ffmpeg.exe")
-        if os.path.isfile(local_ffmpeg):
-            return local_ffmpeg
-
-        # 4. 在系统 PATH 中查找（使用 where 命令）
-        try:
-            cmd = ["where", "ffmpeg"] if os.name == 'nt' else ["which", "ffmpeg"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except Exception:
-            pass
-
-        # 5. 直接检查系统 PATH 环境变量中的路径
-        try:
-            path_env = os.environ.get("PATH", "")
-            paths = path_env.split(os.pathsep)
-            for path in paths:
-                ffmpeg_path = os.path.join(path, "ffmpeg.exe")
-                if os.path.isfile(ffmpeg_path):
-                    return ffmpeg_path
-        except Exception:
-            pass
-
-        return ""
+        return _locate_ffmpeg()
 
     def run(self):
         """执行导出"""
         try:
             total_tasks = len(self._tasks)
             if total_tasks == 0 and not self._epconfig:
-                self.export_completed.emit("没有需要导出的任务")
+                self.signals.export_completed.emit("没有需要导出的任务")
                 return
 
             os.makedirs(self._output_dir, exist_ok=True)
 
-            completed = 0
-            for i, task in enumerate(self._tasks):
-                if self._cancelled:
-                    self.export_failed.emit("导出已取消")
-                    return
-
-                base_progress = int((i / (total_tasks + 1)) * 100)
+            indexed_tasks = list(enumerate(self._tasks))
+            image_tasks = [(i, t) for i, t in indexed_tasks if t.export_type in IMAGE_EXPORT_TYPES]
+            video_tasks = [(i, t) for i, t in indexed_tasks if t.export_type not in IMAGE_EXPORT_TYPES]
+
+            # 图片任务相互独立，耗时主要在会释放 GIL 的 NumPy/OpenCV 调用中，提交到线程池后
+            # 与视频任务重叠执行；视频任务本身已占满 FFmpeg（独立进程），仍按顺序执行。
+            # 线程池中的图片任务不各自发送进度，避免与视频进度交错导致进度条回退
+            failed = None
+            with ThreadPoolExecutor(max_workers=max(1, min(3, len(image_tasks)))) as executor:
+                futures = {
+                    executor.submit(self._execute_task, task, 0, total_tasks, False): task
+                    for i, task in image_tasks
+                }
+
+                for i, task in video_tasks:
+                    if self._cancelled:
+                        failed = "导出已取消"
+                        break
+
+                    base_progress = int((i / (total_tasks + 1)) * 100)
+
+                    try:
+                        self._execute_task(task, base_progress, total_tasks)
+                    except Exception as e:
+                        logger.exception(f"执行任务 {task.export_type.value} 失败")
+                        failed = f"导出 {task.export_type.value} 失败: {str(e)}"
+                        break
+
+                done = 0
+                for future in as_completed(futures):
+                    task = futures[future]
+                    try:
+                        future.result()
+                    except InterruptedError:
+                        if failed is None:
+                            failed = "导出已取消"
+                        continue
+                    except Exception as e:
+                        logger.exception(f"执行任务 {task.export_type.value} 失败")
+                        if failed is None:
+                            failed = f"导出 {task.export_type.value} 失败: {str(e)}"
+                        continue
+                    # 只有图片任务时按完成数量推进进度（单调递增）
+                    done += 1
+                    if not video_tasks and failed is None:
+                        self.signals.progress_updated.emit(
+                            int((done / (total_tasks + 1)) * 100), f"已导出 {task.output_path}")
 
-                try:
-                    self._execute_task(task, base_progress, total_tasks)
-                    completed += 1
-                except Exception as e:
-                    logger.exception(f"执行任务 {task.export_type.value} 失败")
-                    self.export_failed.emit(f"导出 {task.export_type.value} 失败: {str(e)}")
-                    return
+            if self._cancelled:
+                failed = "导出已取消"
+            if failed is not None:
+                self.signals.export_failed.emit(failed)
+                return
 
             # 生成epconfig.json
             if self._epconfig:
-                self.progress_updated.emit(95, "正在生成 epconfig.json...")
+                self.signals.progress_updated.emit(95, "正在生成 epconfig.json...")
                 self._generate_epconfig()
 
-            self.progress_updated.emit(100, "导出完成")
-            self.export_completed.emit(f"成功导出到 {self._output_dir}")
+            self.signals.progress_updated.emit(100, "导出完成")
+            self.signals.export_completed.emit(f"成功导出到 {self._output_dir}")
 
         except Exception as e:
             logger.exception("导出过程发生错误")
-            self.export_failed.emit(f"导出失败: {str(e)}")
+            self.signals.export_failed.emit(f"导出失败: {str(e)}")
 
-    def _execute_task(self, task: ExportTask, base_progress: int, total_tasks: int):
-        """执行单个任务"""
+    def _execute_task(
+        self,
+        task: ExportTask,
+        base_progress: int,
+        total_tasks: int,
+        report_progress: bool = True
+    ):
+        """执行单个任务（report_progress 为 False 时图片任务不发送进度）"""
         output_path = os.path.join(self._output_dir, task.output_path)
 
         if task.export_type == ExportType.LOGO:
-            self.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
+            if report_progress:
+                self.signals.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
             self._export_argb(output_path, task.data, is_logo=True)
 
         elif task.export_type == ExportType.OVERLAY:
-            self.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
+            if report_progress:
+                self.signals.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
             self._export_argb(output_path, task.data, is_logo=False)
 
         elif task.export_type == ExportType.ICON:
-            self.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
+            if report_progress:
+                self.signals.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
             if HAS_CV2:
                 success, encoded = cv2.imencode('.png', task.data)
                 if success:
@@ -213,31 +373,51 @@ class ExportWorker(QThread):
                         f.write(encoded.tobytes())
 
         elif task.export_type in (ExportType.LOOP_VIDEO, ExportType.INTRO_VIDEO):
-            self.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
+            self.signals.progress_updated.emit(base_progress, f"正在导出 {task.output_path}...")
             self._export_video(output_path, task.data, base_progress, total_tasks)
 
     def _export_argb(self, output_path: str, mat: np.ndarray, is_logo: bool = False):
         """导出ARGB格式文件"""
-        # 旋转180度
-        mat = cv2.rotate(mat, cv2.ROTATE_180) if HAS_CV2 else np.rot90(mat, 2)
-        mat = mat.astype(np.uint8)
+        # 输入通常已是 uint8（OpenCV 图像），此时不再整块复制
+        if mat.dtype != np.uint8:
+            mat = mat.astype(np.uint8, copy=False)
         h, w = mat.shape[:2]
         channels = mat.shape[-1] if len(mat.shape) == 3 else 1
 
-        with open(output_path, "wb") as f:
-            for y in range(h):
+        if HAS_NUMBA and channels in (3, 4):
+            # 旋转180度与 BGRA 打包融合为一次并行遍历，不产生中间图像
+            out = np.empty((h, w, 4), dtype=np.uint8)
+            _numba_pack_bgra_flipped(np.ascontiguousarray(mat), out)
+            self._write_argb(output_path, out)
+            return
+
+        # 旋转180度（等价于水平+垂直翻转）
+        mat = cv2.flip(mat, -1) if HAS_CV2 else mat[::-1, ::-1]
+
+        # 输出的字节序与 OpenCV 的 BGRA 内存布局一致（见 ARGB_WRITE_ROWS 上方说明），
+        # 已是 BGRA 时直接写出；
+        # 否则由 cvtColor 一次补出常量 255 的 alpha 通道（灰度图同时展开为三通道）
+        if channels == 4:
+            out = np.ascontiguousarray(mat, dtype=np.uint8)
+        elif HAS_CV2 and channels in (1, 3):
+            code = cv2.COLOR_BGR2BGRA if channels == 3 else cv2.COLOR_GRAY2BGRA
+            out = cv2.cvtColor(mat, code)
+        else:
+            out = np.empty((h, w, 4), dtype=np.uint8)
+            out[..., :3] = mat.reshape(h, w, channels)
+            out[..., 3] = 255
+
+        self._write_argb(output_path, out)
+
+    def _write_argb(self, output_path: str, out: np.ndarray):
+        """写出连续的 BGRA 缓冲区"""
+        # 按行块写入，块之间检查取消标志；行切片本身连续，直接以缓冲区协议写出，
+        # 不再经 tobytes() 复制，并用 1 MiB 缓冲合并系统调用
+        with open(output_path, "wb", buffering=ARGB_WRITE_BUFFER) as f:
+            for y in range(0, out.shape[0], ARGB_WRITE_ROWS):
                 if self._cancelled:
                     raise InterruptedError("导出已取消")
-                for x in range(w):
-                    if channels == 4:
-                        b, g, r, a = mat[y, x]
-                    elif channels == 3:
-                        b, g, r = mat[y, x]
-                        a = 255
-                    else:
-                        b = g = r = mat[y, x]
-                        a = 255
-                    f.write(struct.pack("BBBB", b, g, r, a))
+                f.write(memoryview(out[y:y + ARGB_WRITE_ROWS]).cast("B"))
 
     def _export_video(
         self,
@@ -261,132 +441,457 @@ class ExportWorker(QThread):
         spec = get_resolution_spec(params.resolution)
         target_w = spec["width"]
         target_h = spec["height"]
-        padded_w = spec["padded_width"]
-        padded_h = spec["padded_height"]
-        padding_side = spec["padding_side"]
         rotate_180 = spec["rotate_180"]
 
-        temp_dir = os.path.join(self._output_dir, "_temp_frames").replace("\\", "/")
-        os.makedirs(temp_dir, exist_ok=True)
+        # 优先由 FFmpeg 滤镜图一次完成解码、裁剪、旋转、缩放和补边，Python 不接触像素；
+        # FFmpeg 无法处理该输入时回退到 OpenCV 逐帧处理
+        if params.fps > 0:
+            try:
+                self._export_video_filtered(output_path, params, spec, base_progress, total_tasks)
+                return
+            except RuntimeError as e:
+                logger.warning(f"FFmpeg 滤镜导出失败，回退到 OpenCV 逐帧处理: {e}")
 
-        try:
-            cap = cv2.VideoCapture(params.video_path)
-            if not cap.isOpened():
-                raise RuntimeError(f"无法打开视频: {params.video_path}")
+        cap = cv2.VideoCapture(params.video_path)
+        if not cap.isOpened():
+            raise RuntimeError(f"无法打开视频: {params.video_path}")
 
-            cap.set(cv2.CAP_PROP_POS_FRAMES, params.start_frame)
+        try:
             total_frames = params.end_frame - params.start_frame
 
-            # 预计算旋转后的裁剪框坐标
-            orig_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            orig_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             x, y, w, h = params.cropbox
             rotation = params.rotation
 
-            # 将cropbox从原始坐标变换到旋转后坐标
-            if rotation == 90:
-                rx, ry, rw, rh = (orig_h - y - h, x, h, w)
-            elif rotation == 180:
-                rx, ry, rw, rh = (orig_w - x - w, orig_h - y - h, w, h)
-            elif rotation == 270:
-                rx, ry, rw, rh = (y, orig_w - x - w, h, w)
-            else:
-                rx, ry, rw, rh = (x, y, w, h)
-
-            frames_written = 0
-            for frame_idx in range(total_frames):
+            # 先按原始坐标裁剪（只是视图，不拷贝），再只旋转裁剪区域：
+            # rotate(frame)[旋转后的裁剪框] 与 rotate(frame[原始裁剪框]) 等价，无需旋转整帧
+            quarter_turn = {
+                90: cv2.ROTATE_90_CLOCKWISE,
+                270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+            }.get(rotation)
+            # 180° 旋转与缩放可交换，用户的 180° 旋转与规格要求的 180° 旋转
+            # 合并为缩放后的一次 cv2.flip(-1)，两者同时存在时相互抵消
+            flip = (rotation == 180) != rotate_180
+
+            # 预分配补黑边后的整帧画布，每帧只把缩放结果写入左上角的有效区域，
+            # 黑边部分保持为零，不再逐帧分配 padding 并 hstack/vstack
+            out_w, out_h = self._padded_size(spec)
+            canvas = np.zeros((out_h, out_w, 3), dtype=np.uint8)
+            content = canvas[:target_h, :target_w]
+            resized = np.empty((target_h, target_w, 3), dtype=np.uint8) if flip else None
+
+            def iter_frames(report_progress: bool):
+                # 每次调用都从入点重新解码（2pass 的第二遍会再次调用）
+                cap.set(cv2.CAP_PROP_POS_FRAMES, params.start_frame)
+                # 把上一帧的数组作为输出缓冲区传回 read()，尺寸一致时解码结果直接写入，
+                # 避免每帧重新分配整帧内存
+                frame = None
+                for frame_idx in range(total_frames):
+                    ret, frame = cap.read(frame)
+                    if not ret:
+                        break
+
+                    # 应用裁剪和用户设置的旋转，缩放结果直接写入画布
+                    crop = frame[y:y+h, x:x+w]
+                    if quarter_turn is not None:
+                        crop = cv2.rotate(crop, quarter_turn)
+                    if flip:
+                        cv2.resize(crop, (target_w, target_h), dst=resized)
+                        cv2.flip(resized, -1, dst=content)
+                    else:
+                        cv2.resize(crop, (target_w, target_h), dst=content)
+
+                    if report_progress and frame_idx % 10 == 0:
+                        progress = base_progress + int((frame_idx / total_frames) * 50 / total_tasks)
+                        self.signals.progress_updated.emit(progress, f"处理帧 {frame_idx}/{total_frames}")
+
+                    yield canvas
+
+            frames_written = self._encode_frames(
+                make_frames=iter_frames,
+                width=out_w,
+                height=out_h,
+                output_file=output_path.replace("\\", "/"),
+                fps=params.fps,
+                bitrate="3000k",
+                on_pass2=lambda: self.signals.progress_updated.emit(
+                    base_progress + 50, "正在编码视频(2pass)..."),
+                on_progress=lambda fraction: self.signals.progress_updated.emit(
+                    base_progress + 50 + int(fraction * 50 / total_tasks),
+                    f"正在编码视频(2pass) {int(fraction * 100)}%"),
+            )
+            logger.info(f"成功写入 {frames_written} 帧")
+
+        finally:
+            cap.release()
+
+    def _export_video_filtered(
+        self,
+        output_path: str,
+        params: VideoExportParams,
+        spec: Dict[str, Any],
+        base_progress: int,
+        total_tasks: int
+    ):
+        """由 FFmpeg 直接读取源视频，经 -vf 滤镜图完成全部帧处理并编码"""
+        x, y, w, h = params.cropbox
+        out_w, out_h = self._padded_size(spec)
+        total_frames = params.end_frame - params.start_frame
+
+        target_w, target_h = spec["width"], spec["height"]
+
+        # 与 OpenCV 路径一致：先裁剪原始坐标，再旋转裁剪区域；
+        # 用户 180° 旋转与规格要求的 180° 旋转合并，同时存在时相互抵消。
+        # 不会改变画面的滤镜（整帧裁剪、同尺寸缩放、零宽补边）直接省略，
+        # 源视频已符合规格时只剩裁切时间段和重新编码
+        filters = []
+        src_w, src_h = self._probe_frame_size(params.video_path)
+        if (x, y, w, h) != (0, 0, src_w, src_h):
+            filters.append(f"crop={w}:{h}:{x}:{y}")
+        quarter_turn = {90: "transpose=clock", 270: "transpose=cclock"}.get(params.rotation)
+        if quarter_turn:
+            filters.append(quarter_turn)
+            w, h = h, w
+        if (params.rotation == 180) != spec["rotate_180"]:
+            filters.append("hflip,vflip")
+        if (w, h) != (target_w, target_h):
+            filters.append(f"scale={target_w}:{target_h}:flags=bilinear")
+        filters.append("setsar=1")
+        if (out_w, out_h) != (target_w, target_h):
+            filters.append(f"pad={out_w}:{out_h}:0:0:color=black")
+
+        input_args = [
+            "-ss", f"{params.start_frame / params.fps:.6f}",
+            "-i", params.video_path,
+            "-frames:v", str(total_frames),
+            "-vf", ",".join(filters),
+            "-r", str(params.fps),
+        ]
+
+        self.signals.progress_updated.emit(base_progress, "正在编码视频...")
+        self._encode_source(
+            input_args=input_args,
+            output_file=output_path.replace("\\", "/"),
+            bitrate="3000k",
+            total_frames=total_frames,
+            on_progress=lambda fraction: self.signals.progress_updated.emit(
+                base_progress + int(fraction * 100 / total_tasks),
+                f"正在编码视频 {int(fraction * 100)}%"),
+        )
+
+    @staticmethod
+    def _probe_frame_size(video_path: str) -> Tuple[int, int]:
+        """读取视频帧尺寸 (宽, 高)，无法读取时返回 (0, 0)"""
+        cap = cv2.VideoCapture(video_path)
+        try:
+            return (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        finally:
+            cap.release()
+
+    @staticmethod
+    def _padded_size(spec: Dict[str, Any]) -> Tuple[int, int]:
+        """补黑边后的输出帧尺寸 (宽, 高)"""
+        out_w, out_h = spec["width"], spec["height"]
+        if spec["padding_side"] == "right":
+            out_w = max(out_w, spec["padded_width"])
+        elif spec["padding_side"] == "bottom":
+            out_h = max(out_h, spec["padded_height"])
+        return out_w, out_h
+
+    def _start_ffmpeg(self, cmd: List[str], stdin=None) -> subprocess.Popen:
+        """启动FFmpeg进程（二进制管道），并记录引用以支持取消"""
+        popen_kwargs = {
+            'stdin': stdin,
+            'stdout': subprocess.PIPE,
+            'stderr': subprocess.PIPE,
+        }
+        if sys.platform == 'win32':
+            popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+        self._ffmpeg_process = subprocess.Popen(cmd, **popen_kwargs)
+        return self._ffmpeg_process
+
+    def _wait_ffmpeg(self, stage: str, on_frame: Optional[Callable[[int], None]] = None) -> str:
+        """
+        等待当前FFmpeg进程结束，返回stderr，失败时抛出异常
+
+        给出 on_frame 时命令需带 FFMPEG_PROGRESS_ARGS：逐行读取 stdout 上的进度，
+        每次报告已编码的帧数；stderr 由后台线程排空，只保留末尾部分。
+        """
+        if on_frame is not None:
+            return self._wait_ffmpeg_progress(stage, on_frame)
+
+        # 使用 communicate(timeout) 循环等待进程完成
+        # Python文档警告: 使用 poll() + PIPE 会导致死锁，必须用 communicate()
+        # https://docs.python.org/3/library/subprocess.html#subprocess.Popen.wait
+        process = self._ffmpeg_process
+        while True:
+            try:
+                _, err = process.communicate(timeout=0.5)
+                break  # 进程已结束
+            except subprocess.TimeoutExpired:
+                # 进程仍在运行，检查取消标志
                 if self._cancelled:
+                    process.kill()
+                    process.communicate()  # 清理管道
+                    self._ffmpeg_process = None
                     raise InterruptedError("导出已取消")
 
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # 应用用户设置的旋转
-                if rotation == 90:
-                    frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-                elif rotation == 180:
-                    frame = cv2.rotate(frame, cv2.ROTATE_180)
-                elif rotation == 270:
-                    frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-
-                # 应用裁剪（使用旋转后的坐标）
-                frame = frame[ry:ry+rh, rx:rx+rw]
-                frame = cv2.resize(frame, (target_w, target_h))
-
-                if rotate_180:
-                    frame = cv2.rotate(frame, cv2.ROTATE_180)
-
-                if padding_side == "right":
-                    pad_w = padded_w - target_w
-                    if pad_w > 0:
-                        padding = np.zeros((target_h, pad_w, 3), dtype=np.uint8)
-                        frame = np.hstack([frame, padding])
-                elif padding_side == "bottom":
-                    pad_h = padded_h - target_h
-                    if pad_h > 0:
-                        padding = np.zeros((pad_h, target_w, 3), dtype=np.uint8)
-                        frame = np.vstack([frame, padding])
-
-                frame_path = os.path.join(temp_dir, f"frame_{frame_idx:06d}.png").replace("\\", "/")
-                success, encoded = cv2.imencode('.png', frame)
-                if success:
-                    with open(frame_path, 'wb') as f:
-                        f.write(encoded.tobytes())
-                    frames_written += 1
+        self._ffmpeg_process = None
+        if self._cancelled:
+            raise InterruptedError("导出已取消")
+        stderr = (err or b"").decode('utf-8', errors='replace')
+
+        if process.returncode != 0:
+            stderr_msg = stderr[-500:] if stderr else "未知错误"
+            logger.error(f"ffmpeg {stage} stderr: {stderr}")
+            raise RuntimeError(f"ffmpeg {stage}失败 (code {process.returncode}): {stderr_msg}")
+        return stderr
+
+    def _wait_ffmpeg_progress(self, stage: str, on_frame: Callable[[int], None]) -> str:
+        """读取 -progress pipe:1 输出驱动进度的 _wait_ffmpeg 实现"""
+        process = self._ffmpeg_process
+        # stdout 与 stderr 需同时读取，否则任一管道写满都会让 FFmpeg 阻塞
+        stderr_tail: collections.deque = collections.deque(maxlen=64)
+        drain = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+        drain.start()
+
+        for line in process.stdout:
+            if self._cancelled:
+                process.kill()
+                break
+            key, _, value = line.partition(b"=")
+            if key == b"frame":
+                try:
+                    on_frame(int(value))
+                except ValueError:
+                    pass
 
-                if frame_idx % 10 == 0:
-                    progress = base_progress + int((frame_idx / total_frames) * 50 / total_tasks)
-                    self.progress_updated.emit(progress, f"处理帧 {frame_idx}/{total_frames}")
+        process.wait()
+        drain.join()
+        process.stdout.close()
+        process.stderr.close()
+        self._ffmpeg_process = None
+        if self._cancelled:
+            raise InterruptedError("导出已取消")
+        stderr = b"".join(stderr_tail).decode('utf-8', errors='replace')
+
+        if process.returncode != 0:
+            stderr_msg = stderr[-500:] if stderr else "未知错误"
+            logger.error(f"ffmpeg {stage} stderr: {stderr}")
+            raise RuntimeError(f"ffmpeg {stage}失败 (code {process.returncode}): {stderr_msg}")
+        return stderr
+
+    def _pipe_frames(
+        self,
+        frames: Iterator[np.ndarray],
+        stage: str,
+        on_frame: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """把帧逐个写入当前FFmpeg进程的 stdin（每帧后以已写入帧数调用 on_frame），返回写入的帧数"""
+        process = self._ffmpeg_process
+        frames_written = 0
+        try:
+            for frame in frames:
+                if self._cancelled:
+                    raise InterruptedError("导出已取消")
+                process.stdin.write(np.ascontiguousarray(frame).data)
+                frames_written += 1
+                if on_frame is not None:
+                    on_frame(frames_written)
+        except BrokenPipeError:
+            # FFmpeg 提前退出（被取消或出错），取消与错误信息由随后的 _wait_ffmpeg 给出
+            logger.warning(f"ffmpeg {stage}提前关闭了输入管道")
+        except BaseException:
+            process.kill()
+            process.communicate()
+            self._ffmpeg_process = None
+            raise
 
-            cap.release()
+        if frames_written == 0 and not self._cancelled:
+            process.kill()
+            process.communicate()
+            self._ffmpeg_process = None
+            raise RuntimeError("没有成功写入任何视频帧")
+        return frames_written
 
-            if frames_written == 0:
-                raise RuntimeError("没有成功写入任何视频帧")
-            logger.info(f"成功写入 {frames_written} 帧")
+    def _encode_frames(
+        self,
+        make_frames: Callable[[bool], Iterator[np.ndarray]],
+        width: int,
+        height: int,
+        output_file: str,
+        fps: float,
+        bitrate: str = "3000k",
+        on_pass2: Optional[Callable[[], None]] = None,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> int:
+        """
+        编码视频帧，返回写入的帧数
 
-            self.progress_updated.emit(base_progress + 50, "正在编码视频(2pass)...")
-            input_pattern = f"{temp_dir}/frame_%06d.png"
-            output_file = output_path.replace("\\", "/")
+        make_frames(report_progress) 每次调用返回一个新的帧迭代器，参数表示是否报告处理进度。
+        有可用的硬件编码器时单遍编码（帧直接经 stdin 送入硬件编码器），
+        否则使用 libx264 2pass 编码，两遍各自重新生成帧。
+        """
+        if self._video_encoder is None:
+            self._video_encoder = _detect_video_encoder(self._ffmpeg_path)
 
-            # 使用2pass编码以获得更好的码率分配
-            # 参考: x264 ratecontrol.txt - "2pass: Given some data about each frame of a 1st pass,
-            # we try to choose QPs to maximize quality while matching a specified total size"
-            self._run_ffmpeg_2pass(
-                input_pattern=input_pattern,
-                output_file=output_file,
-                fps=params.fps,
-                bitrate="3000k"
-            )
+        if self._video_encoder == SOFTWARE_VIDEO_ENCODER:
+            return self._encode_frames_2pass(
+                make_frames, width, height, output_file, fps, bitrate, on_pass2, on_progress)
+        return self._encode_frames_hw(
+            make_frames(True), width, height, output_file, fps, bitrate, self._video_encoder)
 
+    def _encode_frames_hw(
+        self,
+        frames: Iterator[np.ndarray],
+        width: int,
+        height: int,
+        output_file: str,
+        fps: float,
+        bitrate: str,
+        encoder: str
+    ) -> int:
+        """使用硬件编码器单遍编码，码率控制由编码器的 VBR 模式完成"""
+        cmd = [
+            self._ffmpeg_path,
+            "-hide_banner",
+            "-nostats",
+            "-f", "rawvideo",
+            "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}",
+            "-framerate", str(fps),
+            "-i", "-",
+            "-c:v", encoder,
+            *HW_VIDEO_ENCODERS[encoder],
+            "-b:v", bitrate,
+            "-an",
+            "-y",
+            output_file
+        ]
+
+        logger.info(f"执行ffmpeg硬件编码: {' '.join(cmd)}")
+
+        try:
+            self._start_ffmpeg(cmd, stdin=subprocess.PIPE)
+            frames_written = self._pipe_frames(frames, "硬件编码")
+            self._wait_ffmpeg("硬件编码")
+            logger.info(f"{encoder} 编码完成")
+            return frames_written
         finally:
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            self._ffmpeg_process = None
 
-    def _run_ffmpeg_2pass(
+    def _encode_source(
         self,
-        input_pattern: str,
+        input_args: List[str],
         output_file: str,
-        fps: float,
-        bitrate: str = "3000k"
+        bitrate: str = "3000k",
+        total_frames: int = 0,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_pass2: Optional[Callable[[], None]] = None
     ):
-        
-        """使用FFmpeg进行2pass编码"""
+        """
+        编码由 FFmpeg 自行读取的输入（input_args 包含 -i 及滤镜参数）
+
+        有可用的硬件编码器时单遍编码，否则使用 libx264 2pass，两遍各自重新解码输入。
+        on_progress 接收整个编码过程的完成比例 (0~1)。
+        """
+        if self._video_encoder is None:
+            self._video_encoder = _detect_video_encoder(self._ffmpeg_path)
+        encoder = self._video_encoder
+        passes = 1 if encoder != SOFTWARE_VIDEO_ENCODER else 2
+
+        def frame_reporter(pass_index: int) -> Optional[Callable[[int], None]]:
+            if on_progress is None or total_frames <= 0:
+                return None
+            return lambda frame: on_progress(
+                (pass_index + min(frame, total_frames) / total_frames) / passes)
+
+        base_cmd = [self._ffmpeg_path, "-hide_banner", *FFMPEG_PROGRESS_ARGS, *input_args]
+
+        if encoder != SOFTWARE_VIDEO_ENCODER:
+            cmd = [*base_cmd, "-c:v", encoder, *HW_VIDEO_ENCODERS[encoder],
+                   "-b:v", bitrate, "-an", "-y", output_file]
+            logger.info(f"执行ffmpeg硬件编码: {' '.join(cmd)}")
+            try:
+                self._start_ffmpeg(cmd)
+                self._wait_ffmpeg("硬件编码", frame_reporter(0))
+            finally:
+                self._ffmpeg_process = None
+            logger.info(f"{encoder} 编码完成")
+            return
+
+        passlog_prefix = tempfile.mktemp(prefix="ffmpeg2pass_", dir=os.path.dirname(output_file))
+        encode_args = [*X264_ENCODE_ARGS, "-b:v", bitrate]
+        try:
+            pass1_cmd = [*base_cmd, *encode_args, "-pass", "1", "-passlogfile", passlog_prefix,
+                         "-an", "-f", "null", "-y", os.devnull]
+            logger.info(f"执行ffmpeg 2pass第一遍: {' '.join(pass1_cmd)}")
+            self._start_ffmpeg(pass1_cmd)
+            self._wait_ffmpeg("2pass第一遍", frame_reporter(0))
+
+            if self._cancelled:
+                raise InterruptedError("导出已取消")
+            if on_pass2 is not None:
+                on_pass2()
+
+            pass2_cmd = [*base_cmd, *encode_args, "-pass", "2", "-passlogfile", passlog_prefix,
+                         "-an", "-y", output_file]
+            logger.info(f"执行ffmpeg 2pass第二遍: {' '.join(pass2_cmd)}")
+            self._start_ffmpeg(pass2_cmd)
+            self._wait_ffmpeg("2pass第二遍", frame_reporter(1))
+            logger.info("2pass编码完成")
+        finally:
+            self._ffmpeg_process = None
+            for f in glob.glob(f"{passlog_prefix}*.log*"):
+                try:
+                    os.remove(f)
+                    logger.debug("已清理临时文件: %s", f)
+                except OSError:
+                    pass
+
+    def _encode_frames_2pass(
+        self,
+        make_frames: Callable[[bool], Iterator[np.ndarray]],
+        width: int,
+        height: int,
+        output_file: str,
+        fps: float,
+        bitrate: str = "3000k",
+        on_pass2: Optional[Callable[[], None]] = None,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> int:
+        """
+        使用FFmpeg进行2pass编码
+
+        处理后的 BGR 帧以 rawvideo 格式经 stdin 管道直接送入 FFmpeg，省去逐帧 PNG 编码/解码；
+        第二遍调用 make_frames 重新生成帧（与 _encode_source 重新解码输入相同），
+        不在磁盘上保存中间帧。on_progress 接收第二遍的完成比例 (0~1)。返回写入的帧数。
+        """
+        # 使用2pass编码以获得更好的码率分配
+        # 参考: x264 ratecontrol.txt - "2pass: Given some data about each frame of a 1st pass,
+        # we try to choose QPs to maximize quality while matching a specified total size"
         # 生成临时passlogfile前缀
         passlog_prefix = tempfile.mktemp(prefix="ffmpeg2pass_", dir=os.path.dirname(output_file))
-        
+
+        # -nostats 避免统计输出在写 stdin 期间填满 stderr 管道
+        raw_input_args = [
+            "-nostats",
+            "-f", "rawvideo",
+            "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}",
+            "-framerate", str(fps),
+            "-i", "-",
+        ]
+        encode_args = [*X264_ENCODE_ARGS, "-b:v", bitrate]
+
         try:
-            # ===== Pass 1: 分析阶段 =====
+            # ===== Pass 1: 分析阶段（帧数据来自 stdin） =====
             pass1_cmd = [
                 self._ffmpeg_path,
                 "-hide_banner",
-                "-framerate", str(fps),
-                "-i", input_pattern,
-                "-c:v", "libx264",
-                "-profile:v", "high",
-                "-level", "4.0",
-                "-pix_fmt", "yuv420p",
-                "-b:v", bitrate,
+                *raw_input_args,
+                *encode_args,
                 "-pass", "1",
                 "-passlogfile", passlog_prefix,
                 "-an",
@@ -394,107 +899,50 @@ class ExportWorker(QThread):
                 "-y",
                 os.devnull
             ]
-            
+
             logger.info(f"执行ffmpeg 2pass第一遍: {' '.join(pass1_cmd)}")
 
-            popen_kwargs = {
-                'stdout': subprocess.PIPE,
-                'stderr': subprocess.PIPE,
-                'encoding': 'utf-8',
-                'errors': 'replace'
-            }
-            if sys.platform == 'win32':
-                popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-
-            self._ffmpeg_process = subprocess.Popen(pass1_cmd, **popen_kwargs)
-
-            # 使用 communicate(timeout) 循环等待进程完成
-            # Python文档警告: 使用 poll() + PIPE 会导致死锁，必须用 communicate()
-            # https://docs.python.org/3/library/subprocess.html#subprocess.Popen.wait
-            stdout, stderr = "", ""
-            while True:
-                try:
-                    out, err = self._ffmpeg_process.communicate(timeout=0.5)
-                    stdout = out or ""
-                    stderr = err or ""
-                    break  # 进程已结束
-                except subprocess.TimeoutExpired:
-                    # 进程仍在运行，检查取消标志
-                    if self._cancelled:
-                        self._ffmpeg_process.kill()
-                        self._ffmpeg_process.communicate()  # 清理管道
-                        self._ffmpeg_process = None
-                        raise InterruptedError("导出已取消")
-                    # 继续等待
+            self._start_ffmpeg(pass1_cmd, stdin=subprocess.PIPE)
+            frames_written = self._pipe_frames(make_frames(True), "2pass第一遍")
 
-            returncode = self._ffmpeg_process.returncode
-            self._ffmpeg_process = None
+            # communicate() 会关闭 stdin，FFmpeg 随即结束分析
+            self._wait_ffmpeg("2pass第一遍")
 
-            if returncode != 0:
-                stderr_msg = stderr[-500:] if stderr else "未知错误"
-                logger.error(f"ffmpeg pass1 stderr: {stderr}")
-                raise RuntimeError(f"ffmpeg 2pass第一遍失败 (code {returncode}): {stderr_msg}")
-            
             # ===== 两个pass之间检查取消 =====
             if self._cancelled:
                 raise InterruptedError("导出已取消")
-            
-            # ===== Pass 2: 编码阶段 =====
+
+            if on_pass2 is not None:
+                on_pass2()
+
+            # ===== Pass 2: 编码阶段（重新生成帧送入 stdin） =====
             pass2_cmd = [
                 self._ffmpeg_path,
                 "-hide_banner",
-                "-framerate", str(fps),
-                "-i", input_pattern,
-                "-c:v", "libx264",
-                "-profile:v", "high",
-                "-level", "4.0",
-                "-pix_fmt", "yuv420p",
-                "-b:v", bitrate,
+                *raw_input_args,
+                *encode_args,
                 "-pass", "2",
                 "-passlogfile", passlog_prefix,
                 "-an",
                 "-y",
                 output_file
             ]
-            
-            logger.info(f"执行ffmpeg 2pass第二遍: {' '.join(pass2_cmd)}")
-
-            popen_kwargs2 = {
-                'stdout': subprocess.PIPE,
-                'stderr': subprocess.PIPE,
-                'encoding': 'utf-8',
-                'errors': 'replace'
-            }
-            if sys.platform == 'win32':
-                popen_kwargs2['creationflags'] = subprocess.CREATE_NO_WINDOW
 
-            self._ffmpeg_process = subprocess.Popen(pass2_cmd, **popen_kwargs2)
+            logger.info(f"执行ffmpeg 2pass第二遍: {' '.join(pass2_cmd)}")
 
-            # 使用 communicate(timeout) 循环等待进程完成
-            stdout, stderr = "", ""
-            while True:
-                try:
-                    out, err = self._ffmpeg_process.communicate(timeout=0.5)
-                    stdout = out or ""
-                    stderr = err or ""
-                    break
-                except subprocess.TimeoutExpired:
-                    if self._cancelled:
-                        self._ffmpeg_process.kill()
-                        self._ffmpeg_process.communicate()  # 清理管道
-                        self._ffmpeg_process = None
-                        raise InterruptedError("导出已取消")
+            # 与第一遍的处理进度一致，每 10 帧报告一次
+            def report_pass2(frame: int):
+                if frame % 10 == 0:
+                    on_progress(min(frame, frames_written) / frames_written)
 
-            returncode = self._ffmpeg_process.returncode
-            self._ffmpeg_process = None
+            self._start_ffmpeg(pass2_cmd, stdin=subprocess.PIPE)
+            self._pipe_frames(make_frames(False), "2pass第二遍",
+                              report_pass2 if on_progress else None)
+            self._wait_ffmpeg("2pass第二遍")
 
-            if returncode != 0:
-                stderr_msg = stderr[-500:] if stderr else "未知错误"
-                logger.error(f"ffmpeg pass2 stderr: {stderr}")
-                raise RuntimeError(f"ffmpeg 2pass第二遍失败 (code {returncode}): {stderr_msg}")
-                
             logger.info("2pass编码完成")
-            
+            return frames_written
+
         finally:
             # 确保进程引用被清理
             self._ffmpeg_process = None
@@ -503,7 +951,7 @@ class ExportWorker(QThread):
             for f in glob.glob(f"{passlog_prefix}*.log*"):
                 try:
                     os.remove(f)
-                    logger.debug(f"已清理临时文件: {f}")
+                    logger.debug("已清理临时文件: %s", f)
                 except OSError:
                     pass
 
@@ -549,45 +997,33 @@ class ExportWorker(QThread):
                 padding = np.zeros((pad_h, target_w, 3), dtype=np.uint8)
                 frame = np.vstack([frame, padding])
 
-        temp_dir = os.path.join(self._output_dir, "_temp_frames").replace("\\", "/")
-        os.makedirs(temp_dir, exist_ok=True)
-
-        try:
-            # 生成30帧（1秒@30fps）
-            fps = 30.0
-            total_frames = 30
+        # 生成30帧（1秒@30fps）
+        fps = 30.0
+        total_frames = 30
 
+        def iter_frames(report_progress: bool):
             for frame_idx in range(total_frames):
-                if self._cancelled:
-                    raise InterruptedError("导出已取消")
-
-                frame_path = os.path.join(temp_dir, f"frame_{frame_idx:06d}.png").replace("\\", "/")
-                success, encoded = cv2.imencode('.png', frame)
-                if success:
-                    with open(frame_path, 'wb') as f:
-                        f.write(encoded.tobytes())
-
-                if frame_idx % 10 == 0:
+                if report_progress and frame_idx % 10 == 0:
                     progress = base_progress + int((frame_idx / total_frames) * 50 / total_tasks)
-                    self.progress_updated.emit(progress, f"生成帧 {frame_idx}/{total_frames}")
-
-            logger.info(f"成功生成 {total_frames} 帧")
-
-            # 使用2pass ffmpeg编码
-            self.progress_updated.emit(base_progress + 50, "正在编码视频(2pass)...")
-            input_pattern = f"{temp_dir}/frame_%06d.png"
-            output_file = output_path.replace("\\", "/")
-
-            self._run_ffmpeg_2pass(
-                input_pattern=input_pattern,
-                output_file=output_file,
-                fps=fps,
-                bitrate="3000k"
-            )
-
-        finally:
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+                    self.signals.progress_updated.emit(progress, f"生成帧 {frame_idx}/{total_frames}")
+                yield frame
+
+        # 使用2pass ffmpeg编码
+        out_h, out_w = frame.shape[:2]
+        self._encode_frames(
+            make_frames=iter_frames,
+            width=out_w,
+            height=out_h,
+            output_file=output_path.replace("\\", "/"),
+            fps=fps,
+            bitrate="3000k",
+            on_pass2=lambda: self.signals.progress_updated.emit(
+                base_progress + 50, "正在编码视频(2pass)..."),
+            on_progress=lambda fraction: self.signals.progress_updated.emit(
+                base_progress + 50 + int(fraction * 50 / total_tasks),
+                f"正在编码视频(2pass) {int(fraction * 100)}%"),
+        )
+        logger.info(f"成功生成 {total_frames} 帧")
 
     def _generate_epconfig(self):
         """生成epconfig.json"""
@@ -597,8 +1033,10 @@ class ExportWorker(QThread):
         config_path = os.path.join(self._output_dir, "epconfig.json")
         try:
             config_dict = self._epconfig.to_dict(normalize_paths=True)
+            # 先在内存中序列化完整内容再一次写入；json.dump 会按片段多次调用 write
+            content = json.dumps(config_dict, ensure_ascii=False, indent=4)
             with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, ensure_ascii=False, indent=4)
+                f.write(content)
             logger.info(f"已生成配置: {config_path}")
         except Exception as e:
             logger.error(f"生成epconfig.json失败: {e}")
@@ -619,7 +1057,8 @@ class ExportService(QObject):
 
     @property
     def is_exporting(self) -> bool:
-        return self._worker is not None and self._worker.isRunning()
+        # 任务结束时（完成或失败信号）才清空 _worker
+        return self._worker is not None
 
     @property
     def ffmpeg_available(self) -> bool:
@@ -629,42 +1068,7 @@ class ExportService(QObject):
 
     def _find_ffmpeg(self) -> str:
         """查找ffmpeg（支持打包环境）"""
-        # 1. 先在应用程序目录查找（支持 Nuitka/PyInstaller 打包）
-        app_ffmpeg = os.path.join(get_app_dir(), "ffmpeg.exe")
-        if os.path.isfile(app_ffmpeg):
-            return app_ffmpeg
-
-        # 2. 在 ffmpeg 目录中查找
-        ffmpeg_dir_ffmpeg = os.path.join(get_app_dir(), "ffmpeg", "ffmpeg.exe")
-        if os.path.isfile(ffmpeg_dir_ffmpeg):
-            return ffmpeg_dir_ffmpeg
-
-        # 3. 在当前工作目录查找
-        local_ffmpeg = os.path.join(os.getcwd(), "ffmpeg.exe")
-        if os.path.isfile(local_ffmpeg):
-            return local_ffmpeg
-
-        # 4. 在系统 PATH 中查找（使用 where 命令）
-        try:
-            cmd = ["where", "ffmpeg"] if os.name == 'nt' else ["which", "ffmpeg"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except Exception:
-            pass
-
-        # 5. 直接检查系统 PATH 环境变量中的路径
-        try:
-            path_env = os.environ.get("PATH", "")
-            paths = path_env.split(os.pathsep)
-            for path in paths:
-                ffmpeg_path = os.path.join(path, "ffmpeg.exe")
-                if os.path.isfile(ffmpeg_path):
-                    return ffmpeg_path
-        except Exception:
-            pass
-
-        return ""
+        return _locate_ffmpeg()
 
     def export_all(
         self,
@@ -747,8 +1151,8 @@ class ExportService(QObject):
             self.export_failed.emit("没有需要导出的内容")
             return
 
-        # 启动工作线程
-        self._worker = ExportWorker(self)
+        # 提交到全局线程池执行
+        self._worker = ExportWorker()
         self._worker.setup(
             tasks=tasks,
             output_dir=output_dir,
@@ -757,15 +1161,17 @@ class ExportService(QObject):
             resolution=resolution
         )
 
-        self._worker.progress_updated.connect(self.progress_updated.emit)
-        self._worker.export_completed.connect(self._on_completed)
-        self._worker.export_failed.connect(self._on_failed)
+        # 工作线程的信号总是跨线程到达，显式排队连接；服务自身信号在 GUI 线程内直接连接下游
+        queued = Qt.ConnectionType.QueuedConnection
+        self._worker.signals.progress_updated.connect(self.progress_updated, queued)
+        self._worker.signals.export_completed.connect(self._on_completed, queued)
+        self._worker.signals.export_failed.connect(self._on_failed, queued)
 
-        self._worker.start()
+        QThreadPool.globalInstance().start(self._worker)
 
     def cancel(self):
         """取消导出"""
-        if self._worker and self._worker.isRunning():
+        if self._worker:
             self._worker.cancel()
 
     def _on_completed(self, message: str):
@@ -777,7 +1183,5 @@ class ExportService(QObject):
         self._cleanup()
 
     def _cleanup(self):
-        if self._worker:
-            # 不阻塞主线程，让工作线程自然结束
-            self._worker.deleteLater()
-            self._worker = None
+        # 任务对象由线程池在 run() 返回后回收（autoDelete），这里只释放引用
+        self._worker = None
@@ -1,8 +1,10 @@
 """
 图片处理器 - 图片缩放、旋转和格式转换
 """
+import io
 import os
 import logging
+from collections import OrderedDict
 from typing import Optional, Tuple
 
 import numpy as np
@@ -26,17 +28,42 @@ from config.constants import (
 
 logger = logging.getLogger(__name__)
 
+# 图片信息缓存：(路径, 修改时间, 文件大小) -> 信息字典；文件被改写后键随之变化
+_IMAGE_INFO_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+IMAGE_INFO_CACHE_SIZE = 64
+
+# Pillow 图像模式 -> cv2.IMREAD_UNCHANGED 解码得到的通道数（与完整解码时的结果保持一致）；
+# 调色板图像解码为 BGR，带透明色时为 BGRA，见 _read_image_header
+_PIL_MODE_CHANNELS = {
+    "1": 1, "L": 1, "I": 1, "I;16": 1, "F": 1,
+    "LA": 4, "PA": 4,
+    "P": 3, "RGB": 3, "CMYK": 3, "YCbCr": 3,
+    "RGBA": 4,
+}
+
+
+def _interpolation_for(src_w: int, src_h: int, dst_w: int, dst_h: int) -> int:
+    """缩小时用 INTER_AREA（更快且不产生摩尔纹），放大时保持 OpenCV 默认的双线性"""
+    if dst_w < src_w and dst_h < src_h:
+        return cv2.INTER_AREA
+    return cv2.INTER_LINEAR
+
 
 class ImageProcessor:
     """图片处理器"""
 
     @staticmethod
-    def load_image(path: str) -> Optional[np.ndarray]:
+    def load_image(
+        path: str,
+        min_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[np.ndarray]:
         """
         加载图片为numpy数组 (BGR/BGRA格式)
 
         Args:
             path: 图片路径
+            min_size: 调用方最终需要的 (宽, 高)；给出时，远大于该尺寸的 JPEG
+                会直接以 1/2、1/4 或 1/8 分辨率解码，且保证结果不小于该尺寸
 
         Returns:
             numpy数组，失败返回None
@@ -50,8 +77,12 @@ class ImageProcessor:
                 # 使用 numpy 读取文件字节，再用 cv2.imdecode 解码
                 # 这样可以避免 OpenCV 的中文路径编码问题
                 with open(path, 'rb') as f:
-                    data = np.frombuffer(f.read(), dtype=np.uint8)
-                img = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+                    raw = f.read()
+                data = np.frombuffer(raw, dtype=np.uint8)
+                flags = cv2.IMREAD_UNCHANGED
+                if min_size is not None:
+                    flags = ImageProcessor._reduced_decode_flags(raw, min_size) or flags
+                img = cv2.imdecode(data, flags)
                 if img is None:
                     raise ValueError("OpenCV无法解码图片")
                 return img
@@ -78,6 +109,34 @@ class ImageProcessor:
             logger.error(f"加载图片失败: {e}")
             return None
 
+    @staticmethod
+    def _reduced_decode_flags(raw: bytes, min_size: Tuple[int, int]) -> Optional[int]:
+        """
+        为大尺寸 JPEG 选择缩小解码标志，不适用时返回 None
+
+        只处理 JPEG：它没有 alpha 通道，IMREAD_REDUCED_COLOR_* 不会丢失信息；
+        PNG 等可能带透明度的格式仍按 IMREAD_UNCHANGED 完整解码。
+        """
+        if not HAS_PIL or not raw.startswith(b'\xff\xd8'):
+            return None
+        try:
+            # 只读取文件头获取尺寸，不解码像素
+            with Image.open(io.BytesIO(raw)) as pil_img:
+                width, height = pil_img.size
+        except Exception:
+            return None
+
+        min_w, min_h = min_size
+        for factor, flag in (
+            (8, cv2.IMREAD_REDUCED_COLOR_8),
+            (4, cv2.IMREAD_REDUCED_COLOR_4),
+            (2, cv2.IMREAD_REDUCED_COLOR_2),
+        ):
+            if width // factor >= min_w and height // factor >= min_h:
+                # 与 IMREAD_UNCHANGED 一致，不按 EXIF 方向旋转
+                return flag | cv2.IMREAD_IGNORE_ORIENTATION
+        return None
+
     @staticmethod
     def save_image(img: np.ndarray, path: str) -> bool:
         """
@@ -138,7 +197,10 @@ class ImageProcessor:
         h, w = img.shape[:2]
 
         if not keep_aspect:
-            return cv2.resize(img, (target_width, target_height))
+            return cv2.resize(
+                img, (target_width, target_height),
+                interpolation=_interpolation_for(w, h, target_width, target_height)
+            )
 
         # 计算缩放比例
         scale = max(target_width / w, target_height / h)
@@ -146,7 +208,10 @@ class ImageProcessor:
         new_h = int(h * scale)
 
         # 缩放
-        resized = cv2.resize(img, (new_w, new_h))
+        resized = cv2.resize(
+            img, (new_w, new_h),
+            interpolation=_interpolation_for(w, h, new_w, new_h)
+        )
 
         # 居中裁剪
         start_x = (new_w - target_width) // 2
@@ -165,19 +230,25 @@ class ImageProcessor:
 
     @staticmethod
     def ensure_bgra(img: np.ndarray) -> np.ndarray:
-        """确保图片为BGRA格式"""
-        if len(img.shape) == 2:
-            # 灰度图
-            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGRA) if HAS_CV2 else \
-                  np.stack([img, img, img, np.full_like(img, 255)], axis=-1)
-        elif img.shape[-1] == 3:
-            # BGR -> BGRA
-            if HAS_CV2:
-                img = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
-            else:
-                alpha = np.full((img.shape[0], img.shape[1], 1), 255, dtype=img.dtype)
-                img = np.concatenate([img, alpha], axis=-1)
-        return img
+        """确保图片为BGRA格式（已是BGRA时原样返回，不复制）"""
+        channels = 1 if img.ndim == 2 else img.shape[2]
+        if channels == 4:
+            return img
+        if HAS_CV2:
+            # 灰度图（含 HxWx1）和 BGR 都由一次 cvtColor 补出常量 255 的 alpha 通道
+            code = cv2.COLOR_GRAY2BGRA if channels == 1 else cv2.COLOR_BGR2BGRA
+            return cv2.cvtColor(img, code)
+        out = np.empty((img.shape[0], img.shape[1], 4), dtype=img.dtype)
+        out[:, :, :3] = img.reshape(img.shape[0], img.shape[1], channels)
+        out[:, :, 3] = 255
+        return out
+
+    @staticmethod
+    def _process_for_target(img: np.ndarray, target_w: int, target_h: int) -> np.ndarray:
+        """缩放到目标尺寸、统一为BGRA并旋转180度（先缩放，通道转换只处理缩小后的像素）"""
+        img = ImageProcessor.resize_image(img, target_w, target_h)
+        img = ImageProcessor.ensure_bgra(img)
+        return ImageProcessor.rotate_180(img)
 
     @staticmethod
     def process_for_logo(img: np.ndarray) -> np.ndarray:
@@ -190,13 +261,7 @@ class ImageProcessor:
         Returns:
             处理后的图片 (256x256 BGRA)
         """
-        # 缩放到Logo尺寸
-        img = ImageProcessor.resize_image(img, LOGO_WIDTH, LOGO_HEIGHT)
-        # 确保BGRA格式
-        img = ImageProcessor.ensure_bgra(img)
-        # 旋转180度
-        img = ImageProcessor.rotate_180(img)
-        return img
+        return ImageProcessor._process_for_target(img, LOGO_WIDTH, LOGO_HEIGHT)
 
     @staticmethod
     def process_for_overlay(img: np.ndarray, resolution: str = "360x640") -> np.ndarray:
@@ -211,40 +276,67 @@ class ImageProcessor:
             处理后的图片
         """
         spec = get_resolution_spec(resolution)
-        target_w = spec["width"]
-        target_h = spec["height"]
-
-        # 缩放到目标分辨率
-        img = ImageProcessor.resize_image(img, target_w, target_h)
-        # 确保BGRA格式
-        img = ImageProcessor.ensure_bgra(img)
-        # 旋转180度
-        img = ImageProcessor.rotate_180(img)
-        return img
+        return ImageProcessor._process_for_target(img, spec["width"], spec["height"])
 
     @staticmethod
     def get_image_info(path: str) -> Optional[dict]:
         """
         获取图片信息
 
+        安装了 Pillow 时只读取文件头，不解码像素；否则回退为完整解码。
+
         Args:
             path: 图片路径
 
         Returns:
             包含宽度、高度、通道数的字典
         """
-        img = ImageProcessor.load_image(path)
-        if img is None:
+        try:
+            st = os.stat(path)
+        except OSError:
             return None
-
-        h, w = img.shape[:2]
-        channels = img.shape[-1] if len(img.shape) == 3 else 1
-        has_alpha = channels == 4
-
-        return {
+        key = (path, st.st_mtime_ns, st.st_size)
+        cached = _IMAGE_INFO_CACHE.get(key)
+        if cached is not None:
+            _IMAGE_INFO_CACHE.move_to_end(key)
+            return dict(cached)
+
+        info = ImageProcessor._read_image_header(path) if HAS_PIL else None
+        if info is None:
+            img = ImageProcessor.load_image(path)
+            if img is None:
+                return None
+            h, w = img.shape[:2]
+            channels = img.shape[-1] if len(img.shape) == 3 else 1
+            info = (w, h, channels, channels == 4)
+
+        w, h, channels, has_alpha = info
+        result = {
             "width": w,
             "height": h,
             "channels": channels,
             "has_alpha": has_alpha,
             "size_str": f"{w}x{h}"
         }
+        _IMAGE_INFO_CACHE[key] = result
+        if len(_IMAGE_INFO_CACHE) > IMAGE_INFO_CACHE_SIZE:
+            _IMAGE_INFO_CACHE.popitem(last=False)
+        return dict(result)
+
+    @staticmethod
+    def _read_image_header(path: str) -> Optional[Tuple[int, int, int, bool]]:
+        """只读取文件头获取 (宽, 高, 通道数, 是否含透明度)，失败返回None"""
+        try:
+            with Image.open(path) as pil_img:
+                w, h = pil_img.size
+                mode = pil_img.mode
+                has_transparency = 'transparency' in pil_img.info
+        except Exception:
+            return None
+        channels = _PIL_MODE_CHANNELS.get(mode)
+        if channels is None:
+            # 未知模式无法确定解码后的通道数，交给完整解码
+            return None
+        if mode == "P" and has_transparency:
+            channels = 4
+        return (w, h, channels, channels == 4)
@@ -1,7 +1,10 @@
 """
 叠加UI渲染器 - 在视频帧上渲染Arknights风格的UI元素
 """
+import functools
 import logging
+import random
+from collections import OrderedDict
 from typing import Optional, Tuple
 
 import numpy as np
@@ -18,16 +21,82 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from config.epconfig import ArknightsOverlayOptions
 
 logger = logging.getLogger(__name__)
 
 
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _numba_blend_rgba(region, rgba):
+        """
+        将 RGBA 图层按 alpha 原地混合到 BGR 区域，单次遍历完成
+
+        叠加区域只有几万像素，串行遍历即可，不值得启动并行线程。
+        """
+        h, w = rgba.shape[0], rgba.shape[1]
+        for y in range(h):
+            for x in range(w):
+                a = np.uint16(rgba[y, x, 3])
+                if a == 0:
+                    continue
+                ia = 255 - a
+                for c in range(3):
+                    fg = np.uint16(rgba[y, x, 2 - c])  # RGB -> BGR
+                    bg = np.uint16(region[y, x, c])
+                    region[y, x, c] = (fg * a + bg * ia + 127) // 255
+
+
+@functools.lru_cache(maxsize=16)
+def _load_font(font_size: int):
+    """按字号加载字体，每个字号只从磁盘读取一次"""
+    try:
+        return ImageFont.truetype("arial", font_size)
+    except (IOError, OSError):
+        return ImageFont.load_default()
+
+
+# 每类渲染缓存最多保留的条目数；文字内容或分辨率变化时，旧条目按最近最少使用顺序淘汰
+RENDER_CACHE_SIZE = 8
+
+
+class _LRUCache(OrderedDict):
+    """容量有限的缓存，超出容量时丢弃最久未使用的条目"""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class OverlayRenderer:
     """叠加UI渲染器"""
 
     def __init__(self):
         self._font = cv2.FONT_HERSHEY_SIMPLEX if HAS_CV2 else None
+        # 条码宽度 -> 覆盖列（只读），每帧复用，不再重新生成随机序列
+        self._barcode_cache = _LRUCache(RENDER_CACHE_SIZE)
+        # (文字, 宽, 高, 字号, 颜色) -> 旋转后的文字图层（只读）
+        self._text_sprite_cache = _LRUCache(RENDER_CACHE_SIZE)
+        # (区域尺寸, 颜色) -> 半透明矩形使用的纯色块（只读），每帧复用
+        self._solid_cache = _LRUCache(RENDER_CACHE_SIZE)
 
     @staticmethod
     def hex_to_bgr(hex_color: str) -> Tuple[int, int, int]:
@@ -216,17 +285,35 @@ class OverlayRenderer:
         if not HAS_PIL or width <= 0 or height <= 0:
             return
 
+        # 文字图层只取决于内容和尺寸，逐帧预览时复用缓存，只做混合
+        font_size = max(8, int(font_scale))
+        key = (text, width, height, font_size, color_rgb)
+        rot_array = self._text_sprite_cache.get(key)
+        if rot_array is None:
+            rot_array = self._render_rotated_text(text, width, height, font_size, color_rgb)
+            rot_array.flags.writeable = False
+            self._text_sprite_cache[key] = rot_array
+
+        if rot_array.shape[2] == 4:
+            region = frame[y:y + rot_array.shape[0], x:x + rot_array.shape[1]]
+            if region.shape[:2] == rot_array.shape[:2]:
+                self._blend_rgba(region, rot_array)
+
+    @staticmethod
+    def _render_rotated_text(
+        text: str,
+        width: int, height: int,
+        font_size: int,
+        color_rgb: Tuple[int, int, int]
+    ) -> np.ndarray:
+        """绘制顺时针旋转90°的文字图层 (RGBA)"""
         # 旋转90°后: 原始水平文字的宽度对应旋转后的高度
         # 所以先绘制水平文字，尺寸为 (height, width)
         text_img = Image.new('RGBA', (height, width), (0, 0, 0, 0))
         draw = ImageDraw.Draw(text_img)
 
         # 使用默认字体，按比例缩放
-        font_size = max(8, int(font_scale))
-        try:
-            font = ImageFont.truetype("arial", font_size)
-        except (IOError, OSError):
-            font = ImageFont.load_default()
+        font = _load_font(font_size)
 
         draw.text((2, 0), text, fill=(*color_rgb, 255), font=font)
 
@@ -235,19 +322,29 @@ class OverlayRenderer:
 
         # 裁剪到目标尺寸
         rotated = rotated.crop((0, 0, min(rotated.width, width), min(rotated.height, height)))
+        return np.array(rotated)
 
-        # 转为 numpy array 并叠加到帧上
-        rot_array = np.array(rotated)
-        if rot_array.shape[2] == 4:
-            alpha = rot_array[:, :, 3] / 255.0
-            # RGBA -> BGR for OpenCV
-            for c in range(3):
-                bgr_c = 2 - c  # RGB -> BGR
-                region = frame[y:y + rot_array.shape[0], x:x + rot_array.shape[1], bgr_c]
-                if region.shape == alpha.shape:
-                    frame[y:y + rot_array.shape[0], x:x + rot_array.shape[1], bgr_c] = (
-                        region * (1 - alpha) + rot_array[:, :, c] * alpha
-                    ).astype(np.uint8)
+    @staticmethod
+    def _blend_rgba(region: np.ndarray, rgba: np.ndarray):
+        """将 RGBA 图层按 alpha 原地混合到 BGR 区域
+
+        使用 uint16 整数运算 (fg*a + bg*(255-a) + 127) // 255，
+        三个通道一次完成，不再逐通道生成浮点临时数组。
+        安装了 numba 时使用编译后的单次遍历版本。
+        """
+        if HAS_NUMBA:
+            _numba_blend_rgba(region, rgba)
+            return
+
+        alpha = rgba[:, :, 3:4].astype(np.uint16)
+        blended = region[:, :, :3].astype(np.uint16)
+        blended *= 255 - alpha
+        fg = rgba[:, :, 2::-1].astype(np.uint16)  # RGB -> BGR
+        fg *= alpha
+        blended += fg
+        blended += 127
+        blended //= 255
+        region[:, :, :3] = blended
 
     def _draw_transparent_rect(
         self,
@@ -256,10 +353,25 @@ class OverlayRenderer:
         color: Tuple[int, int, int],
         alpha: float = 0.5
     ):
-        """绘制半透明矩形"""
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (x, y), (x + w, y + h), color, -1)
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+        """绘制半透明矩形
+
+        只在矩形区域内与纯色块混合，不再复制整帧再整帧 addWeighted。
+        """
+        frame_h, frame_w = frame.shape[:2]
+        # 与 cv2.rectangle 一致：右下角坐标包含在内，并裁剪到帧范围
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(frame_w, x + w + 1), min(frame_h, y + h + 1)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        roi = frame[y0:y1, x0:x1]
+        key = (roi.shape, roi.dtype, color)
+        solid = self._solid_cache.get(key)
+        if solid is None:
+            solid = np.full(roi.shape, color, dtype=roi.dtype)
+            solid.flags.writeable = False
+            self._solid_cache[key] = solid
+        cv2.addWeighted(solid, alpha, roi, 1 - alpha, 0, roi)
 
     def _draw_barcode(
         self,
@@ -267,18 +379,33 @@ class OverlayRenderer:
         x: int, y: int, width: int, height: int,
         color: Tuple[int, int, int]
     ):
-        """绘制模拟条码"""
-        import random
-        random.seed(42)  # 固定种子确保条码一致
-
-        bar_x = x
-        while bar_x < x + width:
-            bar_width = random.randint(1, 3)
-            if random.random() > 0.4:  # 60%概率绘制条码线
-                cv2.rectangle(
-                    frame,
-                    (bar_x, y),
-                    (bar_x + bar_width, y + height),
-                    color, -1
-                )
-            bar_x += bar_width + random.randint(1, 2)
+        """绘制模拟条码
+
+        条码线覆盖的列一次性给出，整块按列赋值，不再逐条调用 cv2.rectangle。
+        """
+        frame_h, frame_w = frame.shape[:2]
+        columns = self._barcode_cache.get(width)
+        if columns is None:
+            columns = self._barcode_columns(width)
+            columns.flags.writeable = False
+            self._barcode_cache[width] = columns
+        columns = columns + x
+        # 与 cv2.rectangle 一样裁掉画面外的列，负索引否则会绕到画面右侧
+        columns = columns[(columns >= 0) & (columns < frame_w)]
+        y0, y1 = max(0, y), min(frame_h, y + height + 1)
+        if columns.size and y1 > y0:
+            frame[y0:y1, columns] = color
+
+    @staticmethod
+    def _barcode_columns(width: int) -> np.ndarray:
+        """按固定种子生成条码线覆盖的列（相对条码起点，与 cv2.rectangle 一样包含右边界）"""
+        rng = random.Random(42)  # 固定种子确保条码一致，且不影响全局随机数状态
+        covered = np.zeros(max(width, 0) + 4, dtype=bool)
+
+        bar_x = 0
+        while bar_x < width:
+            bar_width = rng.randint(1, 3)
+            if rng.random() > 0.4:  # 60%概率绘制条码线
+                covered[bar_x:bar_x + bar_width + 1] = True
+            bar_x += bar_width + rng.randint(1, 2)
+        return np.flatnonzero(covered)
@@ -27,19 +27,28 @@ urlopen() 会阻塞整个线程直到网络响应返回。
 - 竞速策略 (Race)：同时请求所有源，取最快成功的结果 → 用于更新检测
 - 故障转移策略 (Failover)：按优先级依次尝试 → 用于文件下载
 """
+import functools
+import hashlib
 import os
 import re
+import ssl
+import sys
 import json
 import logging
-import tempfile
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed, Future
 from typing import Optional, Tuple, List, Dict, Callable, TypeVar, Generic
 from dataclasses import dataclass
-from urllib.request import urlopen, Request
+from pathlib import Path
 
-from PyQt6.QtCore import QThread, pyqtSignal, QObject
+from PyQt6.QtCore import QRunnable, QThreadPool, pyqtSignal, QObject
+
+try:
+    from packaging.version import Version, InvalidVersion
+    HAS_PACKAGING = True
+except ImportError:
+    HAS_PACKAGING = False
 
 from config.constants import (
     GITHUB_OWNER, GITHUB_REPO,
@@ -52,6 +61,18 @@ logger = logging.getLogger(__name__)
 GITHUB_API_BASE = "https://api.github.com"
 USER_AGENT = "ArknightsPassMaker-Updater/1.0"
 
+# Release 响应缓存：保存各源的 ETag/Last-Modified 和响应内容，
+# 再次检查时发送条件请求，未变化时服务器返回 304（不计入 GitHub 未认证限额，也无响应体）
+UPDATE_CACHE_NAME = os.path.join('ArknightsPassMaker', 'update_cache.json')
+# 缓存在该时间（秒）内视为新鲜，直接使用而不发起网络请求
+UPDATE_CACHE_TTL = 10 * 60
+
+# 安装包下载每次读取的字节数
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# 下载进度信号的最小发送间隔（秒）及最小字节间隔
+PROGRESS_EMIT_INTERVAL = 0.05
+PROGRESS_EMIT_BYTES = 512 * 1024
+
 T = TypeVar('T')
 
 
@@ -66,6 +87,7 @@ class ReleaseInfo:
     download_url: str      # Direct download URL for .exe installer
     download_size: int     # File size in bytes
     html_url: str          # Web URL to release page
+    sha256: str = ""       # 安装包 SHA-256（小写十六进制，未提供时为空）
 
 
 @dataclass
@@ -82,6 +104,189 @@ class SourceResult(Generic[T]):
     response_time: float = 0.0     # 响应时间（秒）
 
 
+@functools.lru_cache(maxsize=1)
+def _release_cache_file() -> str:
+    """Release 响应缓存文件路径（LOCALAPPDATA，缺失时退回临时目录）"""
+    base_dir = os.getenv('LOCALAPPDATA')
+    if not base_dir:
+        import tempfile
+        base_dir = tempfile.gettempdir()
+    return os.path.join(base_dir, UPDATE_CACHE_NAME)
+
+
+def _load_release_cache() -> Dict[str, dict]:
+    """读取 Release 响应缓存，格式为 {url: {etag, last_modified, fetched_at, payload}}"""
+    try:
+        with open(_release_cache_file(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_release_cache(cache: Dict[str, dict]):
+    """写回 Release 响应缓存，失败时只记录日志"""
+    try:
+        cache_file = _release_cache_file()
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_path = cache_file + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.debug("写入更新缓存失败: %s", e)
+
+
+def _trim_release_payload(data: dict) -> dict:
+    """只保留解析 ReleaseInfo 所需的字段，减小缓存体积"""
+    return {
+        'tag_name': data.get('tag_name', ''),
+        'name': data.get('name'),
+        'body': data.get('body', ''),
+        'published_at': data.get('published_at', ''),
+        'html_url': data.get('html_url', ''),
+        'assets': [
+            {
+                'name': asset.get('name', ''),
+                'browser_download_url': asset.get('browser_download_url'),
+                'size': asset.get('size', 0),
+                'digest': asset.get('digest'),
+            }
+            for asset in data.get('assets', [])
+        ],
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """进程内共享的 TLS 上下文：系统证书只加载一次，检查和下载的所有请求复用"""
+    return ssl.create_default_context()
+
+
+def _open_sequential(path: str, append: bool = False):
+    """
+    以顺序写入提示打开下载文件，供系统缓存管理器按顺序访问优化
+
+    Windows 使用 CreateFileW + FILE_FLAG_SEQUENTIAL_SCAN，
+    POSIX 使用 posix_fadvise(POSIX_FADV_SEQUENTIAL)；失败时退回普通 open。
+    """
+    mode = 'ab' if append else 'wb'
+
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            import msvcrt
+            from ctypes import wintypes
+
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.CreateFileW.restype = wintypes.HANDLE
+            kernel32.CreateFileW.argtypes = [
+                wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+            ]
+            GENERIC_WRITE = 0x40000000
+            FILE_SHARE_READ = 0x00000001
+            CREATE_ALWAYS = 2
+            OPEN_ALWAYS = 4
+            FILE_ATTRIBUTE_NORMAL = 0x00000080
+            FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+            INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+            handle = kernel32.CreateFileW(
+                path, GENERIC_WRITE, FILE_SHARE_READ, None,
+                OPEN_ALWAYS if append else CREATE_ALWAYS,
+                FILE_ATTRIBUTE_NORMAL | FILE_FLAG_SEQUENTIAL_SCAN, None
+            )
+            if handle and handle != INVALID_HANDLE_VALUE:
+                try:
+                    fd = msvcrt.open_osfhandle(handle, os.O_WRONLY | (os.O_APPEND if append else 0))
+                except OSError:
+                    kernel32.CloseHandle(handle)
+                    raise
+                return os.fdopen(fd, mode)
+        except (OSError, AttributeError, ValueError) as e:
+            logger.debug("顺序写入模式打开失败，使用普通模式: %s", e)
+        return open(path, mode)
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC), 0o666)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return os.fdopen(fd, mode)
+
+
+# Release 资源中的 Windows 安装包（优先）及任意可执行文件（备选）
+_INSTALLER_ASSET_RE = re.compile(r'(?i)(setup|installer)\.exe$')
+_EXE_ASSET_RE = re.compile(r'(?i)\.exe$')
+
+# Release 说明中的 SHA-256 摘要
+_SHA256_RE = re.compile(r'(?i)\b([0-9a-f]{64})\b')
+
+
+def _find_sha256(asset: dict, body: str) -> str:
+    """
+    查找安装包的 SHA-256 摘要
+
+    优先使用 GitHub 为资源提供的 digest 字段（"sha256:<hex>"），
+    其次在 Release 说明中查找与资源同一行的摘要，或说明中唯一的摘要。
+    """
+    digest = asset.get('digest') or ''
+    if digest.lower().startswith('sha256:'):
+        return digest[7:].lower()
+
+    name = asset.get('name', '')
+    found = []
+    for line in (body or '').splitlines():
+        match = _SHA256_RE.search(line)
+        if not match:
+            continue
+        if name and name in line:
+            return match.group(1).lower()
+        found.append(match.group(1).lower())
+    return found[0] if len(set(found)) == 1 else ""
+
+# 版本号中的数字段，以及纯数字版本号（如 "v1.0.5"）
+_VERSION_PART_RE = re.compile(rb'\d+')
+_NUMERIC_VERSION_RE = re.compile(r'[vV]?\d+(?:\.\d+)*')
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_version(version_str: str) -> Tuple[int, ...]:
+    """parse_version 的缓存实现（当前版本号不变，重复比较只需查表）"""
+    # Remove 'v' prefix if present, then extract only numeric parts
+    # 版本号各段均为 ASCII 数字，按字节匹配，int() 直接解析 bytes，不再为每段创建 str
+    parts = _VERSION_PART_RE.findall(version_str.lstrip('vV').encode('ascii', 'ignore'))
+    return tuple(int(p) for p in parts)
+
+
+@functools.lru_cache(maxsize=128)
+def _pack_version(version_str: str) -> Optional[int]:
+    """
+    将版本号打包为单个整数：每段占 16 位，最多 4 段 (major, minor, patch, build)
+
+    比较两个打包值只需一次整数比较；段数超过 4 或某段超出 16 位时返回 None，
+    由调用方退回元组比较。缺省的段按 0 处理，因此 "1.0" 与 "1.0.0" 相等。
+    """
+    parts = _parse_version(version_str)
+    if len(parts) > 4 or any(p >> 16 for p in parts):
+        return None
+    packed = 0
+    for i, part in enumerate(parts):
+        packed |= part << (48 - 16 * i)
+    return packed
+
+
+@functools.lru_cache(maxsize=128)
+def _pep440_version(version_str: str):
+    """按 PEP 440 解析版本号（需要 packaging），无法解析时返回 None"""
+    try:
+        return Version(version_str.lstrip('vV'))
+    except InvalidVersion:
+        return None
+
+
 class VersionComparer:
     """Version comparison utilities"""
 
@@ -95,11 +300,7 @@ class VersionComparer:
         Returns:
             Tuple of integers, e.g., (1, 0, 4)
         """
-        # Remove 'v' prefix if present
-        version_str = version_str.lstrip('vV')
-        # Extract only numeric parts
-        parts = re.findall(r'\d+', version_str)
-        return tuple(int(p) for p in parts)
+        return _parse_version(version_str)
 
     @staticmethod
     def is_newer(remote_version: str, local_version: str) -> bool:
@@ -112,10 +313,24 @@ class VersionComparer:
         Returns:
             True if remote is newer
         """
+        if remote_version == local_version or remote_version.lstrip('vV') == local_version.lstrip('vV'):
+            return False
+
         try:
-            remote = VersionComparer.parse_version(remote_version)
-            local = VersionComparer.parse_version(local_version)
-            return remote > local
+            # 带预发布等后缀的版本号（如 "1.1.0-beta.2"）用 PEP 440 规则比较，
+            # 否则按数字段比较会把 beta.2 当作第 4 段，误判为比正式版更新
+            if HAS_PACKAGING and not (_NUMERIC_VERSION_RE.fullmatch(remote_version)
+                                      and _NUMERIC_VERSION_RE.fullmatch(local_version)):
+                remote = _pep440_version(remote_version)
+                local = _pep440_version(local_version)
+                if remote is not None and local is not None:
+                    return remote > local
+
+            remote = _pack_version(remote_version)
+            local = _pack_version(local_version)
+            if remote is not None and local is not None:
+                return remote > local
+            return VersionComparer.parse_version(remote_version) > VersionComparer.parse_version(local_version)
         except (ValueError, IndexError):
             return False
 
@@ -214,9 +429,9 @@ class MultiSourceRequestManager:
                         progress_callback(f"通过 {source.name} 连接成功")
                     return result
                 else:
-                    logger.debug(f"源 {source.name} 返回失败: {result.error}")
+                    logger.debug("源 %s 返回失败: %s", source.name, result.error)
             except Exception as e:
-                logger.debug(f"源 {source.name} 请求异常: {e}")
+                logger.debug("源 %s 请求异常: %s", source.name, e)
                 continue
 
         return SourceResult(source_name="", success=False, error="所有更新源均无法访问")
@@ -257,10 +472,10 @@ class MultiSourceRequestManager:
                     return result
                 else:
                     last_error = result.error or f"{source.name} 请求失败"
-                    logger.debug(f"源 {source.name} 失败: {last_error}")
+                    logger.debug("源 %s 失败: %s", source.name, last_error)
             except Exception as e:
                 last_error = str(e)
-                logger.debug(f"源 {source.name} 异常: {e}")
+                logger.debug("源 %s 异常: %s", source.name, e)
                 continue
 
         return SourceResult(source_name="", success=False, error=last_error)
@@ -298,88 +513,156 @@ class MultiSourceRequestManager:
             self._executor = None
 
 
-class UpdateCheckWorker(QThread):
+class UpdateCheckWorkerSignals(QObject):
+    """UpdateCheckWorker 的信号（QRunnable 不是 QObject，无法直接定义信号）"""
+
+    check_completed = pyqtSignal(object)  # ReleaseInfo or None
+    check_failed = pyqtSignal(str)        # Error message
+    check_progress = pyqtSignal(str)      # Progress message (显示当前尝试的源)
+
+
+class UpdateCheckWorker(QRunnable):
     """
-    后台更新检查工作线程（多源竞速策略）
+    后台更新检查任务（多源竞速策略），提交到 QThreadPool 执行
 
     使用 ThreadPoolExecutor 同时请求所有配置的源，
     取最快成功返回的结果，实现最低延迟的更新检测。
     """
 
-    check_completed = pyqtSignal(object)  # ReleaseInfo or None
-    check_failed = pyqtSignal(str)        # Error message
-    check_progress = pyqtSignal(str)      # Progress message (显示当前尝试的源)
-
     def __init__(
         self,
         current_version: str,
-        sources: Optional[List[UpdateSource]] = None,
-        parent=None
+        sources: Optional[List[UpdateSource]] = None
     ):
-        super().__init__(parent)
+        super().__init__()
+        self.setAutoDelete(True)
+        self.signals = UpdateCheckWorkerSignals()
         self._current_version = current_version
         self._sources = sources or UPDATE_API_SOURCES
         self._request_manager = MultiSourceRequestManager(max_workers=len(self._sources))
+        self._cache = _load_release_cache()
+        self._cache_lock = threading.Lock()
 
     def run(self):
         """使用竞速策略从多个源检查更新"""
         try:
-            result = self._request_manager.race_request(
-                sources=self._sources,
-                request_func=self._fetch_from_source,
-                progress_callback=lambda msg: self.check_progress.emit(msg)
-            )
-
-            if not result.success:
-                self.check_failed.emit(result.error or "所有源均无法访问")
-                return
-
-            release_info = result.data
-
-            # 检查是否是更新版本
-            if not VersionComparer.is_newer(release_info.version, self._current_version):
-                self.check_completed.emit(None)  # 已是最新版本
+            # 短时间内重复检查直接使用缓存，不建立网络连接
+            release_info = self._fresh_cached_release()
+
+            if release_info is None:
+                result = self._request_manager.race_request(
+                    sources=self._sources,
+                    request_func=self._fetch_from_source,
+                    progress_callback=lambda msg: self.signals.check_progress.emit(msg)
+                )
+
+                if not result.success:
+                    self.signals.check_failed.emit(result.error or "所有源均无法访问")
+                    return
+
+                release_info = result.data
+                with self._cache_lock:
+                    _save_release_cache(self._cache)
+
+            # 检查是否是更新版本（已是最新的常见情况直接比较字符串，不解析版本号）
+            if (release_info.version == self._current_version.lstrip('vV')
+                    or not VersionComparer.is_newer(release_info.version, self._current_version)):
+                self.signals.check_completed.emit(None)  # 已是最新版本
                 return
 
-            self.check_completed.emit(release_info)
+            self.signals.check_completed.emit(release_info)
 
         except Exception as e:
             logger.exception("检查更新时发生错误")
-            self.check_failed.emit(f"检查更新失败: {str(e)}")
+            self.signals.check_failed.emit(f"检查更新失败: {str(e)}")
         finally:
             self._request_manager.shutdown()
 
+    def _fresh_cached_release(self) -> Optional[ReleaseInfo]:
+        """返回 TTL 内获取过的 Release 信息，没有则返回 None"""
+        now = time.time()
+        for source in self._sources:
+            if not source.enabled:
+                continue
+            url = source.url_template.format(owner=GITHUB_OWNER, repo=GITHUB_REPO)
+            entry = self._cache.get(url)
+            if entry and now - entry.get('fetched_at', 0) < UPDATE_CACHE_TTL:
+                try:
+                    return self._parse_release_data(entry['payload'])
+                except (KeyError, ValueError):
+                    continue
+        return None
+
     def _fetch_from_source(self, source: UpdateSource) -> ReleaseInfo:
-        """从指定源获取版本信息"""
+        """从指定源获取版本信息（带 ETag 条件请求）"""
+        # urllib.request 连带 http.client/email 等模块，仅在真正联网时导入
+        from urllib.error import HTTPError
+        from urllib.request import urlopen, Request
+
         url = source.url_template.format(owner=GITHUB_OWNER, repo=GITHUB_REPO)
+        with self._cache_lock:
+            entry = self._cache.get(url)
 
         request = Request(url)
         request.add_header('User-Agent', USER_AGENT)
         request.add_header('Accept', 'application/vnd.github.v3+json')
+        # 已认证请求限额为 5000 次/小时（未认证仅 60 次）；令牌只发给 GitHub 官方 API，不经过代理源
+        token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+        if token and url.startswith(GITHUB_API_BASE + '/'):
+            request.add_header('Authorization', f'Bearer {token}')
+        if entry and 'payload' in entry:
+            if entry.get('etag'):
+                request.add_header('If-None-Match', entry['etag'])
+            if entry.get('last_modified'):
+                request.add_header('If-Modified-Since', entry['last_modified'])
 
-        with urlopen(request, timeout=source.timeout) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-        return self._parse_release_data(data)
+        try:
+            with urlopen(request, timeout=source.timeout, context=_ssl_context()) as response:
+                # json.load 直接接受字节流（按 RFC 8259 自动识别 UTF-8），无需先 decode 出中间字符串
+                data = json.load(response)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        except HTTPError as e:
+            if e.code != 304 or not entry:
+                raise
+            # 304 Not Modified：内容未变化，使用缓存的响应
+            logger.debug("源 %s 返回 304，使用缓存的 Release 信息", source.name)
+            with self._cache_lock:
+                entry['fetched_at'] = time.time()
+            return self._parse_release_data(entry['payload'])
+
+        payload = _trim_release_payload(data)
+        release_info = self._parse_release_data(payload)
+        with self._cache_lock:
+            self._cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': time.time(),
+                'payload': payload,
+            }
+        return release_info
 
     def _parse_release_data(self, data: dict) -> ReleaseInfo:
         """解析 GitHub API 响应"""
         tag_name = data.get('tag_name', '')
         version = tag_name.lstrip('vV')
 
-        # 查找 Windows 安装包
-        download_url = None
-        download_size = 0
-
+        # 查找 Windows 安装包：优先 *Setup.exe / *Installer.exe，其次任意 .exe
+        installer = None
+        fallback = None
         for asset in data.get('assets', []):
             name = asset.get('name', '')
-            if name.endswith('_Setup.exe') or name.endswith('.exe'):
-                download_url = asset.get('browser_download_url')
-                download_size = asset.get('size', 0)
+            if _INSTALLER_ASSET_RE.search(name):
+                installer = asset
                 break
+            if fallback is None and _EXE_ASSET_RE.search(name):
+                fallback = asset
 
+        asset = installer or fallback
+        download_url = asset.get('browser_download_url') if asset else None
         if not download_url:
             raise ValueError("未找到Windows安装包")
+        download_size = asset.get('size', 0)
 
         return ReleaseInfo(
             version=version,
@@ -389,34 +672,42 @@ class UpdateCheckWorker(QThread):
             published_at=data.get('published_at', ''),
             download_url=download_url,
             download_size=download_size,
-            html_url=data.get('html_url', '')
+            html_url=data.get('html_url', ''),
+            sha256=_find_sha256(asset, data.get('body', ''))
         )
 
 
-class UpdateDownloadWorker(QThread):
+class UpdateDownloadWorkerSignals(QObject):
+    """UpdateDownloadWorker 的信号"""
+
+    progress_updated = pyqtSignal(int, str)   # (percentage, message)
+    download_completed = pyqtSignal(str)       # Downloaded file path
+    download_failed = pyqtSignal(str)          # Error message
+
+
+class UpdateDownloadWorker(QRunnable):
     """
-    后台下载工作线程（多源故障转移策略）
+    后台下载任务（多源故障转移策略），提交到 QThreadPool 执行
 
     按优先级依次尝试各下载源，适合大文件下载，
     避免竞速策略带来的带宽浪费。
     """
 
-    progress_updated = pyqtSignal(int, str)   # (percentage, message)
-    download_completed = pyqtSignal(str)       # Downloaded file path
-    download_failed = pyqtSignal(str)          # Error message
-
     def __init__(
         self,
         release_info: ReleaseInfo,
-        sources: Optional[List[UpdateSource]] = None,
-        parent=None
+        sources: Optional[List[UpdateSource]] = None
     ):
-        super().__init__(parent)
+        super().__init__()
+        self.setAutoDelete(True)
+        self.signals = UpdateDownloadWorkerSignals()
         self._release_info = release_info
         self._sources = sources or DOWNLOAD_SOURCES
         self._cancelled = threading.Event()
         self._request_manager = MultiSourceRequestManager(max_workers=1)
         self._current_source_name = ""
+        # 最新进度 (percentage, message)，按字节间隔覆盖更新，信号处理函数可直接读取
+        self.latest_progress: Tuple[int, str] = (0, "")
 
     def cancel(self):
         """取消下载"""
@@ -432,19 +723,19 @@ class UpdateDownloadWorker(QThread):
             result = self._request_manager.failover_request(
                 sources=download_sources,
                 request_func=self._download_from_source,
-                progress_callback=lambda msg: self.progress_updated.emit(0, msg)
+                progress_callback=lambda msg: self.signals.progress_updated.emit(0, msg)
             )
 
             if not result.success:
-                self.download_failed.emit(result.error or "所有下载源均失败")
+                self.signals.download_failed.emit(result.error or "所有下载源均失败")
                 return
 
-            self.progress_updated.emit(100, "下载完成")
-            self.download_completed.emit(result.data)
+            self.signals.progress_updated.emit(100, "下载完成")
+            self.signals.download_completed.emit(result.data)
 
         except Exception as e:
             logger.exception("下载更新时发生错误")
-            self.download_failed.emit(f"下载失败: {str(e)}")
+            self.signals.download_failed.emit(f"下载失败: {str(e)}")
         finally:
             self._request_manager.shutdown()
 
@@ -473,6 +764,10 @@ class UpdateDownloadWorker(QThread):
 
     def _download_from_source(self, source: UpdateSource) -> str:
         """从指定源下载文件"""
+        import tempfile
+        from urllib.error import HTTPError
+        from urllib.request import urlopen, Request
+
         url = source.url_template
         total_size = self._release_info.download_size
 
@@ -486,51 +781,111 @@ class UpdateDownloadWorker(QThread):
         request = Request(url)
         request.add_header('User-Agent', USER_AGENT)
 
-        self.progress_updated.emit(0, f"正在从 {source.name} 下载...")
+        # 上次中断（取消、断网或换源）留下的部分文件通过 Range 请求续传；
+        # 仅在已知 SHA-256 时续传，否则无法发现拼接了错误前缀（错误页、旧版本）的文件，只能从头下载
+        expected = self._release_info.sha256
+        existing = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+        resume_from = existing if expected and 0 < existing < total_size else 0
+        if resume_from:
+            request.add_header('Range', f'bytes={resume_from}-')
 
-        try:
-            with urlopen(request, timeout=source.timeout) as response:
-                downloaded = 0
-                chunk_size = 8192  # 8KB chunks
+        self.signals.progress_updated.emit(0, f"正在从 {source.name} 下载...")
 
-                with open(output_path, 'wb') as f:
+        try:
+            with urlopen(request, timeout=source.timeout, context=_ssl_context()) as response:
+                if resume_from:
+                    if response.status != 206:
+                        # 服务器不支持续传，返回了完整文件，从头写入
+                        resume_from = 0
+                    elif not response.headers.get('Content-Range', '').startswith(
+                            f'bytes {resume_from}-'):
+                        self._discard_partial(output_path)
+                        raise IOError(f"{source.name} 返回的续传范围不匹配")
+                    else:
+                        logger.info("从 %d 字节处续传: %s", resume_from, output_path)
+
+                # 摘要随写入逐块计算，省去下载完成后再读一遍文件；续传时先补算已有部分
+                hasher = hashlib.sha256()
+                if resume_from:
+                    with open(output_path, 'rb') as existing_file:
+                        for block in iter(lambda: existing_file.read(DOWNLOAD_CHUNK_SIZE), b''):
+                            hasher.update(block)
+
+                downloaded = resume_from
+                last_update_bytes = downloaded
+                last_emit_time = 0.0
+                total_mb = total_size / (1024 * 1024)
+
+                def update_progress():
+                    percent = int((downloaded / total_size) * 100) if total_size > 0 else 50
+                    size_mb = downloaded / (1024 * 1024)
+                    if total_size > 0:
+                        msg = f"[{source.name}] 已下载 {size_mb:.1f} / {total_mb:.1f} MB"
+                    else:
+                        msg = f"[{source.name}] 已下载 {size_mb:.1f} MB"
+                    self.latest_progress = (percent, msg)
+
+                # 预分配读缓冲区，readinto 直接填充，避免每块分配新的 bytes 对象
+                # （TLS 套接字无法使用 sendfile 之类的内核拷贝）
+                buffer = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+
+                with _open_sequential(output_path, append=bool(resume_from)) as f:
                     while True:
                         if self._cancelled.is_set():
-                            f.close()
-                            if os.path.exists(output_path):
-                                os.remove(output_path)
+                            # 保留部分文件，下次下载时续传
                             raise InterruptedError("下载已取消")
 
-                        chunk = response.read(chunk_size)
-                        if not chunk:
+                        n = response.readinto(buffer)
+                        if not n:
                             break
 
+                        chunk = buffer[:n]
                         f.write(chunk)
-                        downloaded += len(chunk)
-
-                        if total_size > 0:
-                            percent = int((downloaded / total_size) * 100)
-                            size_mb = downloaded / (1024 * 1024)
-                            total_mb = total_size / (1024 * 1024)
-                            msg = f"[{source.name}] 已下载 {size_mb:.1f} / {total_mb:.1f} MB"
-                        else:
-                            percent = 50  # Unknown size
-                            size_mb = downloaded / (1024 * 1024)
-                            msg = f"[{source.name}] 已下载 {size_mb:.1f} MB"
-
-                        self.progress_updated.emit(percent, msg)
+                        hasher.update(chunk)
+                        downloaded += n
+
+                        # 每累计一段字节才刷新最新进度；跨线程信号需经过事件队列，
+                        # 距上次发送足够久时才发送，中间状态直接被后续进度覆盖
+                        if downloaded - last_update_bytes < PROGRESS_EMIT_BYTES:
+                            continue
+                        last_update_bytes = downloaded
+                        update_progress()
+
+                        now = time.monotonic()
+                        if now - last_emit_time < PROGRESS_EMIT_INTERVAL:
+                            continue
+                        last_emit_time = now
+                        self.signals.progress_updated.emit(*self.latest_progress)
+
+                # 节流可能吞掉最后一段进度，结束时无条件发送一次
+                update_progress()
+                self.signals.progress_updated.emit(*self.latest_progress)
+
+            if total_size > 0 and downloaded != total_size:
+                if downloaded > total_size:
+                    self._discard_partial(output_path)
+                raise IOError(f"下载不完整: {downloaded} / {total_size} 字节")
+
+            if expected and hasher.hexdigest() != expected:
+                self._discard_partial(output_path)
+                raise IOError(f"{source.name} 下载的文件校验失败 (SHA-256 不匹配)")
 
             return output_path
 
-        except Exception as e:
-            # 清理部分下载的文件
-            if os.path.exists(output_path):
-                try:
-                    os.remove(output_path)
-                except Exception:
-                    pass
+        except HTTPError as e:
+            # 416: 请求的续传范围无效，丢弃部分文件，下一个源从头下载
+            if e.code == 416:
+                self._discard_partial(output_path)
             raise
 
+    @staticmethod
+    def _discard_partial(output_path: str):
+        """删除无法续传的部分下载文件（不存在时忽略，不再先 exists 再 remove）"""
+        try:
+            Path(output_path).unlink(missing_ok=True)
+        except OSError:
+            pass
+
 
 class UpdateService(QObject):
     """
@@ -559,11 +914,12 @@ class UpdateService(QObject):
 
     @property
     def is_checking(self) -> bool:
-        return self._check_worker is not None and self._check_worker.isRunning()
+        # 任务结束时（完成或失败信号）才清空引用
+        return self._check_worker is not None
 
     @property
     def is_downloading(self) -> bool:
-        return self._download_worker is not None and self._download_worker.isRunning()
+        return self._download_worker is not None
 
     @property
     def latest_release(self) -> Optional[ReleaseInfo]:
@@ -574,13 +930,14 @@ class UpdateService(QObject):
         if self.is_checking:
             return
 
-        self._check_worker = UpdateCheckWorker(self._current_version, parent=self)
-        self._check_worker.check_completed.connect(self._on_check_completed)
-        self._check_worker.check_failed.connect(self._on_check_failed)
-        self._check_worker.check_progress.connect(self.check_progress.emit)
+        self._check_worker = UpdateCheckWorker(self._current_version)
+        signals = self._check_worker.signals
+        signals.check_completed.connect(self._on_check_completed)
+        signals.check_failed.connect(self._on_check_failed)
+        signals.check_progress.connect(self.check_progress)
 
         self.check_started.emit()
-        self._check_worker.start()
+        QThreadPool.globalInstance().start(self._check_worker)
 
     def download_update(self, release_info: ReleaseInfo = None):
         """开始下载更新（多源故障转移策略）"""
@@ -592,42 +949,35 @@ class UpdateService(QObject):
             self.download_failed.emit("没有可下载的更新")
             return
 
-        self._download_worker = UpdateDownloadWorker(release, parent=self)
-        self._download_worker.progress_updated.connect(self.download_progress.emit)
-        self._download_worker.download_completed.connect(self._on_download_completed)
-        self._download_worker.download_failed.connect(self._on_download_failed)
+        self._download_worker = UpdateDownloadWorker(release)
+        signals = self._download_worker.signals
+        signals.progress_updated.connect(self.download_progress)
+        signals.download_completed.connect(self._on_download_completed)
+        signals.download_failed.connect(self._on_download_failed)
 
         self.download_started.emit()
-        self._download_worker.start()
+        QThreadPool.globalInstance().start(self._download_worker)
 
     def cancel_download(self):
         """取消正在进行的下载"""
-        if self._download_worker and self._download_worker.isRunning():
+        if self._download_worker:
             self._download_worker.cancel()
 
+    # 任务对象由线程池在 run() 返回后回收（autoDelete），这里只释放引用
+
     def _on_check_completed(self, release_info: Optional[ReleaseInfo]):
         self._latest_release = release_info
+        self._check_worker = None
         self.check_completed.emit(release_info)
-        self._cleanup_check_worker()
 
     def _on_check_failed(self, error_msg: str):
+        self._check_worker = None
         self.check_failed.emit(error_msg)
-        self._cleanup_check_worker()
 
     def _on_download_completed(self, file_path: str):
+        self._download_worker = None
         self.download_completed.emit(file_path)
-        self._cleanup_download_worker()
 
     def _on_download_failed(self, error_msg: str):
+        self._download_worker = None
         self.download_failed.emit(error_msg)
-        self._cleanup_download_worker()
-
-    def _cleanup_check_worker(self):
-        if self._check_worker:
-            self._check_worker.deleteLater()
-            self._check_worker = None
-
-    def _cleanup_download_worker(self):
-        if self._download_worker:
-            self._download_worker.deleteLater()
-            self._download_worker = None
@@ -1,8 +1,4 @@
 """对话框模块"""
-from gui.dialogs.export_progress_dialog import ExportProgressDialog
-from gui.dialogs.welcome_dialog import WelcomeDialog
-from gui.dialogs.shortcuts_dialog import ShortcutsDialog
-from gui.dialogs.update_dialog import UpdateDialog
 
 __all__ = [
     'ExportProgressDialog',
@@ -10,3 +6,19 @@ __all__ = [
     'ShortcutsDialog',
     'UpdateDialog',
 ]
+
+
+def __getattr__(name: str):
+    """延迟导入：导入单个对话框子模块时不再连带加载其余对话框及其依赖"""
+    _import_map = {
+        'ExportProgressDialog': 'gui.dialogs.export_progress_dialog',
+        'WelcomeDialog': 'gui.dialogs.welcome_dialog',
+        'ShortcutsDialog': 'gui.dialogs.shortcuts_dialog',
+        'UpdateDialog': 'gui.dialogs.update_dialog',
+    }
+    if name in _import_map:
+        import importlib
+
+        module = importlib.import_module(_import_map[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
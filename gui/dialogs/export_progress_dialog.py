@@ -4,11 +4,14 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from qfluentwidgets import (
     PushButton, SubtitleLabel, BodyLabel, ProgressBar
 )
 
+# 进度刷新的最小间隔（毫秒），约 60 Hz
+PROGRESS_REFRESH_MS = 16
+
 
 class ExportProgressDialog(QDialog):
     """导出进度对话框"""
@@ -18,6 +21,12 @@ class ExportProgressDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._is_completed = False
+        # 导出线程可能逐帧发送进度，只保留最新一次，由定时器合并刷新
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_REFRESH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -56,12 +65,25 @@ class ExportProgressDialog(QDialog):
         layout.addWidget(self.btn_action)
 
     def update_progress(self, value: int, message: str):
-        """更新进度"""
+        """更新进度（合并到下一次定时刷新）"""
+        self._pending_progress = (value, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """显示最新的进度"""
+        if self._pending_progress is None:
+            return
+        value, message = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(value)
         self.label_detail.setText(message)
 
     def set_completed(self, success: bool, message: str):
         """设置完成状态"""
+        # 先应用尚未刷新的进度，避免其在完成后覆盖结果信息
+        self._progress_timer.stop()
+        self._flush_progress()
         self._is_completed = True
         self.progress_bar.setValue(100 if success else self.progress_bar.value())
         self.label_status.setText("导出完成!" if success else "导出失败")
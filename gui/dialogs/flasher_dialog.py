@@ -30,6 +30,11 @@ logger = logging.getLogger(__name__)
 MANIFEST_URL = "https://epflash.iccmc.cc/{rev}/{screen}/manifest.json"
 FLASHER_VERSION = 2
 
+# 工作线程状态消息批量写入状态框的间隔（毫秒），约 30Hz
+STATUS_FLUSH_MS = 33
+# 状态框最多保留的行数，超出后由 QTextDocument 自动丢弃最早的行
+STATUS_MAX_BLOCKS = 5000
+
 class FlasherWorker(QThread):
     """烧录工作线程"""
     
@@ -579,12 +584,20 @@ class FlasherDialog(QDialog):
         
         self.status_text = QTextEdit()
         self.status_text.setReadOnly(True)
+        self.status_text.document().setMaximumBlockCount(STATUS_MAX_BLOCKS)
         setCustomStyleSheet(
             self.status_text,
             "QTextEdit { background-color: #f8f9fa; color: #333; border: 1px solid #ddd; border-radius: 4px; padding: 10px; font-family: 'Consolas', 'Monaco', monospace; font-size: 12px; line-height: 1.4; }",
             "QTextEdit { background-color: #2b2b2b; color: #ddd; border: 1px solid #555; border-radius: 4px; padding: 10px; font-family: 'Consolas', 'Monaco', monospace; font-size: 12px; line-height: 1.4; }"
         )
         status_layout.addWidget(self.status_text)
+
+        # 工作线程的状态消息先缓存，定时一次性追加，避免每条消息都触发文档重排
+        self._pending_status = []
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(STATUS_FLUSH_MS)
+        self._status_flush_timer.timeout.connect(self._flush_status)
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)
@@ -651,6 +664,7 @@ class FlasherDialog(QDialog):
         self.start_button.setEnabled(False)
         
         # 清空状态
+        self._pending_status.clear()
         self.status_text.clear()
         self.status_text.append("=== 开始烧录流程 ===")
         
@@ -681,15 +695,31 @@ class FlasherDialog(QDialog):
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.worker.stop()
+                self._flush_status()
                 self.status_text.append("正在停止烧录...")
     
     def _on_status_update(self, message):
         """状态更新"""
-        self.status_text.append(message)
+        self._queue_status(message)
+
+    def _queue_status(self, message):
+        """缓存一条状态消息，由定时器批量写入状态框"""
+        self._pending_status.append(message)
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    def _flush_status(self):
+        """把缓存的状态消息一次性追加到状态框并滚动到底部"""
+        self._status_flush_timer.stop()
+        if not self._pending_status:
+            return
+        self.status_text.append("\n".join(self._pending_status))
+        self._pending_status.clear()
         self.status_text.verticalScrollBar().setValue(self.status_text.verticalScrollBar().maximum())
     
     def _on_error(self, error):
         """错误处理"""
+        self._flush_status()
         self.status_text.append(f"错误: {error}")
         self.status_text.append("烧录失败")
         self.start_button.setEnabled(True)
@@ -697,6 +727,7 @@ class FlasherDialog(QDialog):
     
     def _on_finished(self):
         """烧录完成"""
+        self._flush_status()
         self.status_text.append("=== 烧录完成 ===")
         self.status_text.append("设备正在重启，请耐心等待...")
         self.start_button.setEnabled(True)
@@ -838,6 +869,7 @@ class FlasherDialog(QDialog):
             
             # 禁用按钮
             self.update_firmware_button.setEnabled(False)
+            self._pending_status.clear()
             self.status_text.clear()
             self.status_text.append("=== 开始更新固件 ===")
             
@@ -855,16 +887,16 @@ class FlasherDialog(QDialog):
     
     def _on_update_progress(self, message, progress):
         """更新进度"""
-        self.status_text.append(message)
+        self._queue_status(message)
         self.progress_bar.setValue(progress)
     
     def _on_update_status(self, message):
         """更新状态"""
-        self.status_text.append(message)
-        self.status_text.verticalScrollBar().setValue(self.status_text.verticalScrollBar().maximum())
+        self._queue_status(message)
     
     def _on_update_error(self, error):
         """更新错误"""
+        self._flush_status()
         self.status_text.append(f"错误: {error}")
         self.status_text.append("更新失败")
         self.update_firmware_button.setEnabled(True)
@@ -872,6 +904,7 @@ class FlasherDialog(QDialog):
     
     def _on_update_finished(self):
         """更新完成"""
+        self._flush_status()
         self.status_text.append("=== 更新完成 ===")
         self.status_text.append("固件已更新到最新版本！")
         self.progress_bar.setValue(100)
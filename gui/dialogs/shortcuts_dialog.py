@@ -93,6 +93,8 @@ class ShortcutsDialog(QDialog):
             ("Space", "播放/暂停视频"),
             ("←", "上一帧"),
             ("→", "下一帧"),
+            ("Shift+←", "后退10帧"),
+            ("Shift+→", "前进10帧"),
             ("W", "向上移动裁剪框"),
             ("S", "向下移动裁剪框"),
             ("A", "向左移动裁剪框"),
@@ -7,7 +7,7 @@ from gui.widgets.timeline import TimelineWidget
 from gui.widgets.transition_preview import TransitionPreviewWidget
 from gui.widgets.video_preview import VideoPreviewWidget
 from gui.widgets.config_panel import ConfigPanel
-from config.constants import APP_NAME, APP_VERSION, get_resolution_spec
+from config.constants import APP_NAME, APP_VERSION, LOGO_WIDTH, LOGO_HEIGHT, get_resolution_spec
 from config.epconfig import EPConfig
 from qfluentwidgets import (
     PushButton, PrimaryPushButton, ToolButton,
@@ -26,7 +26,10 @@ from PyQt6.QtWidgets import (
     QGroupBox, QCheckBox, QComboBox, QDoubleSpinBox,
     QSpinBox, QLineEdit
 )
-from PyQt6.QtCore import Qt, QSettings, QTimer, QUrl, QCoreApplication
+from PyQt6.QtCore import (
+    Qt, QSettings, QTimer, QUrl, QCoreApplication,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
 import os
 import sys
 import logging
@@ -36,6 +39,65 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# 用户配置目录（config/user_settings.json 所在目录），导入时计算一次
+_CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config")
+
+# 时间轴控制信号与预览器槽的对应关系；槽为 None 的信号连接到需要参数的 lambda
+_TIMELINE_PREVIEW_SLOTS = (
+    ('play_pause_clicked', 'toggle_play'),
+    ('seek_requested', 'seek_to_frame'),
+    ('prev_frame_clicked', 'prev_frame'),
+    ('next_frame_clicked', 'next_frame'),
+    ('goto_start_clicked', None),
+    ('goto_end_clicked', None),
+    ('rotation_clicked', 'rotate_clockwise'),
+)
+
+# 主题颜色相关样式表模板，模块导入时构建一次，切换颜色时只做格式化
+# 标题栏样式表：Logo 与窗口控制按钮的规则也放在这里，整个标题栏只解析一份样式
+_HEADER_BAR_QSS = (
+    "QWidget {{ background-color: {color}; color: white; }} "
+    "QLabel {{ font-weight: bold; font-size: 16px; }} "
+    "QLabel#header_logo {{ background-color: white; color: #ff6b8b; border-radius: 16px; "
+    "padding: 8px 12px; font-size: 14px; font-weight: bold; }} "
+    "QPushButton#btn_minimize, QPushButton#btn_maximize, QPushButton#btn_close {{ "
+    "background-color: transparent; color: white; border: none; border-radius: 18px; "
+    "font-size: 20px; font-weight: bold; padding: 0; margin: 0; }} "
+    "QPushButton#btn_maximize {{ font-size: 16px; }} "
+    "QPushButton#btn_minimize:hover, QPushButton#btn_maximize:hover, QPushButton#btn_close:hover {{ "
+    "background-color: rgba(255, 255, 255, 0.2); }} "
+    "QPushButton#btn_minimize:pressed, QPushButton#btn_maximize:pressed, QPushButton#btn_close:pressed {{ "
+    "background-color: rgba(255, 255, 255, 0.3); }}"
+)
+_NAV_BUTTON_QSS = "QPushButton { background-color: transparent; color: white; border: none; padding: 10px 20px; font-size: 14px; border-radius: 6px; } QPushButton:hover { background-color: rgba(255, 255, 255, 0.2); } QPushButton:pressed, QPushButton:checked { background-color: rgba(255, 255, 255, 0.3); }"
+_SIDEBAR_BUTTON_QSS = "QPushButton {{ background-color: white; color: #333333; border: 1px solid #e9ecef; border-radius: 10px; padding: 14px 20px; text-align: left; font-size: 15px; margin: 8px; }} QPushButton:hover {{ background-color: {color}20; border-color: {color}; }} QPushButton:pressed, QPushButton:checked {{ background-color: {color}; color: white; border-color: {color}; }}"
+
+
+class _ImageLoadSignals(QObject):
+    """_ImageLoadTask 的信号（QRunnable 不是 QObject，无法直接定义信号）"""
+
+    # 图片路径, 解码结果（numpy 数组，失败为 None）
+    loaded = pyqtSignal(str, object)
+
+
+class _ImageLoadTask(QRunnable):
+    """在线程池中解码图片，避免大图或慢速磁盘阻塞界面线程"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.setAutoDelete(True)
+        self.path = path
+        self.signals = _ImageLoadSignals()
+
+    def run(self):
+        import cv2
+        try:
+            img = cv2.imread(self.path, cv2.IMREAD_UNCHANGED)
+        except Exception as e:
+            logger.error(f"解码图片失败: {e}")
+            img = None
+        self.signals.loaded.emit(self.path, img)
+
 
 # Fluent Widgets导入
 
@@ -57,6 +119,7 @@ class MainWindow(QMainWindow):
         self._is_modified: bool = False
         self._temp_dir: Optional[str] = None  # 临时项目目录路径，None 表示非临时项目
         self._initializing: bool = True  # 初始化期间防护标志
+        self._theme_button_color: Optional[str] = None  # 主题颜色按钮当前显示的颜色，None 表示未设置
 
         # 为每个视频存储独立的入点/出点
         self._loop_in_out: tuple[int, int] = (0, 0)   # 循环视频的(入点, 出点)
@@ -83,6 +146,9 @@ class MainWindow(QMainWindow):
         self._recent_files = []
         self._max_recent_files = 10  # 最多保留10个最近文件
 
+        # 单次导出期间已解码的图片 {路径: ndarray}，None 表示不在导出流程中
+        self._export_image_cache: Optional[dict] = None
+
         self._setup_ui()
         self._setup_menu()
         self._setup_icon()
@@ -97,8 +163,7 @@ class MainWindow(QMainWindow):
         auto_create = True
         try:
             import json
-            config_dir = os.path.join(
-                os.path.dirname(__file__), "..", "config")
+            config_dir = _CONFIG_DIR
             config_file = os.path.join(config_dir, "user_settings.json")
             if os.path.exists(config_file):
                 with open(config_file, "r", encoding="utf-8") as f:
@@ -130,7 +195,7 @@ class MainWindow(QMainWindow):
             'favicon.ico')
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
-            logger.debug(f"已加载窗口图标: {icon_path}")
+            logger.debug("已加载窗口图标: %s", icon_path)
         else:
             logger.warning(f"窗口图标文件不存在: {icon_path}")
 
@@ -166,31 +231,19 @@ class MainWindow(QMainWindow):
         # === 顶部标题栏 ===
         self.header_bar = QWidget()
         self.header_bar.setObjectName("header_bar")
-        self.header_bar.setStyleSheet("""
-            QWidget { background-color: #ff6b8b; color: white; }
-            QLabel { font-weight: bold; font-size: 16px; }
-        """)
+        # 标题栏及其子控件的样式集中在一份样式表中，按 objectName 区分
+        self.header_bar.setStyleSheet(_HEADER_BAR_QSS.format(color="#ff6b8b"))
         header_layout = QHBoxLayout(self.header_bar)
         header_layout.setContentsMargins(20, 8, 20, 8)
         header_layout.setSpacing(24)
 
         # Logo
         logo_label = QLabel("AK")
-        logo_label.setStyleSheet("""
-            QLabel {
-                background-color: white;
-                color: #ff6b8b;
-                border-radius: 16px;
-                padding: 8px 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-        """)
+        logo_label.setObjectName("header_logo")
         header_layout.addWidget(logo_label)
 
         # 标题
         title_label = QLabel(APP_NAME)
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
         header_layout.addWidget(title_label)
 
         header_layout.addStretch()
@@ -201,73 +254,22 @@ class MainWindow(QMainWindow):
 
         # 最小化按钮
         self.btn_minimize = PushButton("−")
+        self.btn_minimize.setObjectName("btn_minimize")
         self.btn_minimize.setFixedSize(36, 36)
-        self.btn_minimize.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                padding: 0;
-                margin: 0;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.3);
-            }
-        """)
         self.btn_minimize.clicked.connect(self.showMinimized)
         control_layout.addWidget(self.btn_minimize)
 
         # 最大化按钮
         self.btn_maximize = PushButton("□")
+        self.btn_maximize.setObjectName("btn_maximize")
         self.btn_maximize.setFixedSize(36, 36)
-        self.btn_maximize.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0;
-                margin: 0;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.3);
-            }
-        """)
         self.btn_maximize.clicked.connect(self._on_maximize)
         control_layout.addWidget(self.btn_maximize)
 
         # 关闭按钮
         self.btn_close = PushButton("×")
+        self.btn_close.setObjectName("btn_close")
         self.btn_close.setFixedSize(36, 36)
-        self.btn_close.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 20px;
-                font-weight: bold;
-                padding: 0;
-                margin: 0;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.3);
-            }
-        """)
         self.btn_close.clicked.connect(self.close)
         control_layout.addWidget(self.btn_close)
 
@@ -638,8 +640,7 @@ class MainWindow(QMainWindow):
         """加载用户设置"""
         try:
             import json
-            config_dir = os.path.join(
-                os.path.dirname(__file__), "..", "config")
+            config_dir = _CONFIG_DIR
             config_file = os.path.join(config_dir, "user_settings.json")
 
             if os.path.exists(config_file):
@@ -660,9 +661,7 @@ class MainWindow(QMainWindow):
                     self.theme_combo.setCurrentText(
                         settings.get('theme', '默认'))
                 if hasattr(self, 'color_button'):
-                    theme_color = settings.get('theme_color', '#ff6b8b')
-                    self.color_button.setStyleSheet(
-                        f"background-color: {theme_color}; border: 1px solid #ddd; border-radius: 4px;")
+                    self._set_color_button_color(settings.get('theme_color', '#ff6b8b'))
                 if hasattr(self, 'image_path_label'):
                     theme_image = settings.get('theme_image', '')
                     if theme_image:
@@ -726,8 +725,7 @@ class MainWindow(QMainWindow):
             show_welcome = True
             try:
                 import json
-                config_dir = os.path.join(
-                    os.path.dirname(__file__), "..", "config")
+                config_dir = _CONFIG_DIR
                 config_file = os.path.join(config_dir, "user_settings.json")
                 if os.path.exists(config_file):
                     with open(config_file, "r", encoding="utf-8") as f:
@@ -958,7 +956,7 @@ class MainWindow(QMainWindow):
                 dst = os.path.join(dest_dir, filename)
                 if os.path.isfile(src) and not os.path.exists(dst):
                     shutil.copy2(src, dst)
-                    logger.debug(f"已迁移文件: {filename}")
+                    logger.debug("已迁移文件: %s", filename)
 
             self._cleanup_temp_dir()
             logger.info(f"已将临时项目迁移到: {dest_dir}")
@@ -1232,12 +1230,14 @@ class MainWindow(QMainWindow):
         if not dir_path:
             return
 
-        # 收集导出数据
+        # 收集导出数据（叠加图片等在收集和复制阶段都会用到，本次导出内只解码一次）
+        self._export_image_cache = {}
         try:
             export_data = self._collect_export_data()
         except Exception as e:
             logger.error(f"收集导出数据失败: {e}")
             show_error(e, "收集导出数据", self)
+            self._export_image_cache = None
             return
 
         # 处理arknights叠加的自定义图片
@@ -1252,6 +1252,8 @@ class MainWindow(QMainWindow):
             self._process_image_overlay(dir_path)
         except Exception as e:
             logger.error(f"处理 ImageOverlay 失败: {e}")
+        finally:
+            self._export_image_cache = None
 
         # 创建导出服务和进度对话框
         from core.export_service import ExportService
@@ -2711,39 +2713,35 @@ class MainWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "错误", f"帮助菜单加载失败: {str(e)}")
 
+    def _set_color_button_color(self, color_hex: str):
+        """设置主题颜色按钮的颜色，同时记录颜色值，读取时无需再解析样式表"""
+        # 颜色未变化时不重设样式表，避免重新解析样式和重绘按钮
+        if color_hex == self._theme_button_color:
+            return
+        self._theme_button_color = color_hex
+        self.color_button.setStyleSheet(
+            f"background-color: {color_hex}; border: 1px solid #ddd; border-radius: 4px;")
+
     def _open_color_dialog(self):
         """打开颜色选择器"""
         from PyQt6.QtWidgets import QColorDialog
         from PyQt6.QtGui import QColor
 
         # 获取当前按钮的背景颜色
-        current_style = self.color_button.styleSheet()
-        current_color = "#ff6b8b"  # 默认颜色
-        if "background-color: " in current_style:
-            start = current_style.find(
-                "background-color: ") + len("background-color: ")
-            # 先尝试查找 "; "（分号加空格）
-            end = current_style.find("; ", start)
-            # 如果没找到，尝试只查找 ";"（分号）
-            if end <= start:
-                end = current_style.find(";", start)
-            if end > start:
-                current_color = current_style[start:end].strip()
+        current_color = self._theme_button_color or "#ff6b8b"  # 默认颜色
 
         # 打开颜色选择器
         color = QColorDialog.getColor(QColor(current_color), self, "选择主题颜色")
         if color.isValid():
             color_hex = color.name()
-            self.color_button.setStyleSheet(
-                f"background-color: {color_hex}; border: 1px solid #ddd; border-radius: 4px;")
+            self._set_color_button_color(color_hex)
             # 自动切换到自定义主题
             self.theme_combo.setCurrentText("自定义")
 
             # 立即应用主题颜色设置
             try:
                 import json
-                config_dir = os.path.join(
-                    os.path.dirname(__file__), "..", "config")
+                config_dir = _CONFIG_DIR
                 config_file = os.path.join(config_dir, "user_settings.json")
 
                 settings = {}
@@ -2774,15 +2772,7 @@ class MainWindow(QMainWindow):
             # 收集设置
             logger.info("收集设置...")
             # 获取主题颜色
-            theme_color = "#ff6b8b"  # 默认颜色
-            if hasattr(self, 'color_button'):
-                current_style = self.color_button.styleSheet()
-                if "background-color: " in current_style:
-                    start = current_style.find(
-                        "background-color: ") + len("background-color: ")
-                    end = current_style.find(";", start)
-                    if end > start:
-                        theme_color = current_style[start:end].strip()
+            theme_color = self._theme_button_color or "#ff6b8b"  # 默认颜色
 
             # 获取主题图片
             theme_image = ""
@@ -2792,8 +2782,7 @@ class MainWindow(QMainWindow):
                 # 所以我们需要从配置文件中读取
                 try:
                     import json
-                    config_dir = os.path.join(
-                        os.path.dirname(__file__), "..", "config")
+                    config_dir = _CONFIG_DIR
                     config_file = os.path.join(
                         config_dir, "user_settings.json")
                     if os.path.exists(config_file):
@@ -2827,8 +2816,7 @@ class MainWindow(QMainWindow):
             # 保存到配置文件
             logger.info("保存到配置文件...")
             import json
-            config_dir = os.path.join(
-                os.path.dirname(__file__), "..", "config")
+            config_dir = _CONFIG_DIR
             os.makedirs(config_dir, exist_ok=True)
             config_file = os.path.join(config_dir, "user_settings.json")
             logger.info(f"配置文件路径: {config_file}")
@@ -2869,8 +2857,7 @@ class MainWindow(QMainWindow):
         # 从用户设置文件中获取自动更新设置
         try:
             import json
-            config_dir = os.path.join(
-                os.path.dirname(__file__), "..", "config")
+            config_dir = _CONFIG_DIR
             config_file = os.path.join(config_dir, "user_settings.json")
             if os.path.exists(config_file):
                 with open(config_file, "r", encoding="utf-8") as f:
@@ -2971,7 +2958,7 @@ class MainWindow(QMainWindow):
 
     def _on_startup_update_check_failed(self, error_msg: str):
         """启动时更新检查失败（静默失败）"""
-        logger.debug(f"启动时更新检查失败: {error_msg}")
+        logger.debug("启动时更新检查失败: %s", error_msg)
         if hasattr(self, '_startup_update_service'):
             self._startup_update_service.deleteLater()
             del self._startup_update_service
@@ -3145,8 +3132,7 @@ class MainWindow(QMainWindow):
         try:
             # 读取现有设置
             import json
-            config_dir = os.path.join(
-                os.path.dirname(__file__), "..", "config")
+            config_dir = _CONFIG_DIR
             config_file = os.path.join(config_dir, "user_settings.json")
 
             settings = {}
@@ -3158,16 +3144,8 @@ class MainWindow(QMainWindow):
             settings[setting_name] = value
 
             # 特殊处理：主题颜色
-            if setting_name == 'theme' and value == '自定义' and hasattr(
-                    self, 'color_button'):
-                current_style = self.color_button.styleSheet()
-                if "background-color: " in current_style:
-                    start = current_style.find(
-                        "background-color: ") + len("background-color: ")
-                    end = current_style.find("; ", start)
-                    if end > start:
-                        theme_color = current_style[start:end].strip()
-                        settings['theme_color'] = theme_color
+            if setting_name == 'theme' and value == '自定义' and self._theme_button_color:
+                settings['theme_color'] = self._theme_button_color
 
             # 保存到文件
             os.makedirs(config_dir, exist_ok=True)
@@ -3203,8 +3181,7 @@ class MainWindow(QMainWindow):
 
         try:
             import json
-            config_dir = os.path.join(
-                os.path.dirname(__file__), "..", "config")
+            config_dir = _CONFIG_DIR
             config_file = os.path.join(config_dir, "user_settings.json")
 
             settings = {}
@@ -3242,10 +3219,14 @@ class MainWindow(QMainWindow):
 
     def _apply_theme_color(self, color_hex):
         """应用主题颜色到界面"""
+        # 每次 setStyleSheet 都会重新解析样式并重绘整棵子控件树，颜色未变化时跳过
+        if color_hex == getattr(self, '_applied_theme_color', None):
+            return
+        self._applied_theme_color = color_hex
+
         # 应用主题颜色到标题栏
         if hasattr(self, 'header_bar'):
-            style = f"QWidget {{ background-color: {color_hex}; color: white; }} QLabel {{ font-weight: bold; font-size: 16px; }}"
-            self.header_bar.setStyleSheet(style)
+            self.header_bar.setStyleSheet(_HEADER_BAR_QSS.format(color=color_hex))
 
         # 应用主题颜色到导航按钮（如果存在）
         nav_buttons = [
@@ -3256,16 +3237,15 @@ class MainWindow(QMainWindow):
         for btn_name in nav_buttons:
             if hasattr(self, btn_name):
                 btn = getattr(self, btn_name)
-                style = "QPushButton { background-color: transparent; color: white; border: none; padding: 10px 20px; font-size: 14px; border-radius: 6px; } QPushButton:hover { background-color: rgba(255, 255, 255, 0.2); } QPushButton:pressed, QPushButton:checked { background-color: rgba(255, 255, 255, 0.3); }"
-                btn.setStyleSheet(style)
+                btn.setStyleSheet(_NAV_BUTTON_QSS)
 
         # 应用主题颜色到侧边栏按钮
+        style = _SIDEBAR_BUTTON_QSS.format(color=color_hex)
         for btn in [
                 self.btn_firmware,
                 self.btn_material,
                 self.btn_market,
                 self.btn_settings]:
-            style = f"QPushButton {{ background-color: white; color: #333333; border: 1px solid #e9ecef; border-radius: 10px; padding: 14px 20px; text-align: left; font-size: 15px; margin: 8px; }} QPushButton:hover {{ background-color: {color_hex}20; border-color: {color_hex}; }} QPushButton:pressed, QPushButton:checked {{ background-color: {color_hex}; color: white; border-color: {color_hex}; }}"
             btn.setStyleSheet(style)
 
         logger.info(f"应用主题颜色: {color_hex}")
@@ -3336,8 +3316,7 @@ class MainWindow(QMainWindow):
             # 立即应用主题图片设置
             try:
                 import json
-                config_dir = os.path.join(
-                    os.path.dirname(__file__), "..", "config")
+                config_dir = _CONFIG_DIR
                 config_file = os.path.join(config_dir, "user_settings.json")
 
                 settings = {}
@@ -3364,47 +3343,31 @@ class MainWindow(QMainWindow):
 
     def _connect_timeline_to_preview(self, preview: VideoPreviewWidget):
         """将时间轴连接到指定预览器"""
-        # 断开旧连接（忽略错误，因为可能没有连接）
-        try:
-            self.timeline.play_pause_clicked.disconnect()
-        except TypeError:
-            pass
-        try:
-            self.timeline.seek_requested.disconnect()
-        except TypeError:
-            pass
-        try:
-            self.timeline.prev_frame_clicked.disconnect()
-        except TypeError:
-            pass
-        try:
-            self.timeline.next_frame_clicked.disconnect()
-        except TypeError:
-            pass
-        try:
-            self.timeline.goto_start_clicked.disconnect()
-        except TypeError:
-            pass
-        try:
-            self.timeline.goto_end_clicked.disconnect()
-        except TypeError:
-            pass
-        try:
-            self.timeline.rotation_clicked.disconnect()
-        except TypeError:
-            pass
+        # 切换回已连接的预览器时只刷新时间轴显示，不再重复断开/连接信号
+        if preview is not self._timeline_preview:
+            # 断开旧连接（忽略错误，因为可能没有连接）
+            for signal_name, _ in _TIMELINE_PREVIEW_SLOTS:
+                try:
+                    getattr(self.timeline, signal_name).disconnect()
+                except TypeError:
+                    pass
 
-        # 连接新预览器
-        self.timeline.play_pause_clicked.connect(preview.toggle_play)
-        self.timeline.seek_requested.connect(preview.seek_to_frame)
-        self.timeline.prev_frame_clicked.connect(preview.prev_frame)
-        self.timeline.next_frame_clicked.connect(preview.next_frame)
-        self.timeline.goto_start_clicked.connect(
-            lambda: preview.seek_to_frame(0))
-        self.timeline.goto_end_clicked.connect(
-            lambda: preview.seek_to_frame(preview.total_frames - 1)
-        )
-        self.timeline.rotation_clicked.connect(preview.rotate_clockwise)
+            # 连接新预览器
+            for signal_name, slot_name in _TIMELINE_PREVIEW_SLOTS:
+                if slot_name is not None:
+                    getattr(self.timeline, signal_name).connect(getattr(preview, slot_name))
+            self.timeline.goto_start_clicked.connect(
+                lambda: preview.seek_to_frame(0))
+            self.timeline.goto_end_clicked.connect(
+                lambda: preview.seek_to_frame(preview.total_frames - 1)
+            )
+
+            # 连接帧变更信号
+            try:
+                preview.frame_changed.disconnect(self._on_video_frame_changed)
+            except TypeError:
+                pass
+            preview.frame_changed.connect(self._on_video_frame_changed)
 
         # 记录当前连接的预览器
         self._timeline_preview = preview
@@ -3420,13 +3383,6 @@ class MainWindow(QMainWindow):
             if hasattr(preview, 'is_playing'):
                 self.timeline.set_playing(preview.is_playing)
 
-        # 连接帧变更信号
-        try:
-            preview.frame_changed.disconnect(self._on_video_frame_changed)
-        except TypeError:
-            pass
-        preview.frame_changed.connect(self._on_video_frame_changed)
-
     def _on_video_frame_changed(self, frame):
         """视频帧变更时更新截取帧编辑页面"""
         # 如果当前在截取帧编辑标签页，自动更新图片
@@ -3533,7 +3489,7 @@ class MainWindow(QMainWindow):
             return  # 截取帧/过渡图片标签页无入点操作
 
         self.timeline.set_in_point(current_frame)
-        logger.debug(f"设置入点: {current_frame}")
+        logger.debug("设置入点: %s", current_frame)
 
     def _on_set_out_point(self):
         """设置出点为当前帧"""
@@ -3546,52 +3502,51 @@ class MainWindow(QMainWindow):
             return  # 截取帧/过渡图片标签页无出点操作
 
         self.timeline.set_out_point(current_frame)
-        logger.debug(f"设置出点: {current_frame}")
+        logger.debug("设置出点: %s", current_frame)
 
     def _load_loop_image(self, path: str):
-        """加载循环图片到预览器"""
-        import cv2
-        from PyQt6.QtGui import QImage, QPixmap
-
+        """加载循环图片到预览器（在线程池中解码，完成后回到界面线程显示）"""
         self._loop_image_path = path
         logger.info(f"加载循环图片: {path}")
 
-        # 加载图片
-        img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        # 保留任务引用，确保其信号对象在结果送达界面线程之前不被回收
+        self._loop_image_task = _ImageLoadTask(path)
+        self._loop_image_task.signals.loaded.connect(
+            self._on_loop_image_decoded, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(self._loop_image_task)
+
+    def _on_loop_image_decoded(self, path: str, img):
+        """循环图片解码完成"""
+        from PyQt6.QtGui import QImage, QPixmap
+
+        # 解码期间已切换到其他图片或已清空预览时，丢弃过期结果
+        if path != self._loop_image_path:
+            return
+
         if img is None:
             logger.error(f"无法加载图片: {path}")
-            self.video_preview.video_label.setText(f"无法加载图片: {path}")
+            self.video_preview.show_path_message("无法加载图片: ", path)
             return
 
         # 显示图片尺寸信息
         h, w = img.shape[:2]
         self.status_bar.showMessage(f"图片已加载: {w}x{h}")
 
-        # 转换为RGB显示
+        # 直接按 OpenCV 的内存布局构造 QImage，不再先用 cvtColor 整幅转换为 RGB
         if len(img.shape) == 2:
-            # 灰度图转换为RGB
-            display_img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
+            image_format = QImage.Format.Format_Grayscale8
         elif img.shape[2] == 4:
-            # BGRA转换为RGB
-            display_img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGB)
+            # 小端平台上 RGB32 的内存布局即 B,G,R,X，忽略 alpha，与原先转成 RGB 的显示一致
+            image_format = QImage.Format.Format_RGB32
         else:
-            # BGR转换为RGB
-            display_img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            image_format = QImage.Format.Format_BGR888
 
-        # 创建QPixmap并显示
-        h, w, ch = display_img.shape
-        q_image = QImage(display_img.data, w, h, ch *
-                         w, QImage.Format.Format_RGB888)
+        # 创建QPixmap并显示（fromImage 会复制像素，img 在此之前一直有效）
+        q_image = QImage(img.data, w, h, img.strides[0], image_format)
         pixmap = QPixmap.fromImage(q_image)
 
-        # 缩放到预览区域大小
-        label_size = self.video_preview.video_label.size()
-        scaled_pixmap = pixmap.scaled(
-            label_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.video_preview.video_label.setPixmap(scaled_pixmap)
+        # 交给预览组件保存未缩放画面，由它按标签大小缩放，并在窗口大小变化时重新缩放
+        self.video_preview.show_pixmap(pixmap)
 
         # 更新信息标签
         self.video_preview.info_label.setText(f"图片模式: {w}x{h}")
@@ -3847,7 +3802,8 @@ class MainWindow(QMainWindow):
             if not os.path.isabs(icon_path):
                 icon_path = os.path.join(self._base_dir, icon_path)
             if os.path.exists(icon_path):
-                logo_img = ImageProcessor.load_image(icon_path)
+                logo_img = self._load_export_image(
+                    icon_path, min_size=(LOGO_WIDTH, LOGO_HEIGHT))
                 if logo_img is not None:
                     data['logo_mat'] = ImageProcessor.process_for_logo(
                         logo_img)
@@ -3927,15 +3883,15 @@ class MainWindow(QMainWindow):
                 if not os.path.isabs(img_path):
                     img_path = os.path.join(self._base_dir, img_path)
                 if os.path.exists(img_path):
-                    overlay_img = ImageProcessor.load_image(img_path)
+                    overlay_img = self._load_export_image(img_path)
                     if overlay_img is not None:
                         # 获取目标分辨率
                         spec = get_resolution_spec(self._config.screen.value)
                         target_size = (spec['width'], spec['height'])
 
                         # 缩放到目标分辨率
-                        import cv2
-                        overlay_img = cv2.resize(overlay_img, target_size)
+                        overlay_img = ImageProcessor.resize_image(
+                            overlay_img, *target_size, keep_aspect=False)
                         data['overlay_mat'] = overlay_img
 
         return data
@@ -3972,10 +3928,12 @@ class MainWindow(QMainWindow):
                 src_path = os.path.join(self._base_dir, src_path)
 
             if os.path.exists(src_path):
-                img = ImageProcessor.load_image(src_path)
+                img = ImageProcessor.load_image(
+                    src_path, min_size=ARK_CLASS_ICON_SIZE)
                 if img is not None:
                     # 缩放到目标尺寸
-                    img = cv2.resize(img, ARK_CLASS_ICON_SIZE)
+                    img = ImageProcessor.resize_image(
+                        img, *ARK_CLASS_ICON_SIZE, keep_aspect=False)
                     # 保存到导出目录
                     dst_filename = "class_icon.png"
                     dst_path = os.path.join(output_dir, dst_filename)
@@ -3992,10 +3950,12 @@ class MainWindow(QMainWindow):
                 src_path = os.path.join(self._base_dir, src_path)
 
             if os.path.exists(src_path):
-                img = ImageProcessor.load_image(src_path)
+                img = ImageProcessor.load_image(
+                    src_path, min_size=ARK_LOGO_SIZE)
                 if img is not None:
                     # 缩放到目标尺寸
-                    img = cv2.resize(img, ARK_LOGO_SIZE)
+                    img = ImageProcessor.resize_image(
+                        img, *ARK_LOGO_SIZE, keep_aspect=False)
                     # 保存到导出目录
                     dst_filename = "ark_logo.png"
                     dst_path = os.path.join(output_dir, dst_filename)
@@ -4005,10 +3965,21 @@ class MainWindow(QMainWindow):
                             f.write(encoded.tobytes())
                         logger.info(f"已导出Logo: {dst_path}")
 
+    def _load_export_image(self, path: str, min_size=None):
+        """加载导出用图片；同一次导出中同一文件（及最小尺寸）只解码一次"""
+        from core.image_processor import ImageProcessor
+
+        cache = self._export_image_cache
+        if cache is None:
+            return ImageProcessor.load_image(path, min_size)
+        key = (path, min_size)
+        if key not in cache:
+            cache[key] = ImageProcessor.load_image(path, min_size)
+        return cache[key]
+
     def _process_image_overlay(self, output_dir: str):
         """处理 ImageOverlay 的图片导出和路径标准化"""
         from config.epconfig import OverlayType
-        from core.image_processor import ImageProcessor
         import cv2
 
         if not self._config:
@@ -4023,7 +3994,7 @@ class MainWindow(QMainWindow):
                 src_path = os.path.join(self._base_dir, src_path)
 
             if os.path.exists(src_path):
-                img = ImageProcessor.load_image(src_path)
+                img = self._load_export_image(src_path)
                 if img is not None:
                     dst_filename = "overlay.png"
                     dst_path = os.path.join(output_dir, dst_filename)
@@ -4075,6 +4046,10 @@ class MainWindow(QMainWindow):
             # 停止自动保存服务
             self._auto_save_service.stop()
 
+            # 暂停各视频预览，停止其后台解码线程（子控件收不到 closeEvent）
+            for preview in (self.video_preview, self.intro_preview, self.frame_capture_preview):
+                preview.pause()
+
             # 关闭素材商城服务
             if hasattr(self, '_market_widget'):
                 self._market_widget.shutdown()
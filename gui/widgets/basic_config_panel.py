@@ -34,6 +34,7 @@ class FluentGroupBox(QtGroupBox):
 from config.epconfig import EPConfig, ScreenType
 from config.constants import RESOLUTION_SPECS, OPERATOR_CLASS_PRESETS
 from config.operator_db import get_operator_db
+from utils.file_utils import FILE_DIALOG_OPTIONS
 
 
 class BasicConfigPanel(QWidget):
@@ -52,7 +53,9 @@ class BasicConfigPanel(QWidget):
         self._operator_db = get_operator_db()
         self._is_updating_from_db = False  # 防止循环更新
 
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
         self._connect_signals()
 
     def _setup_ui(self):
@@ -188,8 +191,8 @@ class BasicConfigPanel(QWidget):
         self.edit_ark_name.textChanged.connect(self._on_operator_name_changed)
         self.combo_ark_class.currentIndexChanged.connect(self._on_config_changed)
 
-        self.btn_validate.clicked.connect(self.validate_requested.emit)
-        self.btn_export.clicked.connect(self.export_requested.emit)
+        self.btn_validate.clicked.connect(self.validate_requested)
+        self.btn_export.clicked.connect(self.export_requested)
 
     def _on_operator_name_changed(self, text: str):
         """干员名称变更处理"""
@@ -341,7 +344,8 @@ class BasicConfigPanel(QWidget):
         
         path, _ = QFileDialog.getOpenFileName(
             self, f"选择{title}", initial_dir,
-            ";;".join(filters)
+            ";;".join(filters),
+            options=FILE_DIALOG_OPTIONS
         )
         if path:
             self.edit_loop_file.setText(path)
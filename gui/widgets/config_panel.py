@@ -62,6 +62,7 @@ from config.constants import (
     OPERATOR_CLASS_PRESETS, DEFAULT_TRANSITION_DURATION,
     microseconds_to_seconds, seconds_to_microseconds
 )
+from utils.file_utils import FILE_DIALOG_OPTIONS
 
 
 class ConfigPanel(QWidget):
@@ -83,8 +84,12 @@ class ConfigPanel(QWidget):
         self._config: Optional[EPConfig] = None
         self._base_dir: str = ""
         self._updating = False  # 防止循环更新
+        self._color_dialog: Optional[QColorDialog] = None  # 颜色选择对话框，首次取色时创建并复用
 
+        # 构建控件树期间暂停重绘，全部子控件添加完成后统一布局和绘制一次
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
         self._connect_signals()
 
     def _setup_ui(self):
@@ -544,7 +549,7 @@ class ConfigPanel(QWidget):
         self.combo_screen.currentIndexChanged.connect(self._on_config_changed)
         self.edit_icon.textChanged.connect(self._on_config_changed)
         self.btn_browse_icon.clicked.connect(lambda: self._browse_icon())
-        self.btn_capture_frame.clicked.connect(self.capture_frame_requested.emit)
+        self.btn_capture_frame.clicked.connect(self.capture_frame_requested)
 
         # 视频配置
         self.edit_loop_file.textChanged.connect(self._on_config_changed)
@@ -593,14 +598,19 @@ class ConfigPanel(QWidget):
         self.btn_img_overlay.clicked.connect(lambda: self._on_select_img_overlay())
 
         # 操作按钮
-        self.btn_validate.clicked.connect(self.validate_requested.emit)
-        self.btn_export.clicked.connect(self.export_requested.emit)
+        self.btn_validate.clicked.connect(self.validate_requested)
+        self.btn_export.clicked.connect(self.export_requested)
 
     def set_config(self, config: EPConfig, base_dir: str = ""):
         """设置配置"""
         self._config = config
         self._base_dir = base_dir
         self._updating = True
+        # 文本框的 textChanged 只连接到 _on_config_changed，批量回填期间必然被 _updating 忽略，
+        # 直接屏蔽信号，省去每个 setText 的一次信号分发
+        text_edits = self._text_edits()
+        for edit in text_edits:
+            edit.blockSignals(True)
 
         try:
             # 基本信息
@@ -686,8 +696,23 @@ class ConfigPanel(QWidget):
             self._on_overlay_type_changed()
 
         finally:
+            for edit in text_edits:
+                edit.blockSignals(False)
             self._updating = False
 
+    def _text_edits(self) -> tuple:
+        """set_config 回填的文本框（包括只读文本框）"""
+        return (
+            self.edit_uuid, self.edit_name, self.edit_description, self.edit_icon,
+            self.edit_loop_file, self.edit_intro_file,
+            self.edit_trans_in_color, self.edit_trans_in_image,
+            self.edit_trans_loop_color, self.edit_trans_loop_image,
+            self.edit_ark_name, self.edit_ark_top_left_rhodes, self.edit_ark_top_right_bar_text,
+            self.edit_ark_code, self.edit_ark_barcode, self.edit_ark_aux, self.edit_ark_staff,
+            self.edit_ark_color, self.edit_ark_class_icon, self.edit_ark_logo,
+            self.edit_img_overlay,
+        )
+
     def get_config(self) -> Optional[EPConfig]:
         """获取配置"""
         return self._config
@@ -805,7 +830,8 @@ class ConfigPanel(QWidget):
         """浏览图标文件"""
         path, _ = QFileDialog.getOpenFileName(
             self, "选择图标", self._base_dir,
-            "图片文件 (*.png *.jpg *.jpeg)"
+            "图片文件 (*.png *.jpg *.jpeg)",
+            options=FILE_DIALOG_OPTIONS
         )
         if path:
             # 如果项目目录已设置，复制文件到项目目录
@@ -844,13 +870,15 @@ class ConfigPanel(QWidget):
             # 图片模式
             path, _ = QFileDialog.getOpenFileName(
                 self, "选择循环图片", self._base_dir,
-                "图片文件 (*.png *.jpg *.jpeg)"
+                "图片文件 (*.png *.jpg *.jpeg)",
+                options=FILE_DIALOG_OPTIONS
             )
         else:
             # 视频模式
             path, _ = QFileDialog.getOpenFileName(
                 self, "选择循环视频", self._base_dir,
-                "视频文件 (*.mp4 *.avi *.mov)"
+                "视频文件 (*.mp4 *.avi *.mov)",
+                options=FILE_DIALOG_OPTIONS
             )
         if path:
             self.edit_loop_file.setText(path)
@@ -888,7 +916,8 @@ class ConfigPanel(QWidget):
         """浏览入场视频"""
         path, _ = QFileDialog.getOpenFileName(
             self, "选择入场视频", self._base_dir,
-            "视频文件 (*.mp4 *.avi *.mov)"
+            "视频文件 (*.mp4 *.avi *.mov)",
+            options=FILE_DIALOG_OPTIONS
         )
         if path:
             self.edit_intro_file.setText(path)
@@ -897,16 +926,22 @@ class ConfigPanel(QWidget):
     def _pick_color(self, edit: LineEdit):
         """选择颜色"""
         from PyQt6.QtGui import QColor as QC
-        current = QC(edit.text())
-        color = QColorDialog.getColor(current, self, "选择颜色")
-        if color.isValid():
-            edit.setText(color.name())
+        # 复用同一个对话框，避免每次取色都重新创建整套对话框控件
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("选择颜色")
+        self._color_dialog.setCurrentColor(QC(edit.text()))
+        if self._color_dialog.exec():
+            color = self._color_dialog.selectedColor()
+            if color.isValid():
+                edit.setText(color.name())
 
     def _on_select_class_icon(self):
         """选择职业图标"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择职业图标", self._base_dir,
-            "图片文件 (*.png *.jpg *.jpeg *.bmp)"
+            "图片文件 (*.png *.jpg *.jpeg *.bmp)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             # 复制到项目目录并使用相对路径
@@ -924,7 +959,8 @@ class ConfigPanel(QWidget):
         """选择Logo"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择Logo", self._base_dir,
-            "图片文件 (*.png *.jpg *.jpeg *.bmp)"
+            "图片文件 (*.png *.jpg *.jpeg *.bmp)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             # 复制到项目目录并使用相对路径
@@ -994,7 +1030,8 @@ class ConfigPanel(QWidget):
         """浏览过渡图片"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择过渡图片", self._base_dir,
-            "图片文件 (*.png *.jpg *.jpeg)"
+            "图片文件 (*.png *.jpg *.jpeg)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path and self._base_dir:
             from PyQt6.QtWidgets import QApplication
@@ -1036,7 +1073,8 @@ class ConfigPanel(QWidget):
         """选择叠加图片"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择叠加图片", self._base_dir,
-            "图片文件 (*.png *.jpg *.jpeg)"
+            "图片文件 (*.png *.jpg *.jpeg)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             rel_path = self._copy_to_project_dir(file_path, "overlay")
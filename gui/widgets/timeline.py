@@ -5,8 +5,14 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QMouseEvent, QPaintEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint, QTimer
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QMouseEvent, QPaintEvent, QPixmap, QPolygon
+
+# 拖动时间轴时合并跳转请求的间隔（毫秒），约一帧显示刷新
+SEEK_COALESCE_MS = 16
+
+# 标记局部重绘时在X方向上额外包含的像素（覆盖三角形、圆点光晕和画笔宽度）
+MARKER_REPAINT_MARGIN = 12
 
 
 class TimelineSlider(QWidget):
@@ -23,8 +29,18 @@ class TimelineSlider(QWidget):
         self._out_point = 100
         self._dragging = False
 
+        # 拖动时只发送最新且与上次不同的帧号，并按 SEEK_COALESCE_MS 合并
+        self._last_emitted_frame = -1
+        self._pending_seek = -1
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(SEEK_COALESCE_MS)
+        self._seek_timer.timeout.connect(self._flush_seek)
+
         self._margin = 10
         self._track_height = 30
+        # 轨道宽度只随控件尺寸变化，在 resizeEvent 中更新，绘制和鼠标换算时直接读取
+        self._track_width = self.width() - 2 * self._margin
 
         # 颜色
         self._bg_color = QColor(35, 35, 35)
@@ -35,6 +51,23 @@ class TimelineSlider(QWidget):
         self._current_color = QColor(255, 255, 255)  # 白色
         self._current_color_hover = QColor(86, 154, 243)  # 亮蓝色
 
+        # 绘制用的画刷和画笔只创建一次，每次重绘直接复用
+        self._track_brush = QBrush(self._track_color)
+        self._selection_brush = QBrush(self._selection_color)
+        self._in_brush = QBrush(self._in_color)
+        self._out_brush = QBrush(self._out_color)
+        self._current_brush = QBrush(self._current_color)
+        self._current_pen = QPen(self._current_color, 2)
+        self._handle_pen = QPen(self._current_color_hover, 2)
+        self._halo_pen = QPen(self._current_color_hover, 1, Qt.PenStyle.SolidLine)
+
+        # 背景和轨道只随尺寸变化，预先绘制到位图中，重绘时直接贴图
+        self._bg_pixmap = None
+
+        # 入点/出点三角形以标记尖端为原点预先构造，绘制时平移画布即可
+        self._in_triangle = QPolygon([QPoint(-8, -8), QPoint(8, -8), QPoint(0, 0)])
+        self._out_triangle = QPolygon([QPoint(-8, 8), QPoint(8, 8), QPoint(0, 0)])
+
         self.setMinimumHeight(50)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.setMouseTracking(True)
@@ -55,23 +88,35 @@ class TimelineSlider(QWidget):
         self.update()
 
     def set_current_frame(self, index: int):
-        """设置当前帧"""
+        """设置当前帧（只重绘播放头经过的竖条区域）"""
+        old_xs = (self._frame_to_x(self._current_frame),)
         self._current_frame = max(0, min(index, self._total_frames - 1))
-        self.update()
+        self._update_x_band(old_xs, (self._frame_to_x(self._current_frame),))
 
     def set_in_point(self, frame: int):
         """设置入点"""
+        old_xs = (self._frame_to_x(self._in_point), self._frame_to_x(self._out_point))
         self._in_point = max(0, min(frame, self._total_frames - 1))
         if self._in_point > self._out_point:
             self._out_point = self._in_point
-        self.update()
+        self._update_x_band(old_xs, (self._frame_to_x(self._in_point), self._frame_to_x(self._out_point)))
 
     def set_out_point(self, frame: int):
         """设置出点"""
+        old_xs = (self._frame_to_x(self._in_point), self._frame_to_x(self._out_point))
         self._out_point = max(0, min(frame, self._total_frames - 1))
         if self._out_point < self._in_point:
             self._in_point = self._out_point
-        self.update()
+        self._update_x_band(old_xs, (self._frame_to_x(self._in_point), self._frame_to_x(self._out_point)))
+
+    def _update_x_band(self, old_xs: tuple, new_xs: tuple):
+        """只重绘包含旧、新标记位置的竖条；位置都未变化时不重绘"""
+        if old_xs == new_xs:
+            return
+        xs = old_xs + new_xs
+        left = min(xs) - MARKER_REPAINT_MARGIN
+        right = max(xs) + MARKER_REPAINT_MARGIN
+        self.update(QRect(left, 0, right - left, self.height()))
 
     def get_in_point(self) -> int:
         """获取入点"""
@@ -81,16 +126,19 @@ class TimelineSlider(QWidget):
         """获取出点"""
         return self._out_point
 
+    def _frame_scale(self) -> float:
+        """每帧对应的像素宽度（只有一帧时为 0，所有标记都落在轨道起点）"""
+        if self._total_frames <= 1:
+            return 0.0
+        return self._track_width / self._safe_frame_divisor
+
     def _frame_to_x(self, frame: int) -> int:
         """帧号转X坐标"""
-        track_width = self.width() - 2 * self._margin
-        if self._total_frames <= 1:
-            return self._margin
-        return int(self._margin + (frame / self._safe_frame_divisor) * track_width)
+        return int(self._margin + frame * self._frame_scale())
 
     def _x_to_frame(self, x: int) -> int:
         """X坐标转帧号"""
-        track_width = self.width() - 2 * self._margin
+        track_width = self._track_width
         if track_width <= 0:
             return 0
         ratio = max(0, min(1, (x - self._margin) / track_width))
@@ -99,84 +147,134 @@ class TimelineSlider(QWidget):
     def paintEvent(self, event: QPaintEvent):
         """绘制"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        w, h = self.width(), self.height()
-        track_y = (h - self._track_height) // 2
-        track_width = w - 2 * self._margin
+        track_y = (self.height() - self._track_height) // 2
 
-        # 背景
-        painter.fillRect(0, 0, w, h, self._bg_color)
+        # 每次绘制只计算一次缩放比例和各标记的X坐标
+        margin = self._margin
+        scale = self._frame_scale()
+        in_x = int(margin + self._in_point * scale)
+        out_x = int(margin + self._out_point * scale)
+        cur_x = int(margin + self._current_frame * scale)
 
-        # 轨道 - 圆角矩形
-        track_rect = QRect(self._margin, track_y, track_width, self._track_height)
-        painter.setBrush(QBrush(self._track_color))
+        # 背景和轨道（缓存位图），不开抗锯齿直接贴图
+        painter.drawPixmap(0, 0, self._background_pixmap())
+
+        # 之后的圆角矩形、三角形和圆点需要抗锯齿
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(track_rect, 4, 4)
 
         # 选中范围 - 圆角矩形
         if self._total_frames > 1:
-            in_x = self._frame_to_x(self._in_point)
-            out_x = self._frame_to_x(self._out_point)
             selection_width = out_x - in_x
             if selection_width > 0:
                 selection_rect = QRect(in_x, track_y, selection_width, self._track_height)
-                painter.setBrush(QBrush(self._selection_color))
+                painter.setBrush(self._selection_brush)
                 painter.drawRoundedRect(selection_rect, 4, 4)
 
         # 入点标记 - 绿色三角形
-        in_x = self._frame_to_x(self._in_point)
-        painter.setBrush(QBrush(self._in_color))
+        painter.setBrush(self._in_brush)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPolygon([
-            QPoint(in_x - 8, track_y - 8),
-            QPoint(in_x + 8, track_y - 8),
-            QPoint(in_x, track_y)
-        ])
+        painter.translate(in_x, track_y)
+        painter.drawPolygon(self._in_triangle)
+        painter.translate(-in_x, -track_y)
 
         # 出点标记 - 红色三角形
-        out_x = self._frame_to_x(self._out_point)
-        painter.setBrush(QBrush(self._out_color))
+        painter.setBrush(self._out_brush)
         bottom_y = track_y + self._track_height
-        painter.drawPolygon([
-            QPoint(out_x - 8, bottom_y + 8),
-            QPoint(out_x + 8, bottom_y + 8),
-            QPoint(out_x, bottom_y)
-        ])
+        painter.translate(out_x, bottom_y)
+        painter.drawPolygon(self._out_triangle)
+        painter.translate(-out_x, -bottom_y)
 
         # 当前位置 - 蓝色指示器
-        cur_x = self._frame_to_x(self._current_frame)
         center_y = track_y + self._track_height // 2
         
         # 绘制垂直线条
-        painter.setPen(QPen(self._current_color, 2))
+        painter.setPen(self._current_pen)
         painter.drawLine(cur_x, track_y - 10, cur_x, track_y + self._track_height + 10)
         
         # 绘制中心圆点
-        painter.setBrush(QBrush(self._current_color))
-        painter.setPen(QPen(self._current_color_hover, 2))
+        painter.setBrush(self._current_brush)
+        painter.setPen(self._handle_pen)
         painter.drawEllipse(QPoint(cur_x, center_y), 6, 6)
         
         # 绘制外圈光晕效果
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.setPen(QPen(self._current_color_hover, 1, Qt.PenStyle.SolidLine))
+        painter.setPen(self._halo_pen)
         painter.drawEllipse(QPoint(cur_x, center_y), 9, 9)
 
+    def _background_pixmap(self) -> QPixmap:
+        """返回背景+轨道的缓存位图，尺寸或设备像素比变化时重新绘制"""
+        dpr = self.devicePixelRatioF()
+        pixmap = self._bg_pixmap
+        if (pixmap is not None and pixmap.devicePixelRatio() == dpr
+                and pixmap.deviceIndependentSize().toSize() == self.size()):
+            return pixmap
+
+        w, h = self.width(), self.height()
+        pixmap = QPixmap(round(w * dpr), round(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        painter = QPainter(pixmap)
+
+        # 背景（普通矩形填充，不需要抗锯齿）
+        painter.fillRect(0, 0, w, h, self._bg_color)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 轨道 - 圆角矩形
+        track_y = (h - self._track_height) // 2
+        track_rect = QRect(self._margin, track_y, self._track_width, self._track_height)
+        painter.setBrush(self._track_brush)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(track_rect, 4, 4)
+        painter.end()
+
+        self._bg_pixmap = pixmap
+        return pixmap
+
+    def resizeEvent(self, event):
+        """尺寸变化时更新缓存的轨道宽度，并作废背景位图"""
+        super().resizeEvent(event)
+        self._track_width = self.width() - 2 * self._margin
+        self._bg_pixmap = None
+
     def mousePressEvent(self, event: QMouseEvent):
         """鼠标按下"""
         if event.button() == Qt.MouseButton.LeftButton:
             self._dragging = True
-            self.seek_requested.emit(self._x_to_frame(int(event.position().x())))
+            # 点击总是立即跳转
+            self._seek_timer.stop()
+            self._pending_seek = -1
+            self._emit_seek(self._x_to_frame(int(event.position().x())))
 
     def mouseMoveEvent(self, event: QMouseEvent):
         """鼠标移动"""
         if self._dragging:
-            self.seek_requested.emit(self._x_to_frame(int(event.position().x())))
+            frame = self._x_to_frame(int(event.position().x()))
+            if frame == self._last_emitted_frame:
+                self._pending_seek = -1
+                return
+            self._pending_seek = frame
+            if not self._seek_timer.isActive():
+                self._seek_timer.start()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """鼠标释放"""
         if event.button() == Qt.MouseButton.LeftButton:
             self._dragging = False
+            # 松开时立即发送尚未发出的最后位置
+            self._flush_seek()
+
+    def _flush_seek(self):
+        """发送合并期间最新的跳转请求"""
+        self._seek_timer.stop()
+        if self._pending_seek >= 0:
+            frame, self._pending_seek = self._pending_seek, -1
+            self._emit_seek(frame)
+
+    def _emit_seek(self, frame: int):
+        """发送跳转请求并记录帧号"""
+        self._last_emitted_frame = frame
+        self.seek_requested.emit(frame)
 
 
 class TimelineWidget(QWidget):
@@ -202,7 +300,9 @@ class TimelineWidget(QWidget):
         self._fps = 30.0
         self._is_playing = False
 
+        self.setUpdatesEnabled(False)
         self._init_ui()
+        self.setUpdatesEnabled(True)
         self._connect_signals()
 
     def _init_ui(self):
@@ -327,16 +427,18 @@ class TimelineWidget(QWidget):
 
     def _connect_signals(self):
         """连接信号"""
-        self.btn_goto_start.clicked.connect(self.goto_start_clicked.emit)
-        self.btn_prev_frame.clicked.connect(self.prev_frame_clicked.emit)
-        self.btn_play_pause.clicked.connect(self.play_pause_clicked.emit)
-        self.btn_next_frame.clicked.connect(self.next_frame_clicked.emit)
-        self.btn_goto_end.clicked.connect(self.goto_end_clicked.emit)
-        self.btn_set_in.clicked.connect(self.set_in_point_clicked.emit)
-        self.btn_set_out.clicked.connect(self.set_out_point_clicked.emit)
-        self.timeline_slider.seek_requested.connect(self.seek_requested.emit)
-        self.btn_preview.clicked.connect(self.simulator_requested.emit)
-        self.btn_rotate.clicked.connect(self.rotation_clicked.emit)
+        self.btn_goto_start.clicked.connect(self.goto_start_clicked)
+        self.btn_prev_frame.clicked.connect(self.prev_frame_clicked)
+        self.btn_play_pause.clicked.connect(self.play_pause_clicked)
+        self.btn_next_frame.clicked.connect(self.next_frame_clicked)
+        self.btn_goto_end.clicked.connect(self.goto_end_clicked)
+        self.btn_set_in.clicked.connect(self.set_in_point_clicked)
+        self.btn_set_out.clicked.connect(self.set_out_point_clicked)
+        # 排队转发跳转请求：解码跳转帧在下一轮事件循环执行，不阻塞当前鼠标事件的处理
+        self.timeline_slider.seek_requested.connect(
+            self.seek_requested, Qt.ConnectionType.QueuedConnection)
+        self.btn_preview.clicked.connect(self.simulator_requested)
+        self.btn_rotate.clicked.connect(self.rotation_clicked)
 
     def set_total_frames(self, count: int):
         """设置总帧数"""
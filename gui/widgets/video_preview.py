@@ -2,6 +2,8 @@
 视频预览组件 - 支持视频播放和裁剪框交互
 """
 import logging
+import queue
+from collections import OrderedDict
 from typing import Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
@@ -15,8 +17,10 @@ except ImportError:
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPoint
-from PyQt6.QtGui import QImage, QPixmap, QMouseEvent, QKeyEvent
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QPoint, QPointF, QRectF
+from PyQt6.QtGui import (
+    QImage, QPixmap, QMouseEvent, QKeyEvent, QPainter, QPen, QColor, QStaticText
+)
 
 if TYPE_CHECKING:
     from config.epconfig import EPConfig
@@ -27,6 +31,90 @@ logger = logging.getLogger(__name__)
 DEFAULT_TARGET_WIDTH = 360
 DEFAULT_TARGET_HEIGHT = 640
 
+# 窗口大小变化或预览模式下裁剪框拖动停止后，以平滑插值重新缩放的延迟（毫秒）；
+# 拖动过程中先用最近邻快速缩放，停止后再换成高质量结果
+RESCALE_DELAY_MS = 100
+
+# 连续拖动/按键时裁剪框变更信号的最短发送间隔（毫秒），约 30Hz；
+# 下游会据此重新裁切并保存过渡图片，逐像素发送代价过高
+CROPBOX_EMIT_MS = 33
+
+# 按住 WASD 自动重复时合并位移的间隔（毫秒），约一帧显示刷新
+KEY_STEP_COALESCE_MS = 16
+
+# 播放时后台预解码的帧数上限；缓冲区满时解码线程等待，避免占用过多内存
+FRAME_BUFFER_SIZE = 4
+
+# 向前步进不超过该帧数时逐帧 grab（只解复用不解码）而不是重新定位，避免跳回关键帧重新解码
+FRAME_GRAB_STEP_LIMIT = 8
+# Shift+←/→ 一次步进的帧数
+FRAME_STEP_LARGE = 10
+
+# 最近显示帧缓存的内存上限（字节）；来回逐帧/小范围拖动时命中缓存，无需重新定位和解码
+FRAME_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _open_video_capture(path: str):
+    """打开视频，优先使用 FFmpeg 后端的硬件解码（NVDEC/VAAPI/D3D11 等，由 OpenCV 自动选择）
+
+    旧版 OpenCV 没有硬件加速属性，或硬件解码打开失败时，回退到默认后端。
+    """
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        try:
+            cap = cv2.VideoCapture(
+                path, cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except Exception as e:
+            logger.debug("硬件解码打开失败，回退到默认后端: %s", e)
+    return cv2.VideoCapture(path)
+
+
+class FrameProducer(QThread):
+    """播放时在后台线程顺序解码视频帧，填充有界缓冲区
+
+    界面线程的定时器只从缓冲区取帧显示，解码耗时不再阻塞事件循环。
+    运行期间由本线程独占 VideoCapture，界面线程需先 stop() 再访问。
+    """
+
+    def __init__(self, cap, start_index: int, total_frames: int):
+        super().__init__()
+        self._cap = cap
+        self._next_index = start_index
+        self._total_frames = total_frames
+        self._running = True
+        # (帧号, 帧)；读取失败时帧为 None，之后线程退出
+        self.frames: queue.Queue = queue.Queue(maxsize=FRAME_BUFFER_SIZE)
+
+    def stop(self):
+        """停止解码并等待线程退出"""
+        self._running = False
+        self.wait()
+
+    def run(self):
+        while self._running:
+            if self._next_index >= self._total_frames:
+                self._next_index = 0
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+            ret, frame = self._cap.read()
+            item = (self._next_index, frame if ret else None)
+            self._next_index += 1
+
+            # 带超时等待缓冲区空位，保证 stop() 能及时生效
+            while self._running:
+                try:
+                    self.frames.put(item, timeout=0.05)
+                    break
+                except queue.Full:
+                    continue
+
+            if not ret:
+                break
+
 
 class VideoPreviewWidget(QWidget):
     """视频预览组件，支持裁剪框交互"""
@@ -46,6 +134,23 @@ class VideoPreviewWidget(QWidget):
     DRAG_RESIZE_BL = 4  # 左下
     DRAG_RESIZE_BR = 5  # 右下
 
+    # WASD 每次按键移动裁剪框的位移 (dx, dy)，每次 10 像素
+    _KEY_STEPS = {
+        Qt.Key.Key_W: (0, -10),
+        Qt.Key.Key_S: (0, 10),
+        Qt.Key.Key_A: (-10, 0),
+        Qt.Key.Key_D: (10, 0),
+    }
+
+    # 悬停在各拖拽区域时的鼠标形状
+    _DRAG_CURSORS = {
+        DRAG_RESIZE_TL: Qt.CursorShape.SizeFDiagCursor,
+        DRAG_RESIZE_BR: Qt.CursorShape.SizeFDiagCursor,
+        DRAG_RESIZE_TR: Qt.CursorShape.SizeBDiagCursor,
+        DRAG_RESIZE_BL: Qt.CursorShape.SizeBDiagCursor,
+        DRAG_MOVE: Qt.CursorShape.SizeAllCursor,
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -58,17 +163,24 @@ class VideoPreviewWidget(QWidget):
         self.total_frames: int = 0
         self.current_frame_index: int = 0
         self.current_frame = None
+        # 下一次 cap.read() 将返回的帧号（-1 表示未知）；顺序读取时无需 cap.set 重新定位
+        self._read_index: int = -1
+        # 最近显示过的解码帧（帧号 -> 帧），按最近使用顺序排列
+        self._frame_cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._frame_cache_bytes: int = 0
 
         # 播放状态
         self.is_playing: bool = False
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._on_timer_tick)
+        self._producer: Optional[FrameProducer] = None  # 播放期间的后台解码线程
 
         # 裁剪框
         self.target_width = DEFAULT_TARGET_WIDTH
         self.target_height = DEFAULT_TARGET_HEIGHT
         self.target_aspect_ratio = self.target_width / self.target_height
-        self.cropbox = [0, 0, self.target_width, self.target_height]
+        self._min_crop_height = self._height_for_width(90)  # 最小裁剪宽度 90 对应的高度
+        self.cropbox: Tuple[int, int, int, int] = (0, 0, self.target_width, self.target_height)
 
         # 显示缩放
         self.display_scale: float = 1.0
@@ -78,8 +190,9 @@ class VideoPreviewWidget(QWidget):
         # 拖拽状态
         self.drag_mode: int = self.DRAG_NONE
         self.drag_start_pos: Optional[QPoint] = None
-        self.drag_start_cropbox: list = []
+        self.drag_start_cropbox: Tuple[int, int, int, int] = (0, 0, 0, 0)
         self.handle_size: int = 15
+        self._hover_mode: Optional[int] = None  # 当前鼠标形状对应的拖拽区域，未变化时不重设鼠标
 
         # 预览模式
         self._preview_mode: bool = False
@@ -88,6 +201,41 @@ class VideoPreviewWidget(QWidget):
 
         # 视频旋转 (0, 90, 180, 270)
         self._rotation: int = 0
+        # 最近一次旋转的 (源帧, 角度, 旋转结果)；同一帧反复重绘（如预览模式拖动裁剪框）时不再整帧旋转
+        self._rotated_cache: Optional[Tuple[np.ndarray, int, np.ndarray]] = None
+
+        # 最近一次渲染的未缩放画面（不含裁剪框），以及当前显示结果的 (标签尺寸, 缩放方式, 设备像素比)
+        self._source_pixmap: Optional[QPixmap] = None
+        self._scaled_size = None
+        # 缩放到标签大小的画面；裁剪框变化时只在它的副本上重绘叠加层，不再重新转换和缩放整帧
+        self._scaled_pixmap: Optional[QPixmap] = None
+        # 是否在画面上绘制裁剪框（仅编辑模式下的视频帧/静态图片）
+        self._overlay_visible: bool = False
+        # 旋转后视频坐标到未缩放画面坐标的变换 (缩放, X偏移, Y偏移)，静态图片有居中留黑边
+        self._overlay_transform: Tuple[float, float, float] = (1.0, 0.0, 0.0)
+        # 叠加层绘制用的画笔和颜色，创建一次后每次重绘复用
+        self._crop_pen = QPen(QColor(0, 255, 0), 2)
+        self._handle_color = QColor(255, 200, 0)
+        self._info_pen = QPen(QColor(0, 255, 0))
+        # 两行信息文字的排版缓存：文字未变化时直接复用已排版的字形，拖动时通常只有裁剪行变化
+        self._frame_info_text = QStaticText()
+        self._crop_info_text = QStaticText()
+        # 静态图片的黑色背景画布及上次放置图片的区域 (x, y, w, h)
+        self._letterbox_canvas: Optional[np.ndarray] = None
+        self._letterbox_rect = None
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.timeout.connect(self._present_pixmap)
+        self._cropbox_emit_timer = QTimer(self)
+        self._cropbox_emit_timer.setSingleShot(True)
+        self._cropbox_emit_timer.setInterval(CROPBOX_EMIT_MS)
+        self._cropbox_emit_timer.timeout.connect(self._flush_cropbox_changed)
+        # 尚未应用的 WASD 累积位移
+        self._pending_key_delta: Tuple[int, int] = (0, 0)
+        self._key_step_timer = QTimer(self)
+        self._key_step_timer.setSingleShot(True)
+        self._key_step_timer.setInterval(KEY_STEP_COALESCE_MS)
+        self._key_step_timer.timeout.connect(self._apply_key_delta)
 
         self._setup_ui()
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -140,6 +288,7 @@ class VideoPreviewWidget(QWidget):
         self.target_width = width
         self.target_height = height
         self.target_aspect_ratio = width / height
+        self._min_crop_height = self._height_for_width(90)
         if self.current_frame is not None:
             self._init_cropbox()
             self._display_frame(self.current_frame)
@@ -156,17 +305,19 @@ class VideoPreviewWidget(QWidget):
         import os
         if not os.path.exists(path):
             logger.error(f"视频文件不存在: {path}")
-            self.video_label.setText(f"文件不存在: {path}")
+            self.show_path_message("文件不存在: ", path)
             return False
 
+        # 先停止播放（及后台解码线程），再释放旧的 VideoCapture
+        self.pause()
         if self.cap is not None:
             self.cap.release()
-        self.pause()
+        self._clear_frame_cache()
 
         # 处理中文路径问题
         try:
-            # 尝试直接加载
-            self.cap = cv2.VideoCapture(path)
+            # 尝试直接加载（优先硬件解码）
+            self.cap = _open_video_capture(path)
             if not self.cap.isOpened():
                 # 如果失败，尝试使用 Unicode 路径
                 logger.warning("直接加载失败，尝试使用 Unicode 路径")
@@ -191,6 +342,7 @@ class VideoPreviewWidget(QWidget):
         self.video_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.current_frame_index = 0
+        self._read_index = 0
 
         logger.info(
             f"视频已加载: {self.video_width}x{self.video_height}, "
@@ -244,6 +396,7 @@ class VideoPreviewWidget(QWidget):
         if self.cap is not None:
             self.cap.release()
             self.cap = None
+        self._clear_frame_cache()
 
         self.video_width = frame.shape[1]
         self.video_height = frame.shape[0]
@@ -273,9 +426,14 @@ class VideoPreviewWidget(QWidget):
         y = (h - scaled_h) // 2
 
         # 设置裁剪框为缩放后的图片尺寸和位置
-        self.cropbox = [x, y, scaled_w, scaled_h]
+        self.cropbox = (x, y, scaled_w, scaled_h)
         self._emit_cropbox_changed()
 
+    def _height_for_width(self, w: int) -> int:
+        """按目标宽高比由宽度求高度，等价于 int(w / 宽高比)，用整数运算避免浮点除法和舍入误差"""
+        h = abs(w) * self.target_height // self.target_width
+        return h if w >= 0 else -h
+
     def _bound_cropbox(self):
         """限制裁剪框在旋转后视频范围内"""
         rotated_w, rotated_h = self._get_rotated_video_size()
@@ -283,22 +441,28 @@ class VideoPreviewWidget(QWidget):
 
         if w > rotated_w:
             w = rotated_w
-            h = int(w / self.target_aspect_ratio)
+            h = self._height_for_width(w)
         if h > rotated_h:
             h = rotated_h
-            w = int(h * self.target_aspect_ratio)
+            w = h * self.target_width // self.target_height
 
         # 最小尺寸
         w = max(w, 90)
-        h = max(h, int(90 / self.target_aspect_ratio))
+        h = max(h, self._min_crop_height)
 
         # 边界限制
         x = max(0, min(x, rotated_w - w))
         y = max(0, min(y, rotated_h - h))
-        self.cropbox = [x, y, w, h]
+        self.cropbox = (x, y, w, h)
 
     def _emit_cropbox_changed(self):
-        """发送裁剪框变更信号"""
+        """请求发送裁剪框变更信号；连续变化合并为每 CROPBOX_EMIT_MS 最多一次，发送最新的裁剪框"""
+        if not self._cropbox_emit_timer.isActive():
+            self._cropbox_emit_timer.start()
+
+    def _flush_cropbox_changed(self):
+        """立即发送裁剪框变更信号"""
+        self._cropbox_emit_timer.stop()
         x, y, w, h = self.cropbox
         self.cropbox_changed.emit(x, y, w, h)
         self._update_info_label()
@@ -319,64 +483,85 @@ class VideoPreviewWidget(QWidget):
             return
 
         ret, frame = self.cap.read()
-        if not ret:
+        if ret and self._read_index >= 0:
+            self._read_index += 1
+        elif not ret:
+            self._read_index = -1
+        self._show_decoded_frame(frame if ret else None)
+
+    def _set_read_position(self, index: int):
+        """把读取位置定位到 index；已在该位置时跳过 cap.set
+
+        对 H.264/HEVC 等编码，cap.set 会回到最近的关键帧重新解码，远比顺序 read 昂贵。
+        """
+        if index != self._read_index:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+            self._read_index = index
+
+    def _cache_frame(self, index: int, frame):
+        """放入最近帧缓存，超出 FRAME_CACHE_BYTES 时淘汰最久未用的帧"""
+        old = self._frame_cache.pop(index, None)
+        if old is not None:
+            self._frame_cache_bytes -= old.nbytes
+        self._frame_cache[index] = frame
+        self._frame_cache_bytes += frame.nbytes
+        while self._frame_cache_bytes > FRAME_CACHE_BYTES and len(self._frame_cache) > 1:
+            _, evicted = self._frame_cache.popitem(last=False)
+            self._frame_cache_bytes -= evicted.nbytes
+
+    def _clear_frame_cache(self):
+        """清空最近帧缓存（切换视频或图片时）"""
+        self._frame_cache.clear()
+        self._frame_cache_bytes = 0
+
+    def _show_frame_at(self, index: int):
+        """显示指定帧：命中最近帧缓存时直接显示，否则定位并解码"""
+        self.current_frame_index = index
+        frame = self._frame_cache.get(index)
+        if frame is not None:
+            self._show_decoded_frame(frame)
+            return
+        self._set_read_position(index)
+        self._read_and_display_frame()
+
+    def _show_decoded_frame(self, frame):
+        """显示已解码的当前帧（None 表示读取失败）"""
+        if frame is None:
             logger.warning(f"无法读取帧 {self.current_frame_index}")
             self.pause()
             return
 
         self.current_frame = frame
-        logger.debug(f"读取帧 {self.current_frame_index}, 尺寸: {frame.shape}")
+        self._cache_frame(self.current_frame_index, frame)
+        logger.debug("读取帧 %s, 尺寸: %s", self.current_frame_index, frame.shape)
         self._display_frame(frame)
         self.frame_changed.emit(self.current_frame_index)
         self._update_info_label()
 
-    def _display_frame(self, frame):
-        """显示帧"""
+    def _display_frame(
+        self,
+        frame,
+        mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation
+    ):
+        """显示帧（mode 为缩放到标签大小时使用的插值方式）"""
         if frame is None or not HAS_CV2:
             return
 
         # 应用旋转
         rotated_frame = self._apply_rotation(frame)
 
-        x, y, w, h = self.cropbox
+        self._overlay_visible = not self._preview_mode
+        self._overlay_transform = (1.0, 0.0, 0.0)
 
         if self._preview_mode:
             # 预览模式：显示裁剪后的最终效果
             display_frame = self._render_preview_frame(rotated_frame)
         else:
-            # 编辑模式：显示完整帧+裁剪框
-            display_frame = rotated_frame.copy()
-
-            # cropbox 已经在旋转后坐标系中，直接使用
-            cv2.rectangle(display_frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-
-            # 绘制角落手柄
-            hs = 8
-            handle_color = (0, 200, 255)
-            for px, py in [(x, y), (x + w, y), (x, y + h), (x + w, y + h)]:
-                cv2.rectangle(
-                    display_frame,
-                    (px - hs, py - hs), (px + hs, py + hs),
-                    handle_color, -1
-                )
-
-            # 信息叠加
-            cv2.putText(
-                display_frame,
-                f"Frame: {self.current_frame_index}/{self.total_frames}",
-                (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1
-            )
-            cv2.putText(
-                display_frame,
-                f"Crop: x={x} y={y} w={w} h={h}",
-                (10, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1
-            )
+            # 编辑模式：显示完整帧，裁剪框由 _render_overlay 在缩放后的画面上绘制
+            display_frame = rotated_frame
 
         # 如果是静态图片（total_frames == 1），创建黑色背景并将图片居中显示
         if self.total_frames == 1 and not self._preview_mode:
-            # 创建黑色背景（目标尺寸）
-            black_bg = np.zeros((self.target_height, self.target_width, 3), dtype=np.uint8)
-
             # 计算缩放后的图片尺寸和位置
             frame_h, frame_w = display_frame.shape[:2]
             scale_w = self.target_width / frame_w
@@ -388,50 +573,183 @@ class VideoPreviewWidget(QWidget):
 
             # 缩放图片
             if scale != 1.0:
-                display_frame = cv2.resize(display_frame, (scaled_w, scaled_h))
+                interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+                display_frame = cv2.resize(
+                    display_frame, (scaled_w, scaled_h), interpolation=interpolation
+                )
 
             # 计算居中位置
             offset_x = (self.target_width - scaled_w) // 2
             offset_y = (self.target_height - scaled_h) // 2
 
             # 将缩放后的图片放置在黑色背景上
+            black_bg = self._letterbox_canvas_for((offset_x, offset_y, scaled_w, scaled_h))
             black_bg[offset_y:offset_y+scaled_h, offset_x:offset_x+scaled_w] = display_frame
             display_frame = black_bg
+            self._overlay_transform = (scale, float(offset_x), float(offset_y))
 
-        # 转换为QPixmap
-        rgb_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-        h_frame, w_frame, ch = rgb_frame.shape
+        # 转换为QPixmap：QImage 直接读取 OpenCV 的 BGR 数据，省去整帧 BGR→RGB 转换
+        # （按实际行跨度构造；fromImage 会立即复制像素，display_frame 只需在此期间存活）
+        display_frame = np.ascontiguousarray(display_frame)
+        h_frame, w_frame = display_frame.shape[:2]
         q_image = QImage(
-            rgb_frame.data, w_frame, h_frame,
-            ch * w_frame, QImage.Format.Format_RGB888
+            display_frame.data, w_frame, h_frame,
+            display_frame.strides[0], QImage.Format.Format_BGR888
         )
 
+        # 保存未缩放的渲染结果，窗口大小变化时只需重新缩放它
+        # NoFormatConversion：像素保持 BGR888 原样复制进像素图，不再额外转换为 32 位格式
+        self._source_pixmap = QPixmap.fromImage(q_image, Qt.ImageConversionFlag.NoFormatConversion)
+        self._scaled_size = None
+        self._present_pixmap(mode)
+
+    def show_pixmap(self, pixmap: QPixmap):
+        """显示外部生成的未缩放画面（如循环图片），窗口大小变化时同样只重新缩放"""
+        self._source_pixmap = pixmap
+        self._scaled_size = None
+        self._overlay_visible = False
+        self._present_pixmap()
+
+    def _refresh_cropbox(self):
+        """裁剪框变化后刷新显示：编辑模式只重绘叠加层，预览模式的画面依赖裁剪结果需整帧重新渲染"""
+        if self.current_frame is None:
+            return
+        if self._preview_mode:
+            # 拖动/按键过程中先用最近邻快速缩放，停止操作后由定时器换成平滑缩放的结果
+            self._display_frame(self.current_frame, Qt.TransformationMode.FastTransformation)
+            self._rescale_timer.start(RESCALE_DELAY_MS)
+        else:
+            self._render_overlay()
+
+    def _render_overlay(self):
+        """在已缩放的画面上绘制裁剪框、角落手柄和信息文字
+
+        绘制在显示分辨率下进行，开销与视频分辨率无关；底图只在换帧或标签尺寸变化时重新生成。
+        """
+        pixmap = self._scaled_pixmap
+        if pixmap is None:
+            return
+        if not self._overlay_visible or self._source_pixmap is None:
+            self.video_label.setPixmap(pixmap)
+            return
+
+        # 旋转后视频坐标 -> 缩放后画面的逻辑坐标
+        base_scale, base_x, base_y = self._overlay_transform
+        k = pixmap.width() / pixmap.devicePixelRatio() / max(1, self._source_pixmap.width())
+        scale = base_scale * k
+        origin_x = base_x * k
+        origin_y = base_y * k
+
+        x, y, w, h = self.cropbox
+        left = origin_x + x * scale
+        top = origin_y + y * scale
+        right = origin_x + (x + w) * scale
+        bottom = origin_y + (y + h) * scale
+
+        canvas = QPixmap(pixmap)
+        painter = QPainter(canvas)
+        painter.setPen(self._crop_pen)
+        painter.drawRect(QRectF(left, top, right - left, bottom - top))
+
+        # 绘制角落手柄（与原先源分辨率下 8 像素的手柄保持相同比例）
+        hs = max(3.0, 8 * scale)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._handle_color)
+        for px, py in ((left, top), (right, top), (left, bottom), (right, bottom)):
+            painter.drawRect(QRectF(px - hs, py - hs, hs * 2, hs * 2))
+
+        # 信息叠加
+        painter.setPen(self._info_pen)
+        self._draw_info_text(painter, self._frame_info_text, 6,
+                             f"Frame: {self.current_frame_index}/{self.total_frames}")
+        self._draw_info_text(painter, self._crop_info_text, 26,
+                             f"Crop: x={x} y={y} w={w} h={h}")
+        painter.end()
+
+        self.video_label.setPixmap(canvas)
+
+    def show_path_message(self, message: str, path: str):
+        """在预览区显示带文件路径的提示，过长的路径从中间省略
+
+        完整路径已写入日志；标签只排版可见宽度内的文字，
+        长路径也不会撑大标签的尺寸提示、引起布局重算。
+        """
+        metrics = self.video_label.fontMetrics()
+        available = self.video_label.width() - metrics.horizontalAdvance(message) - 20
+        elided = metrics.elidedText(path, Qt.TextElideMode.ElideMiddle, max(available, 80))
+        self.video_label.setText(f"{message}{elided}")
+
+    def _letterbox_canvas_for(self, rect: Tuple[int, int, int, int]) -> np.ndarray:
+        """返回可复用的黑色背景画布（目标尺寸）
+
+        静态图片反复重绘（如拖动裁剪框）时不再每次分配新数组；
+        图片区域不变时边框保持为零，只需由调用方覆盖图片区域。
+        """
+        shape = (self.target_height, self.target_width, 3)
+        canvas = self._letterbox_canvas
+        if canvas is None or canvas.shape != shape:
+            canvas = self._letterbox_canvas = np.zeros(shape, dtype=np.uint8)
+        elif rect != self._letterbox_rect:
+            canvas.fill(0)
+        self._letterbox_rect = rect
+        return canvas
+
+    @staticmethod
+    def _draw_info_text(painter: QPainter, static_text: QStaticText, top: int, text: str):
+        """绘制一行信息文字，文字变化时才重新排版"""
+        if static_text.text() != text:
+            static_text.setText(text)
+        painter.drawStaticText(QPointF(10, top), static_text)
+
+    def _present_pixmap(
+        self,
+        mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation
+    ):
+        """把渲染结果缩放到标签大小并显示（含裁剪框）；尺寸和缩放方式都未变化时直接跳过"""
+        if self._source_pixmap is None:
+            return
+
         label_size = self.video_label.size()
-        pixmap = QPixmap.fromImage(q_image).scaled(
-            label_size,
+        # HiDPI 屏幕上直接缩放到物理像素，避免 Qt 再按设备像素比放大一次
+        dpr = self.video_label.devicePixelRatioF()
+        if (label_size, mode, dpr) == self._scaled_size:
+            return
+        self._scaled_size = (label_size, mode, dpr)
+
+        pixmap = self._source_pixmap.scaled(
+            label_size * dpr,
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+            mode
         )
+        pixmap.setDevicePixelRatio(dpr)
 
-        # 更新显示参数（仅编辑模式需要用于坐标转换）
+        # 更新显示参数（仅编辑模式需要用于坐标转换，均为逻辑像素）
         if not self._preview_mode:
             # 使用旋转后的帧宽度计算缩放比例
             rotated_width = self.video_height if self._rotation in (90, 270) else self.video_width
-            self.display_scale = pixmap.width() / rotated_width if rotated_width > 0 else 1.0
-            self.display_offset_x = (label_size.width() - pixmap.width()) // 2
-            self.display_offset_y = (label_size.height() - pixmap.height()) // 2
+            logical_width = pixmap.width() / dpr
+            logical_height = pixmap.height() / dpr
+            self.display_scale = logical_width / rotated_width if rotated_width > 0 else 1.0
+            self.display_offset_x = int(label_size.width() - logical_width) // 2
+            self.display_offset_y = int(label_size.height() - logical_height) // 2
 
-        self.video_label.setPixmap(pixmap)
+        self._scaled_pixmap = pixmap
+        self._render_overlay()
 
     def _render_preview_frame(self, frame) -> np.ndarray:
         """渲染预览帧（裁剪+叠加UI）"""
         x, y, w, h = self.cropbox
 
-        # 裁剪
-        cropped = frame[y:y+h, x:x+w].copy()
+        # 裁剪（cv2.resize 直接读取视图并输出新数组，无需先复制）
+        cropped = frame[y:y+h, x:x+w]
 
         # 缩放到目标分辨率
-        preview_frame = cv2.resize(cropped, (self.target_width, self.target_height))
+        # 缩小时用 INTER_AREA，更快且不产生摩尔纹
+        interpolation = cv2.INTER_AREA if w > self.target_width else cv2.INTER_LINEAR
+        preview_frame = cv2.resize(
+            cropped, (self.target_width, self.target_height),
+            interpolation=interpolation
+        )
 
         # 应用叠加UI
         if self._epconfig and self._overlay_renderer:
@@ -445,19 +763,41 @@ class VideoPreviewWidget(QWidget):
         return preview_frame
 
     def _on_timer_tick(self):
-        """定时器回调"""
-        if self.cap is None:
+        """定时器回调：从后台解码缓冲区取下一帧，尚未解码好时跳过本次"""
+        if self._producer is None:
             return
-        self.current_frame_index += 1
-        if self.current_frame_index >= self.total_frames:
-            self.current_frame_index = 0
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-        self._read_and_display_frame()
+        try:
+            index, frame = self._producer.frames.get_nowait()
+        except queue.Empty:
+            return
+        self.current_frame_index = index
+        self._show_decoded_frame(frame)
+
+    def _start_producer(self):
+        """从当前帧的下一帧开始后台解码"""
+        # 当前帧可能来自最近帧缓存，读取位置未随之移动，需先定位到其下一帧
+        self._set_read_position(self.current_frame_index + 1)
+        self._producer = FrameProducer(self.cap, self.current_frame_index + 1, self.total_frames)
+        self._producer.start()
+
+    def _stop_producer(self) -> bool:
+        """停止后台解码，并把读取位置恢复到当前显示帧之后；返回之前是否在解码"""
+        producer = self._producer
+        if producer is None:
+            return False
+        self._producer = None
+        producer.stop()
+        # 解码线程可能已预读若干帧，读取位置未知，需重新定位
+        self._read_index = -1
+        if self.cap is not None:
+            self._set_read_position(self.current_frame_index + 1)
+        return True
 
     def play(self):
         """播放"""
         if self.cap is None or self.is_playing:
             return
+        self._start_producer()
         # 使用 round() 减少截断误差
         interval = round(1000 / self.video_fps)
         self.timer.start(interval)
@@ -467,6 +807,7 @@ class VideoPreviewWidget(QWidget):
     def pause(self):
         """暂停"""
         self.timer.stop()
+        self._stop_producer()
         self.is_playing = False
         self.playback_state_changed.emit(False)
 
@@ -482,27 +823,46 @@ class VideoPreviewWidget(QWidget):
         if self.cap is None:
             return
         self.pause()
-        self.current_frame_index = min(self.current_frame_index + 1, self.total_frames - 1)
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame_index)
-        self._read_and_display_frame()
+        self._show_frame_at(min(self.current_frame_index + 1, self.total_frames - 1))
 
     def prev_frame(self):
         """上一帧"""
         if self.cap is None:
             return
         self.pause()
-        self.current_frame_index = max(self.current_frame_index - 1, 0)
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame_index)
-        self._read_and_display_frame()
+        self._show_frame_at(max(self.current_frame_index - 1, 0))
+
+    def step_frame(self, delta: int):
+        """前进/后退 delta 帧，只解码并显示目标帧一次"""
+        if self.cap is None:
+            return
+        self.pause()
+        target = max(0, min(self.current_frame_index + delta, self.total_frames - 1))
+        step = target - self.current_frame_index
+        if step == 0:
+            return
+        if target in self._frame_cache:
+            self._show_frame_at(target)
+        elif 0 < step <= FRAME_GRAB_STEP_LIMIT and self._read_index == self.current_frame_index + 1:
+            # 读取位置紧跟当前显示帧，跳过中间帧后读取目标帧即可
+            for _ in range(step - 1):
+                self.cap.grab()
+            self._read_index = target
+            self.current_frame_index = target
+            self._read_and_display_frame()
+        else:
+            self.seek_to_frame(target)
 
     def seek_to_frame(self, index: int):
         """跳转到指定帧"""
         if self.cap is None:
             return
         index = max(0, min(index, self.total_frames - 1))
-        self.current_frame_index = index
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
-        self._read_and_display_frame()
+        # 播放中跳转：先停止后台解码，跳转后从新位置继续解码
+        resume = self._stop_producer()
+        self._show_frame_at(index)
+        if resume and self.is_playing:
+            self._start_producer()
 
     def get_current_frame(self) -> int:
         """获取当前帧号"""
@@ -510,7 +870,7 @@ class VideoPreviewWidget(QWidget):
 
     def get_cropbox(self) -> Tuple[int, int, int, int]:
         """获取裁剪框（旋转后坐标系）"""
-        return tuple(self.cropbox)
+        return self.cropbox
 
     def _cropbox_to_original_coords(self, x: int, y: int, w: int, h: int) -> Tuple[int, int, int, int]:
         """将 cropbox 从旋转后坐标系逆变换到原始视频坐标系（用于导出）"""
@@ -532,18 +892,19 @@ class VideoPreviewWidget(QWidget):
 
     def set_cropbox(self, x: int, y: int, w: int, h: int):
         """设置裁剪框"""
-        self.cropbox = [x, y, w, h]
+        self.cropbox = (x, y, w, h)
         self._bound_cropbox()
         self._emit_cropbox_changed()
-        if self.current_frame is not None:
-            self._display_frame(self.current_frame)
+        self._refresh_cropbox()
 
     def get_video_info(self) -> Tuple[float, int, int, int]:
         """获取视频信息 (fps, total_frames, width, height)"""
         return (self.video_fps, self.total_frames, self.video_width, self.video_height)
 
     def set_preview_mode(self, enabled: bool):
-        """设置预览模式"""
+        """设置预览模式（模式未变化时不重新渲染）"""
+        if self._preview_mode == enabled:
+            return
         self._preview_mode = enabled
         if self.current_frame is not None:
             self._display_frame(self.current_frame)
@@ -582,16 +943,22 @@ class VideoPreviewWidget(QWidget):
         self.set_rotation(new_rotation)
 
     def _apply_rotation(self, frame: np.ndarray) -> np.ndarray:
-        """应用旋转到帧"""
+        """应用旋转到帧（同一帧、同一角度复用上次的结果）"""
         if self._rotation == 0:
             return frame
-        elif self._rotation == 90:
-            return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+        cached = self._rotated_cache
+        if cached is not None and cached[0] is frame and cached[1] == self._rotation:
+            return cached[2]
+        if self._rotation == 90:
+            rotated = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
         elif self._rotation == 180:
-            return cv2.rotate(frame, cv2.ROTATE_180)
+            rotated = cv2.rotate(frame, cv2.ROTATE_180)
         elif self._rotation == 270:
-            return cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        return frame
+            rotated = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        else:
+            return frame
+        self._rotated_cache = (frame, self._rotation, rotated)
+        return rotated
 
     def _get_rotated_video_size(self) -> Tuple[int, int]:
         """获取旋转后的视频尺寸"""
@@ -621,6 +988,9 @@ class VideoPreviewWidget(QWidget):
         x, y, w, h = self.cropbox
         hs = self.handle_size
 
+        # 远离裁剪框（含手柄范围）时直接返回，悬停移动时大多走这里
+        if vx <= x - hs or vx >= x + w + hs or vy <= y - hs or vy >= y + h + hs:
+            return self.DRAG_NONE
         if abs(vx - x) < hs and abs(vy - y) < hs:
             return self.DRAG_RESIZE_TL
         if abs(vx - (x + w)) < hs and abs(vy - y) < hs:
@@ -640,7 +1010,7 @@ class VideoPreviewWidget(QWidget):
             self.drag_mode = self._get_drag_mode(rx, ry)
             if self.drag_mode != self.DRAG_NONE:
                 self.drag_start_pos = event.pos()
-                self.drag_start_cropbox = self.cropbox.copy()
+                self.drag_start_cropbox = self.cropbox
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
@@ -652,39 +1022,33 @@ class VideoPreviewWidget(QWidget):
             sx, sy, sw, sh = self.drag_start_cropbox
 
             if self.drag_mode == self.DRAG_MOVE:
-                self.cropbox = [sx + dx, sy + dy, sw, sh]
+                self.cropbox = (sx + dx, sy + dy, sw, sh)
             elif self.drag_mode == self.DRAG_RESIZE_BR:
                 new_w = sw + dx
-                self.cropbox = [sx, sy, new_w, int(new_w / self.target_aspect_ratio)]
+                self.cropbox = (sx, sy, new_w, self._height_for_width(new_w))
             elif self.drag_mode == self.DRAG_RESIZE_TL:
                 new_w = sw - dx
-                new_h = int(new_w / self.target_aspect_ratio)
-                self.cropbox = [sx + (sw - new_w), sy + (sh - new_h), new_w, new_h]
+                new_h = self._height_for_width(new_w)
+                self.cropbox = (sx + (sw - new_w), sy + (sh - new_h), new_w, new_h)
             elif self.drag_mode == self.DRAG_RESIZE_TR:
                 new_w = sw + dx
-                new_h = int(new_w / self.target_aspect_ratio)
-                self.cropbox = [sx, sy + (sh - new_h), new_w, new_h]
+                new_h = self._height_for_width(new_w)
+                self.cropbox = (sx, sy + (sh - new_h), new_w, new_h)
             elif self.drag_mode == self.DRAG_RESIZE_BL:
                 new_w = sw - dx
-                new_h = int(new_w / self.target_aspect_ratio)
-                self.cropbox = [sx + (sw - new_w), sy, new_w, new_h]
+                new_h = self._height_for_width(new_w)
+                self.cropbox = (sx + (sw - new_w), sy, new_w, new_h)
 
             self._bound_cropbox()
             self._emit_cropbox_changed()
-            if self.current_frame is not None:
-                self._display_frame(self.current_frame)
+            self._refresh_cropbox()
 
         elif self.current_frame is not None:
             rx, ry = self._display_to_rotated_coords(event.pos())
             mode = self._get_drag_mode(rx, ry)
-            cursors = {
-                self.DRAG_RESIZE_TL: Qt.CursorShape.SizeFDiagCursor,
-                self.DRAG_RESIZE_BR: Qt.CursorShape.SizeFDiagCursor,
-                self.DRAG_RESIZE_TR: Qt.CursorShape.SizeBDiagCursor,
-                self.DRAG_RESIZE_BL: Qt.CursorShape.SizeBDiagCursor,
-                self.DRAG_MOVE: Qt.CursorShape.SizeAllCursor,
-            }
-            self.setCursor(cursors.get(mode, Qt.CursorShape.ArrowCursor))
+            if mode != self._hover_mode:
+                self._hover_mode = mode
+                self.setCursor(self._DRAG_CURSORS.get(mode, Qt.CursorShape.ArrowCursor))
 
         super().mouseMoveEvent(event)
 
@@ -693,6 +1057,9 @@ class VideoPreviewWidget(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             self.drag_mode = self.DRAG_NONE
             self.drag_start_pos = None
+            # 松开鼠标时立即发送最终的裁剪框
+            if self._cropbox_emit_timer.isActive():
+                self._flush_cropbox_changed()
         super().mouseReleaseEvent(event)
 
     def keyPressEvent(self, event: QKeyEvent):
@@ -702,38 +1069,53 @@ class VideoPreviewWidget(QWidget):
             return
 
         key = event.key()
-        step = 10
 
         # 播放/帧跳转操作需要视频
         if key == Qt.Key.Key_Space and self.cap is not None:
             self.toggle_play()
-        elif key == Qt.Key.Key_Left and self.cap is not None:
-            self.prev_frame()
-        elif key == Qt.Key.Key_Right and self.cap is not None:
-            self.next_frame()
+            return
+        if key == Qt.Key.Key_Left and self.cap is not None:
+            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                self.step_frame(-FRAME_STEP_LARGE)
+            else:
+                self.prev_frame()
+            return
+        if key == Qt.Key.Key_Right and self.cap is not None:
+            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                self.step_frame(FRAME_STEP_LARGE)
+            else:
+                self.next_frame()
+            return
+
         # WASD 裁剪框移动（视频和静态图片都支持）
-        elif key == Qt.Key.Key_W:
-            self.cropbox[1] -= step
-        elif key == Qt.Key.Key_S:
-            self.cropbox[1] += step
-        elif key == Qt.Key.Key_A:
-            self.cropbox[0] -= step
-        elif key == Qt.Key.Key_D:
-            self.cropbox[0] += step
-        else:
+        step = self._KEY_STEPS.get(key)
+        if step is None:
             super().keyPressEvent(event)
             return
-
+        # 按住按键时自动重复很快，位移先累积，每 KEY_STEP_COALESCE_MS 最多应用并重绘一次
+        dx, dy = self._pending_key_delta
+        self._pending_key_delta = (dx + step[0], dy + step[1])
+        if not self._key_step_timer.isActive():
+            self._key_step_timer.start()
+
+    def _apply_key_delta(self):
+        """应用累积的 WASD 位移"""
+        dx, dy = self._pending_key_delta
+        self._pending_key_delta = (0, 0)
+        if self.current_frame is None or (dx == 0 and dy == 0):
+            return
+        x, y, w, h = self.cropbox
+        self.cropbox = (x + dx, y + dy, w, h)
         self._bound_cropbox()
         self._emit_cropbox_changed()
-        if self.current_frame is not None:
-            self._display_frame(self.current_frame)
+        self._refresh_cropbox()
 
     def resizeEvent(self, event):
-        """窗口大小变化时重绘当前帧"""
+        """窗口大小变化时立即快速缩放当前帧，停止变化后再平滑重绘"""
         super().resizeEvent(event)
-        if self.current_frame is not None:
-            self._display_frame(self.current_frame)
+        if self._source_pixmap is not None:
+            self._present_pixmap(Qt.TransformationMode.FastTransformation)
+            self._rescale_timer.start(RESCALE_DELAY_MS)
 
     def closeEvent(self, event):
         """关闭事件"""
@@ -745,13 +1127,20 @@ class VideoPreviewWidget(QWidget):
     def clear(self):
         """清空预览状态"""
         self.pause()
+        self._key_step_timer.stop()
+        self._pending_key_delta = (0, 0)
         if self.cap is not None:
             self.cap.release()
             self.cap = None
+        self._clear_frame_cache()
         self.video_path = ""
         self.total_frames = 0
         self.current_frame_index = 0
         self.current_frame = None
+        self._source_pixmap = None
+        self._scaled_size = None
+        self._scaled_pixmap = None
+        self._rotated_cache = None
         self.video_label.clear()
         self.video_label.setText("未加载视频")
         self.info_label.setText("帧: 0/0 | 裁剪: (0, 0, 0, 0)")
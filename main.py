@@ -25,6 +25,15 @@ sys.path.insert(0, APP_DIR)
 os.environ["QT_API"] = "pyqt6"
 
 
+def _module_available(name: str) -> bool:
+    """只查找模块是否存在而不执行导入"""
+    from importlib.util import find_spec
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def check_dependencies():
     """检查必要的依赖是否已安装"""
     missing = []
@@ -34,9 +43,9 @@ def check_dependencies():
     except ImportError:
         missing.append("PyQt6")
 
-    try:
-        from PyQt6.QtWebEngineWidgets import QWebEngineView
-    except ImportError:
+    # QtWebEngine（项目介绍页）和 Pillow 只在首次使用时才导入，
+    # 这里仅确认存在，不在启动时加载 Chromium 运行库
+    if not _module_available("PyQt6.QtWebEngineWidgets"):
         missing.append("PyQt6-WebEngine")
 
     try:
@@ -49,9 +58,7 @@ def check_dependencies():
     except ImportError:
         missing.append("opencv-python")
 
-    try:
-        from PIL import Image
-    except ImportError:
+    if not _module_available("PIL"):
         missing.append("Pillow")
 
     try:
@@ -77,7 +84,7 @@ def main():
     os.environ["QFluentWidgets_SUPPRESS_TIPS"] = "1"
 
     # 初始化日志系统
-    from utils.logger import setup_logger, cleanup_old_logs
+    from utils.logger import setup_logger, cleanup_old_logs, shutdown_logging
     setup_logger()
     cleanup_old_logs(days=30)
 
@@ -125,6 +132,7 @@ def main():
     # 运行应用程序
     exit_code = app.exec()
     logger.info(f"应用程序退出，退出码: {exit_code}")
+    shutdown_logging()
     sys.exit(exit_code)
 
 
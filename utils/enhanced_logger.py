@@ -9,6 +9,11 @@ from typing import List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+# 日志行格式 "时间 - 名称 - 级别 - 消息"，模块导入时编译一次，搜索和统计共用
+_LOG_LINE_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - (\S+) - (\w+) - (.+)')
+_LOG_LEVEL_RE = re.compile(r' - (\w+) - ')
+_LOG_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
 class EnhancedLogger:
     """增强的日志管理器"""
@@ -31,14 +36,20 @@ class EnhancedLogger:
         self._setup_handlers()
 
     def _setup_handlers(self):
-        """设置日志处理器"""
+        """设置日志处理器（同一记录器只安装一次）"""
+        # 重复创建管理器时不再叠加处理器，否则每条记录会被逐个处理器重复格式化和写入
+        if self.logger.handlers:
+            return
+        # 自身已写入同一日志文件和控制台，不再传播到根记录器，避免每条记录被处理两遍
+        self.logger.propagate = False
 
         # 文件处理器（带轮转）
         file_handler = RotatingFileHandler(
             self.log_file,
             maxBytes=self.max_size,
             backupCount=self.backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True
         )
         file_handler.setLevel(logging.DEBUG)
 
@@ -96,13 +107,14 @@ class EnhancedLogger:
             return results
 
         try:
+            # 时间范围只解析一次，不在逐行循环中重复解析
+            start_dt = datetime.strptime(start_time, _LOG_TIME_FORMAT) if start_time else None
+            end_dt = datetime.strptime(end_time, _LOG_TIME_FORMAT) if end_time else None
+
             with open(self.log_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     # 解析日志行
-                    match = re.match(
-                        r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - (\S+) - (\w+) - (.+)',
-                        line.strip()
-                    )
+                    match = _LOG_LINE_RE.match(line.strip())
 
                     if not match:
                         continue
@@ -118,18 +130,14 @@ class EnhancedLogger:
                         continue
 
                     # 时间范围过滤
-                    if start_time or end_time:
-                        log_time = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
+                    if start_dt or end_dt:
+                        log_time = datetime.strptime(timestamp, _LOG_TIME_FORMAT)
 
-                        if start_time:
-                            start_dt = datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S')
-                            if log_time < start_dt:
-                                continue
+                        if start_dt and log_time < start_dt:
+                            continue
 
-                        if end_time:
-                            end_dt = datetime.strptime(end_time, '%Y-%m-%d %H:%M:%S')
-                            if log_time > end_dt:
-                                continue
+                        if end_dt and log_time > end_dt:
+                            continue
 
                     results.append((timestamp, name, log_level, message))
 
@@ -206,7 +214,7 @@ class EnhancedLogger:
                         stats['total_lines'] += 1
 
                         # 统计各级别数量
-                        match = re.search(r' - (\w+) - ', line)
+                        match = _LOG_LEVEL_RE.search(line)
                         if match:
                             level = match.group(1)
                             if level in stats['by_level']:
@@ -1,12 +1,20 @@
 """
 文件操作工具函数
 """
+import functools
 import os
 import sys
 from typing import Optional, Tuple
 
+from PyQt6.QtWidgets import QFileDialog
+
 from config.constants import SUPPORTED_VIDEO_FORMATS, SUPPORTED_IMAGE_FORMATS
 
+# 文件对话框选项：不解析符号链接、不读取自定义目录图标，大目录或网络盘上避免逐个文件的 stat 和图标查询
+FILE_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.DontUseCustomDirectoryIcons
+)
+
 
 def get_relative_path(base_dir: str, file_path: str) -> str:
     """
@@ -189,9 +197,10 @@ def get_all_files_filter() -> str:
     return "所有文件 (*.*)"
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> str:
     """
-    获取应用程序所在目录（支持 Nuitka/PyInstaller 打包）
+    获取应用程序所在目录（支持 Nuitka/PyInstaller 打包），结果在进程内缓存
 
     Returns:
         应用程序所在目录的绝对路径
@@ -2,15 +2,20 @@
 日志系统配置
 """
 import os
+import atexit
+import queue
 import logging
 import tempfile
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from typing import Optional
 
 # 导入增强的日志管理器
 from utils.enhanced_logger import EnhancedLogger, get_logger as get_enhanced_logger
 
+# 后台写日志的队列监听器，由 setup_logger 创建
+_queue_listener: Optional[QueueListener] = None
+
 
 def setup_logger(log_dir: Optional[str] = None) -> logging.Logger:
     """
@@ -75,7 +80,8 @@ def setup_logger(log_dir: Optional[str] = None) -> logging.Logger:
             log_file,
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=5,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # 首条日志写入时才打开文件
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
@@ -88,13 +94,22 @@ def setup_logger(log_dir: Optional[str] = None) -> logging.Logger:
     console_handler.setFormatter(console_formatter)
 
     # 配置根日志记录器
+    # 调用方线程只把记录放入队列，格式化和磁盘写入由监听器线程完成，
+    # 导出等热路径上的日志调用不再同步等待文件 I/O
+    global _queue_listener
+    shutdown_logging()
+
+    handlers = [file_handler, console_handler] if file_handler else [console_handler]
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    # 异常退出时也要写出队列中剩余的日志
+    atexit.register(shutdown_logging)
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
     root_logger.handlers.clear()
-
-    if file_handler:
-        root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     # 记录启动信息
     if file_handler:
@@ -117,6 +132,14 @@ def setup_logger(log_dir: Optional[str] = None) -> logging.Logger:
     return root_logger
 
 
+def shutdown_logging():
+    """停止日志监听器线程，写出队列中剩余的日志（应用退出时调用）"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def cleanup_old_logs(log_dir: Optional[str] = None, days: int = 30):
     """
     清理超过指定天数的旧日志文件